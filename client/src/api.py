@@ -4,6 +4,7 @@ API module for communicating with the federated learning coordinator.
 Handles all HTTP communication with the coordinator server.
 """
 
+import threading
 import time
 import requests
 from typing import Dict, Optional, Any
@@ -23,6 +24,22 @@ class CoordinatorConnectionError(Exception):
     pass
 
 
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """
+    Per-thread session, so repeated calls reuse a keep-alive connection.
+
+    Training runs fetch tasks, models and submit updates against the same
+    coordinator; pooling avoids a new TCP (and TLS) handshake per request.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
 def _make_request(
     method: str,
     url: str,
@@ -59,7 +76,7 @@ def _make_request(
     
     for attempt in range(max_retries + 1):
         try:
-            response = requests.request(method, url, **kwargs)
+            response = _session().request(method, url, **kwargs)
             
             # Check for HTTP errors
             if response.status_code >= 400:
@@ -8,7 +8,7 @@ Logs are both human-readable and machine-parseable.
 import json
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Optional, Dict, Any
 
 
@@ -18,6 +18,20 @@ class JSONFormatter(logging.Formatter):
     
     Ensures all logs are structured and parseable.
     """
+
+    def __init__(self):
+        super().__init__()
+        # (whole second, "YYYY-MM-DDTHH:MM:SS") for the most recent record
+        self._second = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC time of the record, formatting the date part once per second."""
+        second = int(created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -30,7 +44,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "component": getattr(record, "component", "client"),
             "module": record.module,
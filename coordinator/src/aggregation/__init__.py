@@ -4,7 +4,8 @@ Aggregation Module
 LoRA adapter FedAvg (ΔW+SVD), classic FL strategies, manifests, isolated merge.
 """
 
-from .fedavg_adapters import aggregate_lora_adapters, validate_adapter
+from importlib import import_module
+
 from .strategies import (
     AdaptiveFedAvgStrategy,
     AggregationStrategy,
@@ -16,7 +17,24 @@ from .strategies import (
     list_strategies,
 )
 from .adapter_manifest import AdapterManifest, build_adapter_manifest, register_adapter_manifest
-from .merge import isolated_merge_state_dicts, merge_delta_into_weight
+
+# The LoRA helpers need torch, which dominates coordinator start-up; load them
+# on first use so classic-FL imports (strategies) stay light.
+_LAZY_ATTRS = {
+    "aggregate_lora_adapters": ".fedavg_adapters",
+    "validate_adapter": ".fedavg_adapters",
+    "isolated_merge_state_dicts": ".merge",
+    "merge_delta_into_weight": ".merge",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "aggregate_lora_adapters",
@@ -10,10 +10,12 @@ import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Protocol, runtime_checkable
 
+import numpy as np
+
 
 @dataclass
 class ClientContribution:
-    """One client's parsed update for strategy input."""
+    """One client's parsed update for strategy input (layers: lists or 1-D arrays)."""
 
     client_id: str
     weight_delta: List[List[float]]
@@ -50,6 +52,11 @@ def _require_consistent_shapes(deltas: List[List[List[float]]]) -> None:
                 raise ValueError(f"Inconsistent layer {layer_idx} sizes across clients")
 
 
+def _stack_layer(deltas: List[List[List[float]]], layer_idx: int) -> np.ndarray:
+    """One layer from every client as a float64 array of shape (clients, params)."""
+    return np.array([d[layer_idx] for d in deltas], dtype=np.float64)
+
+
 class FedAvgStrategy:
     """Uniform mean over clients (classic FedAvg on deltas)."""
 
@@ -59,15 +66,11 @@ class FedAvgStrategy:
         deltas = [c.weight_delta for c in contributions]
         _require_consistent_shapes(deltas)
         num_clients = len(deltas)
-        num_layers = len(deltas[0])
-        averaged: List[List[float]] = []
-        for layer_idx in range(num_layers):
-            layer_len = len(deltas[0][layer_idx])
-            avg_layer = [0.0] * layer_len
-            for client_delta in deltas:
-                for i, v in enumerate(client_delta[layer_idx]):
-                    avg_layer[i] += float(v)
-            averaged.append([v / num_clients for v in avg_layer])
+        # Summing over the client axis adds clients in order, as the scalar loop did.
+        averaged = [
+            (_stack_layer(deltas, layer_idx).sum(axis=0) / num_clients).tolist()
+            for layer_idx in range(len(deltas[0]))
+        ]
         return StrategyResult(
             averaged_delta=averaged,
             strategy_name=self.name,
@@ -85,16 +88,11 @@ class AdaptiveFedAvgStrategy:
         _require_consistent_shapes(deltas)
         weights = [max(float(c.num_samples), 1e-9) for c in contributions]
         total = sum(weights)
-        num_layers = len(deltas[0])
-        averaged: List[List[float]] = []
-        for layer_idx in range(num_layers):
-            layer_len = len(deltas[0][layer_idx])
-            avg_layer = [0.0] * layer_len
-            for client_delta, w in zip(deltas, weights):
-                scale = w / total
-                for i, v in enumerate(client_delta[layer_idx]):
-                    avg_layer[i] += float(v) * scale
-            averaged.append(avg_layer)
+        scales = np.array([w / total for w in weights], dtype=np.float64)[:, None]
+        averaged = [
+            (_stack_layer(deltas, layer_idx) * scales).sum(axis=0).tolist()
+            for layer_idx in range(len(deltas[0]))
+        ]
         return StrategyResult(
             averaged_delta=averaged,
             strategy_name=self.name,
@@ -129,21 +127,19 @@ class RobustTrimmedMeanStrategy:
         averaged: List[List[float]] = []
         method = "median" if n < 3 else "trimmed_mean"
         for layer_idx in range(num_layers):
-            layer_len = len(deltas[0][layer_idx])
-            avg_layer: List[float] = []
-            for i in range(layer_len):
-                values = sorted(float(d[layer_idx][i]) for d in deltas)
-                if method == "median":
-                    mid = n // 2
-                    if n % 2:
-                        avg_layer.append(values[mid])
-                    else:
-                        avg_layer.append(0.5 * (values[mid - 1] + values[mid]))
+            # Sorted per coordinate: column i holds every client's value for parameter i.
+            values = np.sort(_stack_layer(deltas, layer_idx), axis=0)
+            if method == "median":
+                mid = n // 2
+                if n % 2:
+                    avg_layer = values[mid]
                 else:
-                    k = int(n * self.trim_ratio)
-                    trimmed = values[k : n - k] if n - 2 * k > 0 else values
-                    avg_layer.append(sum(trimmed) / len(trimmed))
-            averaged.append(avg_layer)
+                    avg_layer = 0.5 * (values[mid - 1] + values[mid])
+            else:
+                k = int(n * self.trim_ratio)
+                trimmed = values[k : n - k] if n - 2 * k > 0 else values
+                avg_layer = trimmed.sum(axis=0) / len(trimmed)
+            averaged.append(avg_layer.tolist())
         return StrategyResult(
             averaged_delta=averaged,
             strategy_name=self.name,
@@ -0,0 +1,84 @@
+"""
+Aggregation Worker Module
+
+Runs round aggregation on a background thread so /update responses and the
+async-round timeout monitor never wait for a full aggregate.
+"""
+
+import queue
+import threading
+from typing import Callable, Optional, Set
+
+from utils.logger import get_logger
+
+logger = get_logger("aggregation_worker")
+
+
+class AggregationWorker:
+    """
+    Single background thread draining a queue of rounds ready to aggregate.
+
+    A round is queued at most once at a time; re-queueing it while it waits is a
+    no-op. Aggregation itself stays idempotent, so a round queued again after it
+    started simply finds it already closed.
+    """
+
+    def __init__(self, aggregate_round: Callable[[int], None]):
+        """
+        Initialize and start the worker.
+
+        Args:
+            aggregate_round: Callback that aggregates one round by id
+        """
+        self.aggregate_round = aggregate_round
+        self._queue: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._queued: Set[int] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="aggregation-worker", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, round_id: int) -> bool:
+        """
+        Schedule a round for aggregation.
+
+        Returns:
+            True if queued, False if the round was already waiting
+        """
+        with self._lock:
+            if round_id in self._queued:
+                return False
+            self._queued.add(round_id)
+        self._queue.put(round_id)
+        return True
+
+    def wait_idle(self) -> None:
+        """Block until every queued round has been processed."""
+        self._queue.join()
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the worker after the rounds already queued."""
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            round_id = self._queue.get()
+            try:
+                if round_id is None:
+                    return
+                with self._lock:
+                    self._queued.discard(round_id)
+                self.aggregate_round(round_id)
+            except Exception as exc:  # noqa: BLE001 - keep the worker alive
+                logger.error(
+                    f"Background aggregation of round {round_id} failed: {exc}",
+                    extra={
+                        "component": "coordinator",
+                        "event": "aggregation_failed",
+                        "round_id": round_id,
+                    },
+                )
+            finally:
+                self._queue.task_done()
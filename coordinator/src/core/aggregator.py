@@ -9,14 +9,16 @@ re-invoking a CLOSED round returns the previously published model.
 from __future__ import annotations
 
 import json
-import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from aggregation.strategies import ClientContribution, get_strategy
 from .round_manager import RoundManager, RoundState
 from .model_store import ModelStore
+from .quantization import QUANTIZED_KEY, SCALE_KEY, dequantize_layers
 from .versioning import next_version
 from utils.logger import get_logger
 
@@ -37,7 +39,11 @@ def _parse_weight_delta(raw: str) -> Optional[List[List[float]]]:
         payload = json.loads(raw)
     except (json.JSONDecodeError, TypeError):
         return None
+    return _extract_weight_delta(payload)
+
 
+def _extract_weight_delta(payload: Any) -> Optional[List[List[float]]]:
+    """Extract nested weight delta lists from an already-parsed update payload."""
     if isinstance(payload, dict) and "weight_delta" in payload:
         delta = payload["weight_delta"]
     else:
@@ -47,6 +53,15 @@ def _parse_weight_delta(raw: str) -> Optional[List[List[float]]]:
         return None
     if not all(isinstance(layer, list) for layer in delta):
         return None
+    if isinstance(payload, dict):
+        if QUANTIZED_KEY in payload:
+            try:
+                return dequantize_layers(delta, payload[SCALE_KEY])
+            except (KeyError, TypeError, ValueError):
+                return None
+        if SCALE_KEY in payload:
+            # Scales the coordinator did not write: never trust them.
+            return None
     return delta
 
 
@@ -64,23 +79,30 @@ def fedavg_weight_deltas(deltas: List[List[List[float]]]) -> List[List[float]]:
     return FedAvgStrategy().aggregate(contributions).averaged_delta
 
 
-def apply_weight_delta(
-    base_weights: List[List[float]],
-    delta: List[List[float]],
-) -> List[List[float]]:
-    """Apply a flattened parameter delta to a global model."""
+def _check_delta_shape(base_weights: List[List[float]], delta: List[List[float]]) -> None:
+    """Raise ValueError unless delta has the same layer sizes as base_weights."""
     if len(base_weights) != len(delta):
         raise ValueError("Base model and delta have different layer counts")
-    updated: List[List[float]] = []
-    for layer_index, (base_layer, delta_layer) in enumerate(
-        zip(base_weights, delta)
-    ):
+    for layer_index, (base_layer, delta_layer) in enumerate(zip(base_weights, delta)):
         if len(base_layer) != len(delta_layer):
             raise ValueError(
                 f"Base model and delta differ at layer {layer_index}"
             )
+
+
+def apply_weight_delta(
+    base_weights: List[List[float]],
+    delta: List[List[float]],
+) -> List[List[float]]:
+    """Apply a flattened parameter delta to a global model."""
+    _check_delta_shape(base_weights, delta)
+    updated: List[List[float]] = []
+    for base_layer, delta_layer in zip(base_weights, delta):
         updated.append(
-            [float(base) + float(change) for base, change in zip(base_layer, delta_layer)]
+            (
+                np.asarray(base_layer, dtype=np.float64)
+                + np.asarray(delta_layer, dtype=np.float64)
+            ).tolist()
         )
     return updated
 
@@ -109,7 +131,10 @@ class Aggregator:
         self.on_aggregated = on_aggregated
         self.strategy = strategy or get_strategy(strategy_name)
         self.updates: Dict[int, List[ClientUpdate]] = {}
-        self._aggregate_lock = threading.Lock()
+        # Batched submits and aggregations run on different threads and mutate
+        # the same rounds: both hold the round manager's lock, so an update is
+        # recorded either wholly before or wholly after a round's aggregation.
+        self._lock = round_manager.lock
         self._restore_pending()
 
     def _restore_pending(self) -> None:
@@ -165,6 +190,21 @@ class Aggregator:
         self.state_store.set_pending_updates(serializable)
 
     def submit_update(self, client_id: str, round_id: int, weight_delta: str) -> bool:
+        with self._lock:
+            if not self._record_update(client_id, round_id, weight_delta):
+                return False
+            self._persist_pending()
+            return True
+
+    def submit_updates_bulk(self, items: List[Tuple[str, int, str]]) -> List[bool]:
+        """Record several (client_id, round_id, weight_delta) updates with one checkpoint."""
+        with self._lock:
+            results = [self._record_update(client_id, round_id, delta) for client_id, round_id, delta in items]
+            if any(results):
+                self._persist_pending()
+            return results
+
+    def _record_update(self, client_id: str, round_id: int, weight_delta: str) -> bool:
         if not self.round_manager.add_update(client_id, round_id, weight_delta):
             return False
 
@@ -181,8 +221,6 @@ class Aggregator:
             self.updates[round_id].append(
                 ClientUpdate(client_id=client_id, round_id=round_id, weight_delta=weight_delta)
             )
-
-        self._persist_pending()
         return True
 
     def _already_closed_result(self, round_id: int, round_obj) -> Dict[str, Any]:
@@ -218,8 +256,7 @@ class Aggregator:
             should = bool(meta.get("resume_after_crash")) or (
                 round_obj.state == RoundState.COLLECTING
                 and pending
-                and len(round_obj.updates_received) >= len(round_obj.assigned_clients)
-                and len(round_obj.assigned_clients) > 0
+                and round_obj.is_complete
             )
             if not should:
                 continue
@@ -237,7 +274,7 @@ class Aggregator:
         return results
 
     def aggregate(self, round_id: int) -> Optional[Dict[str, Any]]:
-        with self._aggregate_lock:
+        with self._lock:
             return self._aggregate_unlocked(round_id)
 
     def _aggregate_unlocked(self, round_id: int) -> Optional[Dict[str, Any]]:
@@ -307,21 +344,30 @@ class Aggregator:
                 "num_updates": 0,
             }
 
+        # Only the first client's base weights are kept; later ones are compared
+        # by their canonical JSON and dropped, and each delta is held as compact
+        # float64 arrays, so peak memory no longer grows with N copies of the model.
         contributions: List[ClientContribution] = []
-        base_models: List[List[List[float]]] = []
+        base_weights_0: Optional[List[List[float]]] = None
+        canonical_base: Optional[str] = None
+        mismatched_base = False
         model_ids: List[str] = []
         model_configs: List[Dict[str, Any]] = []
         valid_clients: List[str] = []
         losses: List[float] = []
         for update in round_updates:
-            delta = _parse_weight_delta(update.weight_delta)
+            # Parse each stored payload once; the delta and metadata share it.
+            try:
+                payload = json.loads(update.weight_delta)
+            except (json.JSONDecodeError, TypeError):
+                payload = None
+            delta = _extract_weight_delta(payload)
             if delta is None:
                 logger.warning(
                     f"Skipping unparseable update from {update.client_id} in round {round_id}"
                 )
                 continue
             try:
-                payload = json.loads(update.weight_delta)
                 if not isinstance(payload, dict):
                     raise ValueError("Update payload must be an object")
                 base_weights = payload.get("base_weights")
@@ -331,7 +377,8 @@ class Aggregator:
                     or not all(isinstance(layer, list) for layer in base_weights)
                 ):
                     raise ValueError("Update is missing base_weights")
-                apply_weight_delta(base_weights, delta)  # shape validation
+                _check_delta_shape(base_weights, delta)
+                delta = [np.asarray(layer, dtype=np.float64) for layer in delta]
                 num_samples = payload.get("num_samples", 1)
                 try:
                     num_samples_f = float(num_samples)
@@ -344,7 +391,11 @@ class Aggregator:
                         num_samples=num_samples_f,
                     )
                 )
-                base_models.append(base_weights)
+                if base_weights_0 is None:
+                    base_weights_0 = base_weights
+                    canonical_base = json.dumps(base_weights, separators=(",", ":"))
+                elif json.dumps(base_weights, separators=(",", ":")) != canonical_base:
+                    mismatched_base = True
                 model_ids.append(str(payload.get("model_id", "simple_mlp")))
                 model_configs.append(payload.get("model_config") or {})
                 valid_clients.append(update.client_id)
@@ -353,7 +404,7 @@ class Aggregator:
                         losses.append(float(payload["final_loss"]))
                     except (TypeError, ValueError):
                         pass
-            except (json.JSONDecodeError, TypeError, ValueError) as exc:
+            except (TypeError, ValueError) as exc:
                 logger.warning(
                     f"Skipping invalid update from {update.client_id}: {exc}"
                 )
@@ -367,11 +418,7 @@ class Aggregator:
                 "num_updates": 0,
             }
 
-        canonical_base = json.dumps(base_models[0], separators=(",", ":"))
-        if any(
-            json.dumps(base, separators=(",", ":")) != canonical_base
-            for base in base_models[1:]
-        ):
+        if mismatched_base:
             logger.error("Clients did not train from identical global weights")
             self.round_manager.set_round_state(round_id, RoundState.COLLECTING)
             return None
@@ -396,7 +443,7 @@ class Aggregator:
         try:
             strategy_result = self.strategy.aggregate(contributions)
             averaged_delta = strategy_result.averaged_delta
-            global_weights = apply_weight_delta(base_models[0], averaged_delta)
+            global_weights = apply_weight_delta(base_weights_0, averaged_delta)
         except ValueError as e:
             logger.error(f"Strategy {self.strategy.name} failed for round {round_id}: {e}")
             self.round_manager.set_round_state(round_id, RoundState.COLLECTING)
@@ -10,7 +10,7 @@ import threading
 from typing import Dict, Set, Optional, Callable
 from enum import Enum
 from dataclasses import dataclass, field
-from .round_manager import RoundManager, RoundState, Round
+from .round_manager import AGGREGATION_STARTED_STATES, RoundManager, RoundState, Round
 
 
 class AsyncRoundState(Enum):
@@ -49,6 +49,8 @@ class AsyncRoundManager:
     - Timeout-based round closure
     - Straggler tracking
     """
+
+    enabled = True
     
     def __init__(
         self,
@@ -68,7 +70,7 @@ class AsyncRoundManager:
         self.config = config or AsyncRoundConfig()
         self.on_round_ready = on_round_ready
         
-        # Track round start times
+        # Round start times (time.monotonic(), set once when the round is first assigned)
         self.round_start_times: Dict[int, float] = {}
         
         # Track stragglers
@@ -79,7 +81,7 @@ class AsyncRoundManager:
         
         # Background thread for timeout checking
         self._timeout_thread: Optional[threading.Thread] = None
-        self._stop_timeout_thread = False
+        self._stop_timeout = threading.Event()
         
         if self.config.enable_async:
             self._start_timeout_monitor()
@@ -87,16 +89,16 @@ class AsyncRoundManager:
     def _start_timeout_monitor(self) -> None:
         """Start background thread to monitor round timeouts."""
         def monitor_timeouts():
-            while not self._stop_timeout_thread:
+            while not self._stop_timeout.is_set():
                 self._check_timeouts()
-                time.sleep(5.0)  # Check every 5 seconds
+                self._stop_timeout.wait(5.0)  # Check every 5 seconds; wakes on shutdown
         
         self._timeout_thread = threading.Thread(target=monitor_timeouts, daemon=True)
         self._timeout_thread.start()
     
     def _check_timeouts(self) -> None:
         """Check for rounds that have exceeded their timeout."""
-        now = time.time()
+        now = time.monotonic()
         for round_id, start_time in list(self.round_start_times.items()):
             if round_id in self.closed_rounds:
                 continue
@@ -105,7 +107,7 @@ class AsyncRoundManager:
             if elapsed > self.config.max_round_duration_seconds:
                 # Round has timed out
                 round_obj = self.base_round_manager.rounds.get(round_id)
-                if round_obj and round_obj.state not in [RoundState.AGGREGATING, RoundState.CLOSED]:
+                if round_obj and round_obj.state not in AGGREGATION_STARTED_STATES:
                     # Mark as ready for aggregation due to timeout
                     if self.on_round_ready:
                         self.on_round_ready(round_id)
@@ -118,7 +120,20 @@ class AsyncRoundManager:
             round_id: Identifier of the round
         """
         if self.config.enable_async:
-            self.round_start_times[round_id] = time.time()
+            # Called for every assignment; only the first one starts the clock.
+            self.round_start_times.setdefault(round_id, time.monotonic())
+
+    def elapsed_seconds(self, round_id: int) -> Optional[float]:
+        """
+        Seconds since the round started, or None if it is not being timed.
+
+        Args:
+            round_id: Identifier of the round
+        """
+        started = self.round_start_times.get(round_id)
+        if started is None:
+            return None
+        return time.monotonic() - started
     
     def check_round_ready(self, round_id: int) -> bool:
         """
@@ -137,9 +152,7 @@ class AsyncRoundManager:
         if not self.config.enable_async:
             # Sync mode: round is ready when all clients submit
             round_obj = self.base_round_manager.rounds.get(round_id)
-            if round_obj:
-                return len(round_obj.updates_received) >= len(round_obj.assigned_clients) and len(round_obj.assigned_clients) > 0
-            return False
+            return bool(round_obj and round_obj.is_complete)
         
         round_obj = self.base_round_manager.rounds.get(round_id)
         if not round_obj:
@@ -155,10 +168,9 @@ class AsyncRoundManager:
             return True
         
         # Check timeout
-        if round_id in self.round_start_times:
-            elapsed = time.time() - self.round_start_times[round_id]
-            if elapsed > self.config.max_round_duration_seconds:
-                return True
+        elapsed = self.elapsed_seconds(round_id)
+        if elapsed is not None and elapsed > self.config.max_round_duration_seconds:
+            return True
         
         return False
     
@@ -226,8 +238,8 @@ class AsyncRoundManager:
             "stragglers": len(self.stragglers.get(round_id, []))
         }
         
-        if round_id in self.round_start_times:
-            elapsed = time.time() - self.round_start_times[round_id]
+        elapsed = self.elapsed_seconds(round_id)
+        if elapsed is not None:
             stats["elapsed_seconds"] = elapsed
             stats["timeout_seconds"] = self.config.max_round_duration_seconds
             stats["timeout_remaining"] = max(0, self.config.max_round_duration_seconds - elapsed)
@@ -236,7 +248,41 @@ class AsyncRoundManager:
     
     def shutdown(self) -> None:
         """Shutdown the async round manager (stop timeout thread)."""
-        self._stop_timeout_thread = True
+        self._stop_timeout.set()
         if self._timeout_thread:
             self._timeout_thread.join(timeout=2.0)
 
+
+class NullAsyncRoundManager:
+    """
+    Stand-in used when async rounds are disabled.
+
+    Callers invoke it exactly like AsyncRoundManager instead of testing for None
+    first: nothing is timed, no round is ever closed or ready, and there is no
+    background thread to stop.
+    """
+
+    enabled = False
+    on_round_ready: Optional[Callable[[int], None]] = None
+    closed_rounds: frozenset = frozenset()
+
+    def start_round(self, round_id: int) -> None:
+        pass
+
+    def elapsed_seconds(self, round_id: int) -> Optional[float]:
+        return None
+
+    def check_round_ready(self, round_id: int) -> bool:
+        return False
+
+    def record_straggler(self, client_id: str, round_id: int) -> None:
+        pass
+
+    def mark_round_closed(self, round_id: int) -> None:
+        pass
+
+    def get_round_stats(self, round_id: int) -> Dict:
+        return {}
+
+    def shutdown(self) -> None:
+        pass
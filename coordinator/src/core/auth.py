@@ -114,13 +114,13 @@ class AuthManager:
         return verify(public_key, message, signature)
 
     def validate_api_key(self, api_key: Optional[str], client_id: Optional[str] = None) -> bool:
-        if api_key is None or api_key == "":
+        if not api_key:
             return False
-        if api_key not in self.key_to_client:
+        # One in-memory hash probe; deliberately uncached (docs/roadmap/IMPLEMENTATION_PLAN.md).
+        owner = self.key_to_client.get(api_key)
+        if owner is None:
             return False
-        if client_id is not None and self.key_to_client.get(api_key) != client_id:
-            return False
-        return True
+        return client_id is None or owner == client_id
 
     def get_client_id_from_key(self, api_key: str) -> Optional[str]:
         return self.key_to_client.get(api_key)
@@ -0,0 +1,69 @@
+"""
+Auth Gate Module
+
+ASGI middleware that rejects update uploads carrying an unknown API key in the
+request headers, so unauthenticated clients are refused with 401 before their
+body is read, parsed into a request model or validated.
+"""
+
+import json
+from typing import Callable, Iterable, Optional
+
+AUTH_FAILED_DETAIL = "Authentication failed. Valid API key required."
+
+
+def header_api_key(headers: Iterable[tuple]) -> Optional[str]:
+    """
+    API key from raw ASGI headers: ``X-Api-Key``, then ``Authorization: Bearer``.
+
+    Mirrors the header part of protocol.credentials.extract_api_key.
+    """
+    bearer = None
+    for name, value in headers:
+        if name == b"x-api-key":
+            key = value.decode("latin-1").strip()
+            if key:
+                return key
+        elif name == b"authorization" and bearer is None:
+            auth = value.decode("latin-1").strip()
+            if auth.lower().startswith("bearer "):
+                bearer = auth[7:].strip() or None
+    return bearer
+
+
+class UpdateAuthGateMiddleware:
+    """
+    Answer 401 on the given paths when a header API key belongs to no client.
+
+    Requests without header credentials (body api_key) pass through untouched,
+    as do known keys: the endpoint still checks that the key owns the update's
+    client_id and applies the per-round rate limit, which need the body.
+    """
+
+    def __init__(self, app, key_owner: Callable[[str], Optional[str]], paths: Iterable[str]):
+        self.app = app
+        self.key_owner = key_owner
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            api_key = header_api_key(scope["headers"])
+            if api_key is not None and self.key_owner(api_key) is None:
+                await self._send_401(send)
+                return
+        await self.app(scope, receive, send)
+
+    async def _send_401(self, send) -> None:
+        body = json.dumps({"detail": AUTH_FAILED_DETAIL}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 401,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
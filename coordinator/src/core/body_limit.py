@@ -0,0 +1,75 @@
+"""
+Body Limit Module
+
+ASGI middleware that caps request body size for selected paths, so oversize
+uploads are refused with 413 before the body is buffered and decoded into
+Python objects.
+"""
+
+import json
+from typing import Iterable
+
+from starlette.exceptions import HTTPException
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies larger than max_bytes on the given paths.
+
+    A declared Content-Length over the limit is answered immediately without
+    reading the body; chunked or undeclared bodies are counted as they stream in
+    and the read fails with 413 once the limit is crossed.
+    """
+
+    def __init__(self, app, max_bytes: int, paths: Iterable[str]):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    break
+                if declared > self.max_bytes:
+                    await self._send_413(send)
+                    return
+                break
+
+        received = 0
+        max_bytes = self.max_bytes
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Request body exceeds {self.max_bytes} bytes"
+
+    async def _send_413(self, send) -> None:
+        body = json.dumps({"detail": self._detail()}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -9,8 +9,8 @@ import json
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, List
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, Optional, Any, List
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -29,6 +29,19 @@ class RoundMetrics:
     
     aggregation_start_time: Optional[float] = None
     aggregation_end_time: Optional[float] = None
+
+    # Bumped by __setattr__ after every field change; (version, to_dict()) is
+    # only reused while the version still matches, so a snapshot built on
+    # another thread during an update can never outlive that update.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshot: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name not in ("_snapshot", "_version"):
+            object.__setattr__(self, "_version", self._version + 1)
     
     # Computed properties
     @property
@@ -46,10 +59,31 @@ class RoundMetrics:
         return None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["round_duration_seconds"] = self.round_duration_seconds
-        data["aggregation_time_seconds"] = self.aggregation_time_seconds
+        """
+        Convert metrics to dictionary for JSON serialization.
+
+        The dict is built once per change and shared between callers until the
+        next update, so treat it as read-only.
+        """
+        version = self._version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1]
+        data = {
+            "round_id": self.round_id,
+            "model_version": self.model_version,
+            "round_start_time": self.round_start_time,
+            "round_end_time": self.round_end_time,
+            "clients_assigned": self.clients_assigned,
+            "updates_received": self.updates_received,
+            "updates_accepted": self.updates_accepted,
+            "updates_rejected": self.updates_rejected,
+            "aggregation_start_time": self.aggregation_start_time,
+            "aggregation_end_time": self.aggregation_end_time,
+            "round_duration_seconds": self.round_duration_seconds,
+            "aggregation_time_seconds": self.aggregation_time_seconds,
+        }
+        object.__setattr__(self, "_snapshot", (version, data))
         return data
 
 
@@ -83,10 +117,15 @@ class MetricsCollector:
         # In-memory metrics storage
         self.round_metrics: Dict[int, RoundMetrics] = {}
         self.current_round_id: Optional[int] = None
+        self.latest_round_id: Optional[int] = None
         
         # Global metrics
         self.total_clients_seen: set = set()
         self.total_failed_updates: int = 0
+
+        # Bumped after every change so pollers/streams can skip unchanged
+        # snapshots; a reader that sees a revision also sees its change.
+        self.revision: int = 0
     
     def start_round(self, round_id: int, model_version: str) -> None:
         """
@@ -102,6 +141,20 @@ class MetricsCollector:
             model_version=model_version,
             round_start_time=time.time()
         )
+        if self.latest_round_id is None or round_id > self.latest_round_id:
+            self.latest_round_id = round_id
+        self.revision += 1
+    
+    def record_client_seen(self, client_id: str) -> None:
+        """
+        Count a client in total_clients_seen (e.g. on registration).
+        
+        Args:
+            client_id: Identifier of the client
+        """
+        if client_id not in self.total_clients_seen:
+            self.total_clients_seen.add(client_id)
+            self.revision += 1
     
     def record_client_assigned(self, round_id: int, client_id: str) -> None:
         """
@@ -114,6 +167,7 @@ class MetricsCollector:
         if round_id in self.round_metrics:
             self.round_metrics[round_id].clients_assigned += 1
             self.total_clients_seen.add(client_id)
+        self.revision += 1
     
     def record_update_received(self, round_id: int) -> None:
         """
@@ -124,6 +178,7 @@ class MetricsCollector:
         """
         if round_id in self.round_metrics:
             self.round_metrics[round_id].updates_received += 1
+        self.revision += 1
     
     def record_update_accepted(self, round_id: int) -> None:
         """
@@ -134,7 +189,22 @@ class MetricsCollector:
         """
         if round_id in self.round_metrics:
             self.round_metrics[round_id].updates_accepted += 1
+        self.revision += 1
     
+    def record_updates_accepted(self, round_ids: Iterable[int]) -> None:
+        """
+        Record a batch of received-and-accepted updates.
+
+        Args:
+            round_ids: Round of each accepted update (one entry per update)
+        """
+        for round_id in round_ids:
+            metrics = self.round_metrics.get(round_id)
+            if metrics is not None:
+                metrics.updates_received += 1
+                metrics.updates_accepted += 1
+        self.revision += 1
+
     def record_update_rejected(self, round_id: int) -> None:
         """
         Record that an update was rejected for a round.
@@ -145,6 +215,7 @@ class MetricsCollector:
         if round_id in self.round_metrics:
             self.round_metrics[round_id].updates_rejected += 1
             self.total_failed_updates += 1
+        self.revision += 1
     
     def start_aggregation(self, round_id: int) -> None:
         """
@@ -155,6 +226,7 @@ class MetricsCollector:
         """
         if round_id in self.round_metrics:
             self.round_metrics[round_id].aggregation_start_time = time.time()
+        self.revision += 1
     
     def complete_aggregation(self, round_id: int) -> None:
         """
@@ -165,6 +237,7 @@ class MetricsCollector:
         """
         if round_id in self.round_metrics:
             self.round_metrics[round_id].aggregation_end_time = time.time()
+        self.revision += 1
     
     def end_round(self, round_id: int) -> None:
         """
@@ -175,6 +248,7 @@ class MetricsCollector:
         """
         if round_id in self.round_metrics:
             self.round_metrics[round_id].round_end_time = time.time()
+            self.revision += 1
             self._persist_round_metrics(round_id)
             self._append_summary_log(round_id)
     
@@ -256,11 +330,10 @@ class MetricsCollector:
         Returns:
             Latest round metrics as dictionary, or None if no rounds exist
         """
-        if not self.round_metrics:
+        if self.latest_round_id is None:
             return None
         
-        latest_round_id = max(self.round_metrics.keys())
-        return self.get_round_metrics(latest_round_id)
+        return self.get_round_metrics(self.latest_round_id)
     
     def get_all_metrics(self) -> Dict[str, Any]:
         """
@@ -4,11 +4,16 @@ Model Store Module
 Handles filesystem-based persistence of global models.
 """
 
+import gzip
 import json
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 
+from .versioning import parse_version_number
+
 
 class ModelStore:
     """
@@ -52,6 +57,79 @@ class ModelStore:
         filename = f"model_{version}.json"
         return self.models_dir / filename
     
+    def get_model_path(self, version: str) -> Path:
+        """
+        Get the on-disk file of an existing model version.
+
+        Lets callers stream the stored JSON as-is instead of loading it.
+
+        Args:
+            version: Model version string (e.g., "v1", "v2")
+
+        Returns:
+            Path to the model file
+
+        Raises:
+            FileNotFoundError: If the version is malformed or does not exist
+        """
+        model_path = self._get_model_path(version)
+        if "/" in version or "\\" in version or not model_path.is_file():
+            raise FileNotFoundError(f"Model version {version} not found at {model_path}")
+        return model_path
+
+    def model_etag(self, version: str) -> str:
+        """
+        Entity tag of an existing model version's file.
+
+        Built from the file's mtime and size, so no model is read or hashed;
+        save_model replaces the file and therefore changes the tag.
+
+        Raises:
+            FileNotFoundError: If the version is malformed or does not exist
+        """
+        stat = self.get_model_path(version).stat()
+        return f'"{version}-{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def get_gzip_model_path(self, version: str) -> Path:
+        """
+        Get a gzip-compressed copy of an existing model version's file.
+
+        The copy (model_<version>.json.gz) is written on first use and rebuilt
+        whenever the model file is newer, so repeat downloads send the stored
+        compressed bytes instead of compressing the model per request.
+
+        Args:
+            version: Model version string (e.g., "v1", "v2")
+
+        Returns:
+            Path to the compressed file
+
+        Raises:
+            FileNotFoundError: If the version is malformed or does not exist
+        """
+        model_path = self.get_model_path(version)
+        gz_path = model_path.with_name(model_path.name + ".gz")
+        try:
+            if gz_path.stat().st_mtime_ns >= model_path.stat().st_mtime_ns:
+                return gz_path
+        except FileNotFoundError:
+            pass
+
+        # Concurrent builders each write their own temp file; the last replace wins.
+        fd, tmp = tempfile.mkstemp(dir=self.models_dir, prefix=gz_path.name, suffix=".tmp")
+        try:
+            with open(model_path, "rb") as src, os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp, gz_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return gz_path
+
     def save_model(self, version: str, model_data: Dict) -> None:
         """
         Save a model to disk.
@@ -130,8 +208,9 @@ class ModelStore:
         candidates = []
         for model_file in model_files:
             version_str = model_file.stem.replace("model_", "")
-            if version_str.startswith("v") and version_str[1:].isdigit():
-                candidates.append((int(version_str[1:]), version_str, model_file))
+            version_num = parse_version_number(version_str)
+            if version_num is not None:
+                candidates.append((version_num, version_str, model_file))
 
         if not candidates:
             return None
@@ -183,17 +262,17 @@ class ModelStore:
             return []
         
         model_files = list(self.models_dir.glob("model_v*.json"))
-        versions = []
+        numbered = []
         
         for model_file in model_files:
             filename = model_file.stem
             version_str = filename.replace("model_", "")
-            
-            if version_str.startswith("v") and version_str[1:].isdigit():
-                versions.append(version_str)
+            version_num = parse_version_number(version_str)
+            if version_num is not None:
+                numbered.append((version_num, version_str))
         
-        # Sort by version number
-        versions.sort(key=lambda v: int(v[1:]))
+        # Sort by version number (parsed once per file)
+        numbered.sort()
         
-        return versions
+        return [version_str for _, version_str in numbered]
 
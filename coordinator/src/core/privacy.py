@@ -9,8 +9,15 @@ import os
 import json
 import random
 import math
+import threading
 from typing import Dict, Any, Optional, List
 
+import numpy as np
+
+# Largest layer validated in the per-thread scratch buffers (2 MiB of float64);
+# bigger layers allocate so idle worker threads do not pin large buffers.
+_SCRATCH_MAX_ELEMENTS = 1 << 18
+
 
 class PrivacyProtector:
     """
@@ -37,6 +44,8 @@ class PrivacyProtector:
         self.max_norm = max_norm or float(os.getenv("PRIVACY_MAX_NORM", "10.0"))
         self.noise_scale = noise_scale or float(os.getenv("PRIVACY_NOISE_SCALE", "0.01"))
         self.enable_noise = enable_noise or os.getenv("PRIVACY_ENABLE_NOISE", "false").lower() == "true"
+        # Validation runs in the request threadpool; one scratch pair per thread.
+        self._scratch = threading.local()
     
     def clip_gradients(self, weight_delta: List[List[float]]) -> List[List[float]]:
         """
@@ -55,15 +64,27 @@ class PrivacyProtector:
         
         clipped = []
         for param_tensor in weight_delta:
-            # Calculate L2 norm
-            norm = math.sqrt(sum(x * x for x in param_tensor))
+            try:
+                values = np.asarray(param_tensor, dtype=np.float64)
+            except (TypeError, ValueError):
+                values = None
             
-            if norm > self.max_norm:
-                # Clip: scale down to max_norm
-                scale = self.max_norm / norm
-                clipped_tensor = [x * scale for x in param_tensor]
+            if values is not None and values.ndim == 1:
+                # Calculate L2 norm in one vectorized pass; np.dot may sum in a
+                # different order, so the norm can differ in the last ULPs
+                norm = math.sqrt(float(np.dot(values, values)))
+                if norm > self.max_norm:
+                    clipped_tensor = (values * (self.max_norm / norm)).tolist()
+                else:
+                    clipped_tensor = param_tensor.copy()
             else:
-                clipped_tensor = param_tensor.copy()
+                # Nested or non-numeric tensors keep the original element-wise path
+                norm = math.sqrt(sum(x * x for x in param_tensor))
+                if norm > self.max_norm:
+                    scale = self.max_norm / norm
+                    clipped_tensor = [x * scale for x in param_tensor]
+                else:
+                    clipped_tensor = param_tensor.copy()
             
             clipped.append(clipped_tensor)
         
@@ -110,9 +131,28 @@ class PrivacyProtector:
             Protected weight delta as JSON string
         """
         try:
-            # Parse the update
             update_data = json.loads(weight_delta_str)
+        except json.JSONDecodeError:
+            # If parsing fails, return original (validation will catch it)
+            return weight_delta_str
+        return self.protect_decoded_update(update_data, weight_delta_str)
+
+    def protect_decoded_update(self, update_data: Any, weight_delta_str: str) -> str:
+        """
+        Apply privacy protections to an update payload that is already parsed.
+        
+        Same result as protect_update(weight_delta_str) for the payload that
+        string decodes to, without parsing it again. update_data is modified.
+        
+        Args:
+            update_data: Parsed JSON payload of weight_delta_str
+            weight_delta_str: Original JSON string, returned if the payload
+                cannot be protected
             
+        Returns:
+            Protected weight delta as JSON string
+        """
+        try:
             # Extract weight delta
             if "weight_delta" in update_data:
                 weight_delta = update_data["weight_delta"]
@@ -142,14 +182,17 @@ class PrivacyProtector:
                 # If it was just a list, return the protected list
                 return json.dumps(protected, sort_keys=True)
         
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            # If parsing fails, return original (validation will catch it)
+        except (KeyError, TypeError):
+            # Unexpected structure: return original (the aggregator rejects it)
             return weight_delta_str
     
     def validate_update_values(self, weight_delta: List[List[float]]) -> tuple[bool, Optional[str]]:
         """
         Validate that update values are finite (no NaN or Inf).
         
+        Nested (multi-dimensional) tensors are checked flattened in row-major
+        order, so the reported element index points into the flattened tensor.
+        
         Args:
             weight_delta: List of parameter tensors
             
@@ -157,9 +200,43 @@ class PrivacyProtector:
             Tuple of (is_valid: bool, error_message: Optional[str])
         """
         for i, param_tensor in enumerate(weight_delta):
+            try:
+                # float64 so large-but-finite values are not mistaken for overflow
+                values, finite = self._float_view(param_tensor)
+            except (TypeError, ValueError):
+                values = None
+            if values is not None:
+                np.isfinite(values, out=finite)
+                if finite.all():
+                    continue
+                j = int(np.argmin(finite))
+                return False, f"Non-finite value found in parameter {i}, element {j}: {values[j]}"
+            # Ragged or non-numeric tensors keep the element-wise check
             for j, value in enumerate(param_tensor):
                 if not math.isfinite(value):
                     return False, f"Non-finite value found in parameter {i}, element {j}: {value}"
         
         return True, None
 
+    def _float_view(self, param_tensor: Any) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (float64 values, bool output) arrays for one parameter tensor.
+
+        Flat layers are copied into this thread's reusable scratch buffers;
+        nested or oversized layers fall back to fresh arrays.
+        """
+        n = len(param_tensor)
+        if n <= _SCRATCH_MAX_ELEMENTS:
+            values = getattr(self._scratch, "values", None)
+            if values is None or len(values) < n:
+                grown = 2 * len(values) if values is not None else 0
+                size = min(_SCRATCH_MAX_ELEMENTS, max(n, 1024, grown))
+                values = self._scratch.values = np.empty(size, dtype=np.float64)
+                self._scratch.finite = np.empty(size, dtype=bool)
+            try:
+                values[:n] = param_tensor
+                return values[:n], self._scratch.finite[:n]
+            except (TypeError, ValueError):
+                pass
+        flat = np.asarray(param_tensor, dtype=np.float64).ravel()
+        return flat, np.empty(flat.shape, dtype=bool)
@@ -0,0 +1,104 @@
+"""
+Update Quantization Module
+
+Optional symmetric per-layer integer quantization of accepted weight deltas.
+Buffered updates are kept (and checkpointed) as JSON text, so small integers
+plus one scale per layer make each stored update several times smaller and
+faster to parse at aggregation time. The aggregator dequantizes transparently.
+
+Only the coordinator quantizes: the validator rejects client payloads that set
+either key below, and the aggregator only dequantizes payloads carrying
+QUANTIZED_KEY.
+"""
+
+import json
+import os
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+# Key holding the per-layer scales next to a quantized "weight_delta".
+SCALE_KEY = "weight_delta_scale"
+
+# Set by the coordinator (to the bit width) on payloads it quantized itself.
+QUANTIZED_KEY = "weight_delta_quantized"
+
+# Payload keys a client update may not carry.
+RESERVED_KEYS = frozenset((SCALE_KEY, QUANTIZED_KEY))
+
+SUPPORTED_BITS = (8, 16)
+
+
+def get_quantize_bits() -> Optional[int]:
+    """Bits from UPDATE_QUANTIZE_BITS (8 or 16), or None when disabled/unset."""
+    raw = os.getenv("UPDATE_QUANTIZE_BITS", "").strip()
+    if not raw or raw == "0":
+        return None
+    bits = int(raw)
+    if bits not in SUPPORTED_BITS:
+        raise ValueError(f"UPDATE_QUANTIZE_BITS must be one of {SUPPORTED_BITS}, got {bits}")
+    return bits
+
+
+def quantize_layers(layers: List[List[float]], bits: int) -> Tuple[List[List[int]], List[float]]:
+    """
+    Quantize each layer to signed integers with one scale per layer.
+
+    Returns:
+        (integer layers, scales) such that value ~= integer * scale
+    """
+    qmax = (1 << (bits - 1)) - 1
+    values: List[List[int]] = []
+    scales: List[float] = []
+    for layer in layers:
+        arr = np.asarray(layer, dtype=np.float64)
+        peak = float(np.max(np.abs(arr))) if arr.size else 0.0
+        scale = peak / qmax if peak > 0.0 else 1.0
+        values.append(np.rint(arr / scale).astype(np.int64).tolist())
+        scales.append(scale)
+    return values, scales
+
+
+def dequantize_layers(values: List[List[int]], scales: List[float]) -> List[List[float]]:
+    """Inverse of quantize_layers."""
+    if len(values) != len(scales):
+        raise ValueError("Quantized update has a different number of layers and scales")
+    return [
+        (np.asarray(layer, dtype=np.float64) * float(scale)).tolist()
+        for layer, scale in zip(values, scales)
+    ]
+
+
+def quantize_update_payload(weight_delta_str: str, bits: int) -> str:
+    """
+    Quantize the "weight_delta" of a serialized update payload.
+
+    Payloads without a list-of-layers "weight_delta" are returned unchanged.
+    """
+    try:
+        payload: Any = json.loads(weight_delta_str)
+    except (json.JSONDecodeError, TypeError):
+        return weight_delta_str
+    return quantize_decoded_payload(payload, weight_delta_str, bits)
+
+
+def quantize_decoded_payload(payload: Any, weight_delta_str: str, bits: int) -> str:
+    """
+    Same as quantize_update_payload for a payload that is already parsed.
+
+    Args:
+        payload: Parsed JSON payload of weight_delta_str (modified when quantized)
+        weight_delta_str: Serialized payload, returned if it cannot be quantized
+        bits: 8 or 16
+    """
+    if not isinstance(payload, dict) or QUANTIZED_KEY in payload:
+        return weight_delta_str
+    delta = payload.get("weight_delta")
+    if not isinstance(delta, list) or not all(isinstance(layer, list) for layer in delta):
+        return weight_delta_str
+    try:
+        payload["weight_delta"], payload[SCALE_KEY] = quantize_layers(delta, bits)
+    except (TypeError, ValueError):
+        return weight_delta_str
+    payload[QUANTIZED_KEY] = bits
+    return json.dumps(payload, sort_keys=True)
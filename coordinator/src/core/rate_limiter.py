@@ -5,8 +5,11 @@ Provides basic rate limiting to prevent abuse and spam.
 In-memory by default; SQL-backed when shared state is enabled.
 """
 
+import os
+import threading
 import time
-from typing import Dict, Optional
+from bisect import bisect_right, insort
+from typing import Dict, List, Optional
 from collections import defaultdict
 
 
@@ -32,6 +35,11 @@ class RateLimiter:
         self.updates_per_round: Dict[str, Dict[int, int]] = defaultdict(dict)
         self.request_timestamps: Dict[str, list] = defaultdict(list)
         self.current_rounds: Dict[int, set] = {}
+
+    @property
+    def blocking_io(self) -> bool:
+        """True when checks make database or network round trips (run them off the event loop)."""
+        return self.repo is not None
     
     def check_update_rate(self, client_id: str, round_id: int) -> tuple[bool, Optional[str]]:
         if self.repo is not None:
@@ -56,43 +64,46 @@ class RateLimiter:
         client_rounds = self.updates_per_round[client_id]
         client_rounds[round_id] = client_rounds.get(round_id, 0) + 1
     
-    def check_request_rate(self, client_id: str) -> tuple[bool, Optional[str]]:
-        now = time.time()
-        bucket = f"req:{client_id}"
+    def _load_timestamps(self, client_id: str) -> list:
+        """Request timestamps for a client, sorted ascending."""
         if self.repo is not None:
-            timestamps = self.repo.get_timestamps(bucket)
-        else:
-            timestamps = self.request_timestamps[client_id]
+            timestamps = self.repo.get_timestamps(f"req:{client_id}")
+            # Replicas append concurrently; timsort is linear on near-sorted input.
+            timestamps.sort()
+            return timestamps
+        return self.request_timestamps[client_id]
+
+    def check_request_rate(
+        self, client_id: str, now: Optional[float] = None
+    ) -> tuple[bool, Optional[str]]:
+        # Callers may pass one timestamp per HTTP request so check/record agree.
+        now = time.time() if now is None else now
+        timestamps = self._load_timestamps(client_id)
         
-        one_hour_ago = now - 3600
-        timestamps = [ts for ts in timestamps if ts > one_hour_ago]
+        # Timestamps are kept sorted, so both windows are binary searches.
+        hour_start = bisect_right(timestamps, now - 3600)
+        if hour_start:
+            del timestamps[:hour_start]
         
         if len(timestamps) >= self.max_requests_per_hour:
             return False, f"Client {client_id} exceeded max requests per hour ({self.max_requests_per_hour})"
         
-        one_minute_ago = now - 60
-        recent_requests = [ts for ts in timestamps if ts > one_minute_ago]
-        
-        if len(recent_requests) >= self.max_requests_per_minute:
+        minute_start = bisect_right(timestamps, now - 60)
+        if len(timestamps) - minute_start >= self.max_requests_per_minute:
             return False, f"Client {client_id} exceeded max requests per minute ({self.max_requests_per_minute})"
         
-        timestamps.append(now)
+        insort(timestamps, now)
         if self.repo is not None:
-            self.repo.set_timestamps(bucket, timestamps)
-        else:
-            self.request_timestamps[client_id] = timestamps
+            self.repo.set_timestamps(f"req:{client_id}", timestamps)
         
         return True, None
     
-    def record_request(self, client_id: str) -> None:
-        now = time.time()
+    def record_request(self, client_id: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        timestamps = self._load_timestamps(client_id)
+        insort(timestamps, now)
         if self.repo is not None:
-            bucket = f"req:{client_id}"
-            timestamps = self.repo.get_timestamps(bucket)
-            timestamps.append(now)
-            self.repo.set_timestamps(bucket, timestamps)
-            return
-        self.request_timestamps[client_id].append(now)
+            self.repo.set_timestamps(f"req:{client_id}", timestamps)
     
     def reset_round(self, round_id: int) -> None:
         if round_id in self.current_rounds:
@@ -102,20 +113,128 @@ class RateLimiter:
                     self.updates_per_round[client_id].pop(round_id, None)
             del self.current_rounds[round_id]
     
-    def get_client_stats(self, client_id: str) -> Dict:
-        now = time.time()
+    def get_client_stats(self, client_id: str, now: Optional[float] = None) -> Dict:
+        now = time.time() if now is None else now
         if self.repo is not None:
-            timestamps = self.repo.get_timestamps(f"req:{client_id}")
+            timestamps = self._load_timestamps(client_id)
         else:
             timestamps = self.request_timestamps.get(client_id, [])
         
-        one_minute_ago = now - 60
-        requests_last_minute = len([ts for ts in timestamps if ts > one_minute_ago])
-        one_hour_ago = now - 3600
-        requests_last_hour = len([ts for ts in timestamps if ts > one_hour_ago])
+        requests_last_minute = len(timestamps) - bisect_right(timestamps, now - 60)
+        requests_last_hour = len(timestamps) - bisect_right(timestamps, now - 3600)
         
         return {
             "requests_last_minute": requests_last_minute,
             "requests_last_hour": requests_last_hour,
             "total_rounds_with_updates": len(self.updates_per_round.get(client_id, {}))
         }
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    In-memory rate limiter with O(1) per-client request accounting.
+
+    Each client holds a minute and an hour token bucket refilled continuously
+    at max/60 and max/3600 tokens per second, so bursts up to the limit are
+    allowed without keeping a timestamp log. Per-round update limits are
+    inherited unchanged.
+    """
+
+    def __init__(
+        self,
+        max_updates_per_round: int = 5,
+        max_requests_per_minute: int = 60,
+        max_requests_per_hour: int = 1000,
+    ):
+        super().__init__(
+            max_updates_per_round=max_updates_per_round,
+            max_requests_per_minute=max_requests_per_minute,
+            max_requests_per_hour=max_requests_per_hour,
+        )
+        # client_id -> [minute_tokens, hour_tokens, last_refill]
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _refill(self, client_id: str, now: float) -> List[float]:
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = [float(self.max_requests_per_minute), float(self.max_requests_per_hour), now]
+            self._buckets[client_id] = bucket
+            return bucket
+        elapsed = now - bucket[2]
+        if elapsed > 0:
+            bucket[0] = min(
+                float(self.max_requests_per_minute),
+                bucket[0] + elapsed * self.max_requests_per_minute / 60.0,
+            )
+            bucket[1] = min(
+                float(self.max_requests_per_hour),
+                bucket[1] + elapsed * self.max_requests_per_hour / 3600.0,
+            )
+            bucket[2] = now
+        return bucket
+
+    def check_request_rate(
+        self, client_id: str, now: Optional[float] = None
+    ) -> tuple[bool, Optional[str]]:
+        now = time.time() if now is None else now
+        with self._lock:
+            bucket = self._refill(client_id, now)
+            if bucket[1] < 1.0:
+                return False, f"Client {client_id} exceeded max requests per hour ({self.max_requests_per_hour})"
+            if bucket[0] < 1.0:
+                return False, f"Client {client_id} exceeded max requests per minute ({self.max_requests_per_minute})"
+            bucket[0] -= 1.0
+            bucket[1] -= 1.0
+        return True, None
+
+    def record_request(self, client_id: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            bucket = self._refill(client_id, now)
+            bucket[0] = max(0.0, bucket[0] - 1.0)
+            bucket[1] = max(0.0, bucket[1] - 1.0)
+
+    def get_client_stats(self, client_id: str, now: Optional[float] = None) -> Dict:
+        now = time.time() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(client_id)
+            if bucket is not None:
+                bucket = self._refill(client_id, now)
+                minute_used = self.max_requests_per_minute - bucket[0]
+                hour_used = self.max_requests_per_hour - bucket[1]
+            else:
+                minute_used = hour_used = 0.0
+        # Buckets do not keep a log; report the tokens currently spent.
+        return {
+            "requests_last_minute": int(round(minute_used)),
+            "requests_last_hour": int(round(hour_used)),
+            "total_rounds_with_updates": len(self.updates_per_round.get(client_id, {}))
+        }
+
+
+def get_rate_limiter(repo=None) -> RateLimiter:
+    """
+    Build the coordinator rate limiter.
+
+    RATE_LIMIT_ALGORITHM selects token_bucket (default) or sliding_window.
+    RATE_LIMIT_REDIS_URL puts either in Redis, shared by every replica.
+    Otherwise shared-state (SQL) deployments keep the timestamp-log limiter so
+    replicas agree.
+    """
+    algorithm = os.getenv("RATE_LIMIT_ALGORITHM", "token_bucket").strip().lower()
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL", "").strip()
+    if redis_url:
+        from .redis_rate_limiter import (
+            RedisSlidingWindowRateLimiter,
+            RedisTokenBucketRateLimiter,
+            redis_client_from_url,
+        )
+
+        client = redis_client_from_url(redis_url)
+        if algorithm == "token_bucket":
+            return RedisTokenBucketRateLimiter(client)
+        return RedisSlidingWindowRateLimiter(client)
+    if repo is None and algorithm == "token_bucket":
+        return TokenBucketRateLimiter()
+    return RateLimiter(repo=repo)
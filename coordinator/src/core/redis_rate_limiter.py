@@ -0,0 +1,268 @@
+"""
+Redis Rate Limiter Module
+
+Rate limiters whose counters live in Redis, so every coordinator replica
+enforces one global limit. Each request check and each per-round update check
+is a single Lua script run atomically on the server (no read-modify-write race
+between replicas), loaded once and then invoked by SHA. Sliding-window and
+token-bucket variants mirror the in-process RateLimiter and
+TokenBucketRateLimiter. Every call is a network round trip, so callers keep
+them off the event loop (see RateLimiter.blocking_io).
+"""
+
+import time
+import uuid
+from typing import Dict, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional backend
+    redis = None
+
+from .rate_limiter import RateLimiter
+
+KEY_PREFIX = "fl:ratelimit:"
+
+# Per-(client, round) update counters outlive any realistic round.
+UPDATE_COUNT_TTL_SECONDS = 86400
+
+# Per-(client, round) update count. Checks the limit and takes a slot in one
+# step, so two replicas cannot both read count == max - 1 and both accept.
+# Returns the new count, or -1 (count untouched) when the limit is reached.
+UPDATE_COUNT_LUA = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+if count >= tonumber(ARGV[1]) then
+    return -1
+end
+count = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return count
+"""
+
+
+# Sliding window over a sorted set of request timestamps (score = member time).
+# Drops entries older than an hour, refuses the request when the hour or the
+# last minute is full, otherwise records it. ARGV[5] == "1" records without
+# checking (record_request).
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - 3600)
+if ARGV[5] ~= '1' then
+    if redis.call('ZCARD', key) >= tonumber(ARGV[4]) then
+        return 2
+    end
+    if redis.call('ZCOUNT', key, '(' .. (now - 60), '+inf') >= tonumber(ARGV[3]) then
+        return 1
+    end
+end
+redis.call('ZADD', key, now, ARGV[2])
+redis.call('EXPIRE', key, 3600)
+return 0
+"""
+
+
+# Minute and hour token buckets in one hash per client (m, h, ts), refilled at
+# max/60 and max/3600 tokens per second like TokenBucketRateLimiter. ARGV[4]:
+# "check" spends a token if both buckets have one, "record" spends one
+# unconditionally, "peek" only reads. Returns {status, minute, hour} with the
+# token counts as strings (Lua numbers would be truncated to integers).
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local per_minute = tonumber(ARGV[2])
+local per_hour = tonumber(ARGV[3])
+local mode = ARGV[4]
+local b = redis.call('HMGET', key, 'm', 'h', 'ts')
+local m = tonumber(b[1]) or per_minute
+local h = tonumber(b[2]) or per_hour
+local ts = tonumber(b[3]) or now
+local elapsed = now - ts
+if elapsed > 0 then
+    m = math.min(per_minute, m + elapsed * per_minute / 60)
+    h = math.min(per_hour, h + elapsed * per_hour / 3600)
+    ts = now
+end
+local status = 0
+if mode == 'check' then
+    if h < 1 then
+        status = 2
+    elseif m < 1 then
+        status = 1
+    else
+        m = m - 1
+        h = h - 1
+    end
+elseif mode == 'record' then
+    m = math.max(0, m - 1)
+    h = math.max(0, h - 1)
+end
+if mode ~= 'peek' then
+    redis.call('HSET', key, 'm', m, 'h', h, 'ts', ts)
+    redis.call('EXPIRE', key, 3600)
+end
+return {status, tostring(m), tostring(h)}
+"""
+
+
+class RedisSlidingWindowRateLimiter(RateLimiter):
+    """
+    Sliding-window limits shared by all replicas through Redis.
+
+    Same limits and messages as RateLimiter: requests per minute and per hour
+    from a timestamp log (a sorted set per client), and updates per round from
+    a counter per (client, round). check_update_rate takes the update's slot
+    atomically, so record_update only keeps this replica's local tally; an
+    update that passes the limit but fails later validation still uses a slot.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_updates_per_round: int = 5,
+        max_requests_per_minute: int = 60,
+        max_requests_per_hour: int = 1000,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            client: redis.Redis client (decode_responses not required)
+        """
+        super().__init__(
+            max_updates_per_round=max_updates_per_round,
+            max_requests_per_minute=max_requests_per_minute,
+            max_requests_per_hour=max_requests_per_hour,
+        )
+        self.client = client
+        self._sliding_window = client.register_script(SLIDING_WINDOW_LUA)
+        self._update_count = client.register_script(UPDATE_COUNT_LUA)
+
+    @property
+    def blocking_io(self) -> bool:
+        return True
+
+    @staticmethod
+    def _request_key(client_id: str) -> str:
+        return f"{KEY_PREFIX}req:{client_id}"
+
+    @staticmethod
+    def _update_key(client_id: str, round_id: int) -> str:
+        return f"{KEY_PREFIX}upd:{client_id}:{round_id}"
+
+    def _run_window(self, client_id: str, now: float, record_only: bool) -> int:
+        return int(
+            self._sliding_window(
+                keys=[self._request_key(client_id)],
+                args=[
+                    now,
+                    f"{now}:{uuid.uuid4().hex}",
+                    self.max_requests_per_minute,
+                    self.max_requests_per_hour,
+                    "1" if record_only else "0",
+                ],
+            )
+        )
+
+    def check_request_rate(
+        self, client_id: str, now: Optional[float] = None
+    ) -> tuple[bool, Optional[str]]:
+        now = time.time() if now is None else now
+        result = self._run_window(client_id, now, record_only=False)
+        if result == 2:
+            return False, f"Client {client_id} exceeded max requests per hour ({self.max_requests_per_hour})"
+        if result == 1:
+            return False, f"Client {client_id} exceeded max requests per minute ({self.max_requests_per_minute})"
+        return True, None
+
+    def record_request(self, client_id: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._run_window(client_id, now, record_only=True)
+
+    def check_update_rate(self, client_id: str, round_id: int) -> tuple[bool, Optional[str]]:
+        count = int(
+            self._update_count(
+                keys=[self._update_key(client_id, round_id)],
+                args=[self.max_updates_per_round, UPDATE_COUNT_TTL_SECONDS],
+            )
+        )
+        if count < 0:
+            return False, f"Client {client_id} exceeded max updates per round ({self.max_updates_per_round})"
+        self.current_rounds.setdefault(round_id, set()).add(client_id)
+        return True, None
+
+    def record_update(self, client_id: str, round_id: int) -> None:
+        # The Redis count was taken by check_update_rate; this local tally only
+        # feeds get_client_stats on this replica.
+        super().record_update(client_id, round_id)
+
+    def reset_round(self, round_id: int) -> None:
+        client_ids = self.current_rounds.get(round_id)
+        if client_ids:
+            self.client.delete(*(self._update_key(c, round_id) for c in client_ids))
+        super().reset_round(round_id)
+
+    def get_client_stats(self, client_id: str, now: Optional[float] = None) -> Dict:
+        now = time.time() if now is None else now
+        key = self._request_key(client_id)
+        pipe = self.client.pipeline()
+        pipe.zcount(key, f"({now - 60}", "+inf")
+        pipe.zcount(key, f"({now - 3600}", "+inf")
+        requests_last_minute, requests_last_hour = pipe.execute()
+        return {
+            "requests_last_minute": int(requests_last_minute),
+            "requests_last_hour": int(requests_last_hour),
+            "total_rounds_with_updates": len(self.updates_per_round.get(client_id, {}))
+        }
+
+
+class RedisTokenBucketRateLimiter(RedisSlidingWindowRateLimiter):
+    """
+    Token-bucket request limits in Redis; per-round update counts as above.
+
+    /task polling only needs a rate, not an exact log: each client costs one
+    three-field hash instead of a sorted set with an entry per request.
+    """
+
+    def __init__(self, client, **limits):
+        super().__init__(client, **limits)
+        self._token_bucket = client.register_script(TOKEN_BUCKET_LUA)
+
+    def _run_bucket(self, client_id: str, now: float, mode: str) -> tuple:
+        status, minute_tokens, hour_tokens = self._token_bucket(
+            keys=[f"{KEY_PREFIX}bucket:{client_id}"],
+            args=[now, self.max_requests_per_minute, self.max_requests_per_hour, mode],
+        )
+        return int(status), float(minute_tokens), float(hour_tokens)
+
+    def check_request_rate(
+        self, client_id: str, now: Optional[float] = None
+    ) -> tuple[bool, Optional[str]]:
+        now = time.time() if now is None else now
+        status, _, _ = self._run_bucket(client_id, now, "check")
+        if status == 2:
+            return False, f"Client {client_id} exceeded max requests per hour ({self.max_requests_per_hour})"
+        if status == 1:
+            return False, f"Client {client_id} exceeded max requests per minute ({self.max_requests_per_minute})"
+        return True, None
+
+    def record_request(self, client_id: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._run_bucket(client_id, now, "record")
+
+    def get_client_stats(self, client_id: str, now: Optional[float] = None) -> Dict:
+        now = time.time() if now is None else now
+        _, minute_tokens, hour_tokens = self._run_bucket(client_id, now, "peek")
+        # Buckets do not keep a log; report the tokens currently spent.
+        return {
+            "requests_last_minute": int(round(self.max_requests_per_minute - minute_tokens)),
+            "requests_last_hour": int(round(self.max_requests_per_hour - hour_tokens)),
+            "total_rounds_with_updates": len(self.updates_per_round.get(client_id, {}))
+        }
+
+
+def redis_client_from_url(url: str):
+    """redis.Redis for url; raises RuntimeError when redis-py is not installed."""
+    if redis is None:
+        raise RuntimeError("RATE_LIMIT_REDIS_URL is set but the 'redis' package is not installed")
+    return redis.Redis.from_url(url)
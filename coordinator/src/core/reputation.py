@@ -5,15 +5,55 @@ Tracks client reliability and performance for federated learning.
 Provides reputation scores to guide task assignment and identify reliable clients.
 """
 
+import heapq
 import time
-from typing import Dict, Optional
+from operator import itemgetter
+from typing import Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 
 
-@dataclass
+def _score_from_rates(
+    completion_rate: float,
+    acceptance_rate: float,
+    dropout_rate: float,
+    average_latency: float,
+) -> float:
+    """Weighted reputation score (0-1) from already-derived rates."""
+    # Completion rate (higher is better)
+    completion_weight = 0.4
+    completion_score = completion_rate
+    
+    # Acceptance rate (higher is better)
+    acceptance_weight = 0.3
+    acceptance_score = acceptance_rate
+    
+    # Dropout rate (lower is better)
+    dropout_weight = 0.2
+    dropout_score = 1.0 - dropout_rate
+    
+    # Latency (lower is better, normalized)
+    latency_weight = 0.1
+    # Normalize latency: assume max reasonable latency is 60 seconds
+    max_latency = 60.0
+    normalized_latency = min(1.0, max(0.0, 1.0 - (average_latency / max_latency)))
+    latency_score = normalized_latency
+    
+    # Weighted sum
+    score = (
+        completion_score * completion_weight +
+        acceptance_score * acceptance_weight +
+        dropout_score * dropout_weight +
+        latency_score * latency_weight
+    )
+    
+    # Ensure score is in [0, 1]
+    return max(0.0, min(1.0, score))
+
+
+@dataclass(slots=True)
 class ClientReputation:
-    """Reputation data for a single client."""
+    """Reputation data for a single client (slotted: one record per client)."""
     client_id: str
     
     # Participation metrics
@@ -78,51 +118,34 @@ class ClientReputation:
         - Low dropout rate (20%)
         - Low latency (10% - inverse)
         """
-        # Completion rate (higher is better)
-        completion_weight = 0.4
-        completion_score = self.completion_rate
-        
-        # Acceptance rate (higher is better)
-        acceptance_weight = 0.3
-        acceptance_score = self.acceptance_rate
-        
-        # Dropout rate (lower is better)
-        dropout_weight = 0.2
-        dropout_score = 1.0 - self.dropout_rate
-        
-        # Latency (lower is better, normalized)
-        latency_weight = 0.1
-        # Normalize latency: assume max reasonable latency is 60 seconds
-        max_latency = 60.0
-        normalized_latency = min(1.0, max(0.0, 1.0 - (self.average_latency / max_latency)))
-        latency_score = normalized_latency
-        
-        # Weighted sum
-        score = (
-            completion_score * completion_weight +
-            acceptance_score * acceptance_weight +
-            dropout_score * dropout_weight +
-            latency_score * latency_weight
+        return _score_from_rates(
+            self.completion_rate,
+            self.acceptance_rate,
+            self.dropout_rate,
+            self.average_latency,
         )
-        
-        # Ensure score is in [0, 1]
-        return max(0.0, min(1.0, score))
     
     def to_dict(self) -> Dict:
-        """Convert reputation to dictionary."""
+        """Convert reputation to dictionary (each derived rate computed once)."""
+        completion_rate = self.completion_rate
+        acceptance_rate = self.acceptance_rate
+        dropout_rate = self.dropout_rate
+        average_latency = self.average_latency
         return {
             "client_id": self.client_id,
-            "reputation_score": self.reputation_score,
+            "reputation_score": _score_from_rates(
+                completion_rate, acceptance_rate, dropout_rate, average_latency
+            ),
             "rounds_participated": self.rounds_participated,
             "rounds_completed": self.rounds_completed,
             "rounds_dropped": self.rounds_dropped,
-            "completion_rate": self.completion_rate,
+            "completion_rate": completion_rate,
             "updates_submitted": self.updates_submitted,
             "updates_accepted": self.updates_accepted,
             "updates_rejected": self.updates_rejected,
-            "acceptance_rate": self.acceptance_rate,
-            "dropout_rate": self.dropout_rate,
-            "average_latency_seconds": self.average_latency,
+            "acceptance_rate": acceptance_rate,
+            "dropout_rate": dropout_rate,
+            "average_latency_seconds": average_latency,
             "first_seen": self.first_seen,
             "last_seen": self.last_seen
         }
@@ -152,19 +175,23 @@ class ReputationManager:
             return
         for data in self.repo.list_all():
             client_id = data["client_id"]
-            self.reputations[client_id] = ClientReputation(
-                client_id=client_id,
-                rounds_participated=int(data.get("rounds_participated", 0)),
-                rounds_completed=int(data.get("rounds_completed", 0)),
-                rounds_dropped=int(data.get("rounds_dropped", 0)),
-                updates_submitted=int(data.get("updates_submitted", 0)),
-                updates_accepted=int(data.get("updates_accepted", 0)),
-                updates_rejected=int(data.get("updates_rejected", 0)),
-                total_latency_seconds=float(data.get("total_latency_seconds", 0.0)),
-                latency_samples=int(data.get("latency_samples", 0)),
-                first_seen=data.get("first_seen"),
-                last_seen=data.get("last_seen"),
-            )
+            # Reloads happen on every read under shared state; update the
+            # existing record in place rather than allocating a new one.
+            rep = self.reputations.get(client_id)
+            if rep is None:
+                rep = ClientReputation(client_id=client_id)
+                self.reputations[client_id] = rep
+            rep.rounds_participated = int(data.get("rounds_participated", 0))
+            rep.rounds_completed = int(data.get("rounds_completed", 0))
+            rep.rounds_dropped = int(data.get("rounds_dropped", 0))
+            rep.updates_submitted = int(data.get("updates_submitted", 0))
+            rep.updates_accepted = int(data.get("updates_accepted", 0))
+            rep.updates_rejected = int(data.get("updates_rejected", 0))
+            rep.total_latency_seconds = float(data.get("total_latency_seconds", 0.0))
+            rep.latency_samples = int(data.get("latency_samples", 0))
+            rep.first_seen = data.get("first_seen")
+            rep.last_seen = data.get("last_seen")
+            # Swapped whole, like Round containers: readers never see it emptied.
             self.client_rounds[client_id] = set(data.get("client_rounds") or [])
 
     def _persist(self, client_id: str) -> None:
@@ -188,6 +215,15 @@ class ReputationManager:
             client_rounds=sorted(self.client_rounds.get(client_id, set())),
         )
     
+    def _touch(self, client_id: str, now: float) -> ClientReputation:
+        """Return the client's record (created on first sight) with last_seen bumped."""
+        rep = self.reputations.get(client_id)
+        if rep is None:
+            rep = ClientReputation(client_id=client_id, first_seen=now)
+            self.reputations[client_id] = rep
+        rep.last_seen = now
+        return rep
+
     def register_client(self, client_id: str) -> None:
         """
         Register a new client or update last seen time.
@@ -195,13 +231,7 @@ class ReputationManager:
         Args:
             client_id: Identifier of the client
         """
-        if client_id not in self.reputations:
-            self.reputations[client_id] = ClientReputation(
-                client_id=client_id,
-                first_seen=time.time()
-            )
-        
-        self.reputations[client_id].last_seen = time.time()
+        self._touch(client_id, time.time())
         self._persist(client_id)
     
     def record_round_participation(self, client_id: str, round_id: int) -> None:
@@ -212,8 +242,7 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        self.reputations[client_id].rounds_participated += 1
+        self._touch(client_id, time.time()).rounds_participated += 1
         self.client_rounds[client_id].add(round_id)
         self._persist(client_id)
     
@@ -234,14 +263,15 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        self.reputations[client_id].updates_submitted += 1
+        now = time.time()
+        rep = self._touch(client_id, now)
+        rep.updates_submitted += 1
         
         # Calculate latency if round start time is known
-        if round_id in self.round_start_times:
-            latency = time.time() - self.round_start_times[round_id]
-            self.reputations[client_id].total_latency_seconds += latency
-            self.reputations[client_id].latency_samples += 1
+        started = self.round_start_times.get(round_id)
+        if started is not None:
+            rep.total_latency_seconds += now - started
+            rep.latency_samples += 1
         self._persist(client_id)
     
     def record_update_accepted(self, client_id: str, round_id: int) -> None:
@@ -252,10 +282,33 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        self.reputations[client_id].updates_accepted += 1
+        self._touch(client_id, time.time()).updates_accepted += 1
         self._persist(client_id)
     
+    def record_updates_accepted(self, updates: Iterable[Tuple[str, int]]) -> None:
+        """
+        Record a batch of submitted-and-accepted updates.
+
+        Same counters as record_update_submitted followed by record_update_accepted,
+        but each client is persisted once per batch instead of twice per update.
+
+        Args:
+            updates: (client_id, round_id) pairs
+        """
+        now = time.time()
+        touched = []
+        for client_id, round_id in updates:
+            rep = self._touch(client_id, now)
+            rep.updates_submitted += 1
+            rep.updates_accepted += 1
+            started = self.round_start_times.get(round_id)
+            if started is not None:
+                rep.total_latency_seconds += now - started
+                rep.latency_samples += 1
+            touched.append(client_id)
+        for client_id in dict.fromkeys(touched):
+            self._persist(client_id)
+
     def record_update_rejected(self, client_id: str, round_id: int) -> None:
         """
         Record that a client's update was rejected.
@@ -264,8 +317,7 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        self.reputations[client_id].updates_rejected += 1
+        self._touch(client_id, time.time()).updates_rejected += 1
         self._persist(client_id)
     
     def record_round_completion(self, client_id: str, round_id: int) -> None:
@@ -276,10 +328,10 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        if round_id in self.client_rounds[client_id]:
-            self.reputations[client_id].rounds_completed += 1
-            self._persist(client_id)
+        rep = self._touch(client_id, time.time())
+        if round_id in self.client_rounds.get(client_id, ()):
+            rep.rounds_completed += 1
+        self._persist(client_id)
     
     def record_round_dropout(self, client_id: str, round_id: int) -> None:
         """
@@ -289,10 +341,10 @@ class ReputationManager:
             client_id: Identifier of the client
             round_id: Identifier of the round
         """
-        self.register_client(client_id)
-        if round_id in self.client_rounds[client_id]:
-            self.reputations[client_id].rounds_dropped += 1
-            self._persist(client_id)
+        rep = self._touch(client_id, time.time())
+        if round_id in self.client_rounds.get(client_id, ()):
+            rep.rounds_dropped += 1
+        self._persist(client_id)
     
     def get_reputation(self, client_id: str) -> Optional[ClientReputation]:
         if self.repo is not None:
@@ -325,10 +377,13 @@ class ReputationManager:
         Returns:
             List of (client_id, score) tuples, sorted by score (descending)
         """
-        scores = [
-            (client_id, rep.reputation_score)
-            for client_id, rep in self.reputations.items()
-        ]
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:n]
+        # Partial selection: O(C log n) instead of sorting every client.
+        return heapq.nlargest(
+            n,
+            (
+                (client_id, rep.reputation_score)
+                for client_id, rep in self.reputations.items()
+            ),
+            key=itemgetter(1),
+        )
 
@@ -0,0 +1,74 @@
+"""
+Response Cache Module
+
+Short-lived cache of encoded response bodies for read endpoints that clients
+poll (round status, reputation, incentives). Within the TTL, repeated requests
+reuse one snapshot instead of re-reading state and re-encoding it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache mapping a request key (e.g. the path) to response bytes.
+
+    Entries expire after ttl_seconds; writers that change the underlying state
+    call clear() so readers never wait out the TTL after a known change.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 0.5,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry (<= 0 disables caching)
+            max_entries: Oldest entries are evicted beyond this size
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store body for key for one TTL."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry (call after state the cached endpoints expose changes)."""
+        with self._lock:
+            self._entries.clear()
@@ -8,7 +8,9 @@ Classic rounds are persisted via an optional RoundRepository (JSON or SQL).
 from enum import Enum
 from typing import Dict, Set, Optional, Any
 from dataclasses import dataclass, field
+import logging
 import os
+import threading
 
 from utils.logger import get_logger
 
@@ -28,15 +30,11 @@ def _async_min_updates() -> int:
 
 def _round_still_accepts_clients(round_obj: "Round") -> bool:
     """True if more clients may join this COLLECTING/OPEN round."""
-    n_updates = len(round_obj.updates_received)
-    n_assigned = len(round_obj.assigned_clients)
     if _async_rounds_enabled():
         # Keep the round open until async min-updates (or max duration elsewhere).
-        return n_updates < _async_min_updates()
+        return len(round_obj.updates_received) < _async_min_updates()
     # Sync: close join once every assigned client has submitted.
-    if n_assigned == 0:
-        return True
-    return n_updates < n_assigned
+    return not round_obj.is_complete
 
 
 class RoundState(Enum):
@@ -47,6 +45,15 @@ class RoundState(Enum):
     CLOSED = "CLOSED"
 
 
+# Module-level state groups: membership tests allocate nothing per call.
+JOINABLE_STATES = frozenset({RoundState.OPEN, RoundState.COLLECTING})
+UPDATABLE_STATES = frozenset({RoundState.COLLECTING, RoundState.AGGREGATING})
+ACTIVE_STATES = frozenset(
+    {RoundState.OPEN, RoundState.COLLECTING, RoundState.AGGREGATING}
+)
+AGGREGATION_STARTED_STATES = frozenset({RoundState.AGGREGATING, RoundState.CLOSED})
+
+
 @dataclass
 class Round:
     """Represents a federated learning round."""
@@ -57,16 +64,28 @@ class Round:
     updates_received: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def is_complete(self) -> bool:
+        """Every assigned client has submitted (and at least one was assigned)."""
+        n_assigned = len(self.assigned_clients)
+        return n_assigned > 0 and len(self.updates_received) >= n_assigned
+
 
 class RoundManager:
     """
     Manages rounds and client registrations for federated learning.
     
     Tracks registered clients, rounds, and their states.
+
+    Task assignment, update recording and aggregation run on different worker
+    threads. ``lock`` guards rounds, clients and client_round_assignments; the
+    public methods take it, and the Aggregator holds it (re-entrantly) for its
+    pending updates and whole aggregations.
     """
     
     def __init__(self, state_store=None, round_repo=None):
         """Initialize the round manager."""
+        self.lock = threading.RLock()
         self.state_store = state_store
         self.round_repo = round_repo
         self.clients: Set[str] = set()
@@ -107,14 +126,17 @@ class RoundManager:
             state = RoundState(rec.state)
         except ValueError:
             state = RoundState.CLOSED
-        round_obj = Round(
-            round_id=rec.round_id,
-            model_version=rec.model_version or "v1",
-            state=state,
-            assigned_clients=set(rec.assigned_clients or []),
-            updates_received=set(rec.updates_received or []),
-            metadata=dict(rec.metadata or {}),
-        )
+        round_obj = self.rounds.get(rec.round_id)
+        if round_obj is None:
+            round_obj = Round(round_id=rec.round_id, model_version=rec.model_version or "v1")
+        # Refreshes run on most requests; reuse the live Round instance. Its
+        # containers are swapped for fully built ones rather than cleared and
+        # refilled, so a reader never sees a half-empty set.
+        round_obj.model_version = rec.model_version or "v1"
+        round_obj.state = state
+        round_obj.assigned_clients = set(rec.assigned_clients or [])
+        round_obj.updates_received = set(rec.updates_received or [])
+        round_obj.metadata = dict(rec.metadata or {})
         # Only on boot restore: incomplete AGGREGATING → COLLECTING for reconcile.
         if (
             crash_recover
@@ -125,11 +147,7 @@ class RoundManager:
             round_obj.metadata["resume_after_crash"] = True
         self.rounds[rec.round_id] = round_obj
         self.next_round_id = max(self.next_round_id, rec.round_id + 1)
-        if round_obj.state in {
-            RoundState.OPEN,
-            RoundState.COLLECTING,
-            RoundState.AGGREGATING,
-        }:
+        if round_obj.state in ACTIVE_STATES:
             for client_id in round_obj.assigned_clients:
                 if client_id not in round_obj.updates_received:
                     self.client_round_assignments[client_id] = rec.round_id
@@ -137,27 +155,29 @@ class RoundManager:
 
     def refresh_round(self, round_id: int) -> Optional[Round]:
         """Reload a round from the durable repository (multi-replica SoT)."""
-        if not self.round_repo:
-            return self.rounds.get(round_id)
-        try:
-            rec = self.round_repo.get_round(round_id)
-        except Exception as exc:
-            logger.warning(f"Failed to refresh round {round_id}: {exc}")
-            return self.rounds.get(round_id)
-        if rec is None:
-            return self.rounds.get(round_id)
-        return self._apply_record(rec)
+        with self.lock:
+            if not self.round_repo:
+                return self.rounds.get(round_id)
+            try:
+                rec = self.round_repo.get_round(round_id)
+            except Exception as exc:
+                logger.warning(f"Failed to refresh round {round_id}: {exc}")
+                return self.rounds.get(round_id)
+            if rec is None:
+                return self.rounds.get(round_id)
+            return self._apply_record(rec)
 
     def refresh_all_rounds(self) -> None:
-        if not self.round_repo:
-            return
-        try:
-            records = self.round_repo.list_rounds(limit=10_000)
-        except Exception as exc:
-            logger.warning(f"Failed to refresh rounds: {exc}")
-            return
-        for rec in records:
-            self._apply_record(rec)
+        with self.lock:
+            if not self.round_repo:
+                return
+            try:
+                records = self.round_repo.list_rounds(limit=10_000)
+            except Exception as exc:
+                logger.warning(f"Failed to refresh rounds: {exc}")
+                return
+            for rec in records:
+                self._apply_record(rec)
 
     def try_begin_aggregating(self, round_id: int) -> bool:
         """
@@ -168,22 +188,23 @@ class RoundManager:
         """
         from persistence.shared_state import shared_state_enabled
 
-        if shared_state_enabled() and self.round_repo is not None:
-            try:
-                from persistence.ha_repos import try_transition_round_aggregating
+        with self.lock:
+            if shared_state_enabled() and self.round_repo is not None:
+                try:
+                    from persistence.ha_repos import try_transition_round_aggregating
 
-                ok, _state = try_transition_round_aggregating(round_id)
-                self.refresh_round(round_id)
-                return bool(ok)
-            except Exception as exc:
-                logger.warning(f"Aggregate lock failed, falling back local: {exc}")
+                    ok, _state = try_transition_round_aggregating(round_id)
+                    self.refresh_round(round_id)
+                    return bool(ok)
+                except Exception as exc:
+                    logger.warning(f"Aggregate lock failed, falling back local: {exc}")
 
-        round_obj = self.refresh_round(round_id) or self.rounds.get(round_id)
-        if round_obj is None:
-            return False
-        if round_obj.state in (RoundState.AGGREGATING, RoundState.CLOSED):
-            return round_obj.state == RoundState.AGGREGATING
-        return self.set_round_state(round_id, RoundState.AGGREGATING)
+            round_obj = self.refresh_round(round_id) or self.rounds.get(round_id)
+            if round_obj is None:
+                return False
+            if round_obj.state in AGGREGATION_STARTED_STATES:
+                return round_obj.state == RoundState.AGGREGATING
+            return self.set_round_state(round_id, RoundState.AGGREGATING)
 
     def _restore_rounds(self) -> None:
         try:
@@ -213,23 +234,22 @@ class RoundManager:
         Returns:
             True if client was newly registered, False if already exists
         """
-        if client_name in self.clients:
-            logger.warning(f"Client {client_name} already registered", extra={
-                "component": "coordinator",
-                "event": "client_registration_failed",
-                "client_id": client_name
-            })
-            return False
-        self.clients.add(client_name)
-        if self.state_store:
-            # Auth store also tracks clients; keep next_round_id durable
-            self.state_store.set_next_round_id(self.next_round_id)
-        logger.info(f"Client {client_name} registered", extra={
-            "component": "coordinator",
-            "event": "client_registered",
-            "client_id": client_name
-        })
-        return True
+        with self.lock:
+            if client_name in self.clients:
+                logger.warning(f"Client {client_name} already registered", extra={
+                    "component": "coordinator",
+                    "event": "client_registration_failed",
+                    "client_id": client_name
+                })
+                return False
+            self.clients.add(client_name)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Client {client_name} registered", extra={
+                    "component": "coordinator",
+                    "event": "client_registered",
+                    "client_id": client_name
+                })
+            return True
     
     def assign_client_to_round(self, client_id: str, model_version: str) -> Optional[int]:
         """
@@ -242,67 +262,67 @@ class RoundManager:
         Returns:
             Round ID if assignment successful, None otherwise
         """
-        self.refresh_all_rounds()
-        if client_id not in self.clients:
-            return None
+        with self.lock:
+            self.refresh_all_rounds()
+            if client_id not in self.clients:
+                return None
         
-        # Check if client is already assigned to an active round
-        if client_id in self.client_round_assignments:
-            assigned_round_id = self.client_round_assignments[client_id]
-            assigned_round = self.rounds.get(assigned_round_id)
-            if assigned_round:
-                if client_id in assigned_round.updates_received:
-                    # Already contributed — free them for the next open round.
-                    del self.client_round_assignments[client_id]
-                elif assigned_round.state in [RoundState.OPEN, RoundState.COLLECTING]:
-                    if assigned_round.model_version == model_version:
-                        return None
-                    del self.client_round_assignments[client_id]
+            # Client still owes an update to an active round of this version.
+            assigned_round = self.rounds.get(self.client_round_assignments.get(client_id))
+            if (
+                assigned_round is not None
+                and assigned_round.model_version == model_version
+                and assigned_round.state in JOINABLE_STATES
+                and client_id not in assigned_round.updates_received
+            ):
+                return None
         
-        # Find or create an active round with matching model version
-        active_round = None
-        for round_id, round_obj in self.rounds.items():
-            if round_obj.state in [RoundState.OPEN, RoundState.COLLECTING]:
-                if round_obj.model_version != model_version:
-                    continue
-                if not _round_still_accepts_clients(round_obj):
-                    continue
-                # Don't re-join a round this client already updated.
-                if client_id in round_obj.updates_received:
-                    continue
-                active_round = round_obj
-                break
+            # Find or create an active round with matching model version
+            active_round = None
+            for round_id, round_obj in self.rounds.items():
+                if round_obj.state in JOINABLE_STATES:
+                    if round_obj.model_version != model_version:
+                        continue
+                    if not _round_still_accepts_clients(round_obj):
+                        continue
+                    # Don't re-join a round this client already updated.
+                    if client_id in round_obj.updates_received:
+                        continue
+                    active_round = round_obj
+                    break
         
-        if active_round is None:
-            # Create new round with specified model version
-            active_round = Round(round_id=self.next_round_id, model_version=model_version)
-            self.rounds[self.next_round_id] = active_round
-            logger.info(f"Round {self.next_round_id} started", extra={
-                "component": "coordinator",
-                "event": "round_started",
-                "round_id": self.next_round_id,
-                "model_version": model_version
-            })
-            self.next_round_id += 1
-            if self.state_store:
-                self.state_store.set_next_round_id(self.next_round_id)
+            if active_round is None:
+                # Create new round with specified model version
+                new_round_id = self.next_round_id
+                self.next_round_id = new_round_id + 1
+                if self.state_store:
+                    self.state_store.set_next_round_id(self.next_round_id)
+                active_round = Round(round_id=new_round_id, model_version=model_version)
+                self.rounds[new_round_id] = active_round
+                logger.info(f"Round {new_round_id} started", extra={
+                    "component": "coordinator",
+                    "event": "round_started",
+                    "round_id": new_round_id,
+                    "model_version": model_version
+                })
         
-        active_round.assigned_clients.add(client_id)
-        self.client_round_assignments[client_id] = active_round.round_id
+            active_round.assigned_clients.add(client_id)
+            self.client_round_assignments[client_id] = active_round.round_id
         
-        logger.info(f"Client {client_id} assigned to round {active_round.round_id}", extra={
-            "component": "coordinator",
-            "event": "client_assigned",
-            "round_id": active_round.round_id,
-            "client_id": client_id,
-            "model_version": model_version
-        })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Client {client_id} assigned to round {active_round.round_id}", extra={
+                    "component": "coordinator",
+                    "event": "client_assigned",
+                    "round_id": active_round.round_id,
+                    "client_id": client_id,
+                    "model_version": model_version
+                })
         
-        if active_round.state == RoundState.OPEN:
-            active_round.state = RoundState.COLLECTING
+            if active_round.state == RoundState.OPEN:
+                active_round.state = RoundState.COLLECTING
 
-        self._persist_round(active_round)
-        return active_round.round_id
+            self._persist_round(active_round)
+            return active_round.round_id
     
     def validate_update(self, client_id: str, round_id: int) -> bool:
         """
@@ -315,21 +335,22 @@ class RoundManager:
         Returns:
             True if update is valid, False otherwise
         """
-        self.refresh_round(round_id)
-        if client_id not in self.clients:
-            return False
+        with self.lock:
+            self.refresh_round(round_id)
+            if client_id not in self.clients:
+                return False
         
-        round_obj = self.rounds.get(round_id)
-        if round_obj is None:
-            return False
+            round_obj = self.rounds.get(round_id)
+            if round_obj is None:
+                return False
         
-        if client_id not in round_obj.assigned_clients:
-            return False
+            if client_id not in round_obj.assigned_clients:
+                return False
         
-        if round_obj.state not in [RoundState.COLLECTING, RoundState.AGGREGATING]:
-            return False
+            if round_obj.state not in UPDATABLE_STATES:
+                return False
         
-        return True
+            return True
     
     def add_update(self, client_id: str, round_id: int, weight_delta: str) -> bool:
         """
@@ -343,22 +364,29 @@ class RoundManager:
         Returns:
             True if update was recorded, False otherwise
         """
-        if not self.validate_update(client_id, round_id):
-            return False
+        with self.lock:
+            if not self.validate_update(client_id, round_id):
+                return False
         
-        round_obj = self.rounds[round_id]
-        round_obj.updates_received.add(client_id)
+            round_obj = self.rounds[round_id]
+            round_obj.updates_received.add(client_id)
+            if self.client_round_assignments.get(client_id) == round_id:
+                del self.client_round_assignments[client_id]
         
-        logger.info(f"Update received from client {client_id} for round {round_id}", extra={
-            "component": "coordinator",
-            "event": "update_received",
-            "round_id": round_id,
-            "client_id": client_id,
-            "update_size_bytes": len(weight_delta.encode('utf-8'))
-        })
-
-        self._persist_round(round_obj)
-        return True
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Update received from client {client_id} for round {round_id}", extra={
+                    "component": "coordinator",
+                    "event": "update_received",
+                    "round_id": round_id,
+                    "client_id": client_id,
+                    # JSON text is normally ASCII: skip encoding a multi-MB copy.
+                    "update_size_bytes": (
+                        len(weight_delta) if weight_delta.isascii() else len(weight_delta.encode("utf-8"))
+                    ),
+                })
+
+            self._persist_round(round_obj)
+            return True
     
     def get_round_status(self, round_id: int) -> Optional[Dict]:
         """
@@ -370,21 +398,22 @@ class RoundManager:
         Returns:
             Dictionary with round status information, None if round doesn't exist
         """
-        round_obj = self.refresh_round(round_id) or self.rounds.get(round_id)
-        if round_obj is None:
-            return None
+        with self.lock:
+            round_obj = self.refresh_round(round_id) or self.rounds.get(round_id)
+            if round_obj is None:
+                return None
         
-        return {
-            "round_id": round_obj.round_id,
-            "model_version": round_obj.model_version,
-            "state": round_obj.state.value,
-            "assigned_clients": list(round_obj.assigned_clients),
-            "updates_received": list(round_obj.updates_received),
-            "total_clients": len(round_obj.assigned_clients),
-            "total_updates": len(round_obj.updates_received),
-            "published_version": (round_obj.metadata or {}).get("published_version"),
-            "metadata": dict(round_obj.metadata or {}),
-        }
+            return {
+                "round_id": round_obj.round_id,
+                "model_version": round_obj.model_version,
+                "state": round_obj.state.value,
+                "assigned_clients": list(round_obj.assigned_clients),
+                "updates_received": list(round_obj.updates_received),
+                "total_clients": len(round_obj.assigned_clients),
+                "total_updates": len(round_obj.updates_received),
+                "published_version": (round_obj.metadata or {}).get("published_version"),
+                "metadata": dict(round_obj.metadata or {}),
+            }
     
     def set_round_state(self, round_id: int, state: RoundState) -> bool:
         """
@@ -397,24 +426,30 @@ class RoundManager:
         Returns:
             True if state was updated, False otherwise
         """
-        round_obj = self.rounds.get(round_id)
-        if round_obj is None:
-            return False
+        with self.lock:
+            round_obj = self.rounds.get(round_id)
+            if round_obj is None:
+                return False
         
-        old_state = round_obj.state
-        round_obj.state = state
+            old_state = round_obj.state
+            round_obj.state = state
+            if state == RoundState.CLOSED:
+                # Closed rounds can no longer hold a client's assignment.
+                for client_id in round_obj.assigned_clients:
+                    if self.client_round_assignments.get(client_id) == round_id:
+                        del self.client_round_assignments[client_id]
         
-        # Log round completion
-        if state == RoundState.CLOSED:
-            logger.info(f"Round {round_id} completed", extra={
-                "component": "coordinator",
-                "event": "round_completed",
-                "round_id": round_id,
-                "model_version": round_obj.model_version,
-                "total_clients": len(round_obj.assigned_clients),
-                "total_updates": len(round_obj.updates_received)
-            })
-
-        self._persist_round(round_obj)
-        return True
+            # Log round completion
+            if state == RoundState.CLOSED:
+                logger.info(f"Round {round_id} completed", extra={
+                    "component": "coordinator",
+                    "event": "round_completed",
+                    "round_id": round_id,
+                    "model_version": round_obj.model_version,
+                    "total_clients": len(round_obj.assigned_clients),
+                    "total_updates": len(round_obj.updates_received)
+                })
+
+            self._persist_round(round_obj)
+            return True
 
@@ -0,0 +1,158 @@
+"""
+Update Batcher Module
+
+Coalesces concurrent /update submissions so the aggregator checkpoints pending
+updates once per batch instead of once per request, and bookkeeping for the
+accepted ones (metrics, reputation) is written once per batch as well.
+"""
+
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from utils.logger import get_logger
+
+from .aggregator import Aggregator
+
+logger = get_logger("update_batcher")
+
+
+class UpdateBatcher:
+    """
+    Gathers validated updates for a short window and hands them to the aggregator in bulk.
+
+    Every pending-update checkpoint rewrites all buffered payloads, so under
+    concurrent load one checkpoint per batch replaces one per request. Runs on
+    the event loop; a batch is flushed when it is full or max_wait_ms elapses and
+    recorded in the threadpool, one batch at a time and in arrival order.
+    Callers take a slot with ``try_reserve`` before validating an update and
+    hold it until the update is recorded, so updates being validated and
+    updates waiting for their batch together stay within max_queued when the
+    aggregator falls behind.
+    """
+
+    def __init__(
+        self,
+        aggregator: Aggregator,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 50.0,
+        max_queued: int = 10_000,
+        on_accepted: Optional[Callable[[List[Tuple[str, int]]], None]] = None,
+    ):
+        """
+        Initialize the update batcher.
+
+        Args:
+            aggregator: Aggregator that receives the batched updates
+            max_batch_size: Flush as soon as this many updates are waiting
+            max_wait_ms: Longest time an update waits for others (0 = no batching)
+            max_queued: is_full once this many updates hold a slot or await their verdict
+            on_accepted: Called on the event loop with the (client_id, round_id) pairs
+                the aggregator accepted, before any submitter is resumed
+        """
+        self.aggregator = aggregator
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.max_queued = max(1, max_queued)
+        self._queued = 0
+        self.on_accepted = on_accepted
+        self._pending: List[Tuple[str, int, str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._record_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def queued(self) -> int:
+        """Reserved slots plus submitted updates still waiting for their batch."""
+        return self._queued
+
+    @property
+    def is_full(self) -> bool:
+        """True when max_queued slots are taken; new updates should be refused."""
+        return self._queued >= self.max_queued
+
+    def try_reserve(self) -> bool:
+        """
+        Take a slot for an update about to be validated; False when full.
+
+        A caller that gets True must call release() once the update has been
+        rejected or its submit(..., reserved=True) has returned.
+        """
+        if self._queued >= self.max_queued:
+            return False
+        self._queued += 1
+        return True
+
+    def release(self) -> None:
+        """Give back a slot taken by try_reserve."""
+        self._queued -= 1
+
+    async def submit(
+        self, client_id: str, round_id: int, weight_delta: str, reserved: bool = False
+    ) -> bool:
+        """
+        Queue an update and wait for its batch to be recorded.
+
+        Args:
+            reserved: The caller already holds a try_reserve slot for this update
+
+        Returns:
+            True if the aggregator accepted the update, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((client_id, round_id, weight_delta, future))
+        if len(self._pending) >= self.max_batch_size or self.max_wait_ms == 0:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000.0, self.flush)
+        if reserved:
+            return await future
+        self._queued += 1
+        try:
+            return await future
+        finally:
+            self._queued -= 1
+
+    def flush(self) -> None:
+        """Submit everything queued so far as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._record(batch))
+
+    async def _record(self, batch: List[Tuple[str, int, str, asyncio.Future]]) -> None:
+        if self._record_lock is None:
+            self._record_lock = asyncio.Lock()
+        # Checkpointing writes the pending-update file; keep it off the event
+        # loop but never run two batches against the aggregator at once.
+        async with self._record_lock:
+            try:
+                results = await run_in_threadpool(
+                    self.aggregator.submit_updates_bulk,
+                    [(client_id, round_id, weight_delta) for client_id, round_id, weight_delta, _ in batch],
+                )
+            except Exception as exc:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+        if self.on_accepted is not None:
+            accepted_updates = [
+                (client_id, round_id)
+                for (client_id, round_id, _, _), accepted in zip(batch, results)
+                if accepted
+            ]
+            if accepted_updates:
+                try:
+                    self.on_accepted(accepted_updates)
+                except Exception as exc:  # noqa: BLE001 - updates are already recorded
+                    logger.error(
+                        f"Recording {len(accepted_updates)} accepted update(s) failed: {exc}",
+                        extra={"component": "coordinator", "event": "update_bookkeeping_failed"},
+                    )
+        for (*_, future), accepted in zip(batch, results):
+            if not future.done():
+                future.set_result(accepted)
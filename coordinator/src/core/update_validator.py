@@ -6,16 +6,67 @@ Includes security checks: authentication, rate limiting, and value validation.
 """
 
 import json
-import math
-from typing import Optional, Tuple
+import logging
+import os
+from typing import Any, Optional, Tuple
 from .round_manager import RoundManager
 from .auth import AuthManager
 from .rate_limiter import RateLimiter
 from .privacy import PrivacyProtector
+from .quantization import RESERVED_KEYS
 from utils.logger import get_logger
 
 logger = get_logger("update_validator")
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+
+def _decode_update_payload(raw: str) -> Any:
+    """Parse a whole JSON update payload (every key, untyped)."""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError:
+            # NaN/Infinity literals are accepted only by the stdlib parser.
+            pass
+    return json.loads(raw)
+
+
+def _utf8_size_exceeds(text: str, limit: int) -> bool:
+    """True if text is more than limit bytes as UTF-8, encoding only when needed."""
+    if len(text) > limit:
+        return True  # every character is at least one byte
+    if len(text) * 4 <= limit or text.isascii():
+        return False  # at most four bytes per character / exactly one
+    return len(text.encode("utf-8", "surrogatepass")) > limit
+
+
+def _reject(
+    message: str,
+    round_id: int,
+    client_id: str,
+    reason: str,
+    details: Optional[str] = None,
+) -> Tuple[bool, str]:
+    """Log an update rejection and return the (False, reason) result."""
+    # Rejections are the hot path under abusive traffic; skip building the
+    # structured extras when WARNING is filtered out.
+    if logger.isEnabledFor(logging.WARNING):
+        extra = {
+            "component": "coordinator",
+            "event": "update_rejected",
+            "round_id": round_id,
+            "client_id": client_id,
+            "reason": reason,
+        }
+        if details is not None:
+            extra["details"] = details
+        logger.warning(message, extra=extra)
+    return False, reason
+
 
 class UpdateValidator:
     """
@@ -29,7 +80,8 @@ class UpdateValidator:
         round_manager: RoundManager,
         auth_manager: Optional[AuthManager] = None,
         rate_limiter: Optional[RateLimiter] = None,
-        privacy_protector: Optional[PrivacyProtector] = None
+        privacy_protector: Optional[PrivacyProtector] = None,
+        max_delta_bytes: Optional[int] = None
     ):
         """
         Initialize the update validator.
@@ -39,11 +91,14 @@ class UpdateValidator:
             auth_manager: Optional authentication manager
             rate_limiter: Optional rate limiter
             privacy_protector: Optional privacy protector
+            max_delta_bytes: Largest weight_delta (UTF-8 bytes) accepted before parsing
+                (defaults to MAX_UPDATE_BYTES)
         """
         self.round_manager = round_manager
         self.auth_manager = auth_manager
         self.rate_limiter = rate_limiter
         self.privacy_protector = privacy_protector or PrivacyProtector()
+        self.max_delta_bytes = max_delta_bytes or int(os.getenv("MAX_UPDATE_BYTES", "25000000"))
     
     def validate(
         self,
@@ -64,91 +119,110 @@ class UpdateValidator:
         Returns:
             Tuple of (is_valid: bool, reason: Optional[str])
         """
-        # 1. Authentication check
-        if self.auth_manager:
-            if not self.auth_manager.validate_api_key(api_key, client_id):
-                reason = "authentication_failed"
-                logger.warning(f"Update rejected: authentication failed", extra={
-                    "component": "coordinator",
-                    "event": "update_rejected",
-                    "round_id": round_id,
-                    "client_id": client_id,
-                    "reason": reason
-                })
-                return False, reason
-        
-        # 2. Check if client is registered
-        if client_id not in self.round_manager.clients:
-            reason = "client_not_registered"
-            logger.warning(f"Update rejected: client {client_id} not registered", extra={
-                "component": "coordinator",
-                "event": "update_rejected",
-                "round_id": round_id,
-                "client_id": client_id,
-                "reason": reason
-            })
-            return False, reason
-        
-        # 3. Check if round exists and client is assigned to it
-        if not self.round_manager.validate_update(client_id, round_id):
-            reason = "invalid_round_or_assignment"
-            logger.warning(f"Update rejected: invalid round or assignment", extra={
-                "component": "coordinator",
-                "event": "update_rejected",
-                "round_id": round_id,
-                "client_id": client_id,
-                "reason": reason
-            })
-            return False, reason
+        is_valid, reason, _ = self.validate_and_decode(client_id, round_id, weight_delta, api_key)
+        return is_valid, reason
+
+    def validate_and_decode(
+        self,
+        client_id: str,
+        round_id: int,
+        weight_delta: str,
+        api_key: Optional[str] = None
+    ) -> Tuple[bool, Optional[str], Any]:
+        """
+        Validate a client update and return the payload it parsed.
         
-        # 4. Rate limiting check
-        if self.rate_limiter:
-            allowed, rate_reason = self.rate_limiter.check_update_rate(client_id, round_id)
-            if not allowed:
-                logger.warning(f"Update rejected: rate limit exceeded", extra={
-                    "component": "coordinator",
-                    "event": "update_rejected",
-                    "round_id": round_id,
-                    "client_id": client_id,
-                    "reason": "rate_limit_exceeded",
-                    "details": rate_reason
-                })
-                return False, "rate_limit_exceeded"
+        Same checks as validate(); callers that go on to protect or store the
+        update reuse the parsed payload instead of decoding the JSON again.
         
-        # 5. Basic validation: weight_delta should not be empty
-        if not weight_delta or not isinstance(weight_delta, str):
-            reason = "invalid_weight_delta_format"
-            logger.warning(f"Update rejected: invalid weight_delta format", extra={
-                "component": "coordinator",
-                "event": "update_rejected",
-                "round_id": round_id,
-                "client_id": client_id,
-                "reason": reason
-            })
-            return False, reason
+        Returns:
+            Tuple of (is_valid, reason, payload); payload is None when the
+            update was rejected or is not valid JSON
+        """
+        is_valid, reason = self._check_request(client_id, round_id, weight_delta, api_key)
+        if not is_valid:
+            return False, reason, None
         
         # 6. Validate update values (check for NaN/Inf)
         try:
-            update_data = json.loads(weight_delta)
-            weight_delta_list = update_data.get("weight_delta", [])
+            payload = _decode_update_payload(weight_delta)
+            if isinstance(payload, dict):
+                # Quantization scales would bypass clipping and the finite
+                # check; only the coordinator may set them.
+                if not RESERVED_KEYS.isdisjoint(payload):
+                    return (*_reject(
+                        "Update rejected: quantization fields are reserved",
+                        round_id, client_id, "reserved_field",
+                    ), None)
+                weight_delta_list = payload.get("weight_delta", [])
+            else:
+                weight_delta_list = payload
             
             if isinstance(weight_delta_list, list) and len(weight_delta_list) > 0:
                 is_valid, error_msg = self.privacy_protector.validate_update_values(weight_delta_list)
                 if not is_valid:
-                    reason = "non_finite_values"
-                    logger.warning(f"Update rejected: {error_msg}", extra={
-                        "component": "coordinator",
-                        "event": "update_rejected",
-                        "round_id": round_id,
-                        "client_id": client_id,
-                        "reason": reason,
-                        "details": error_msg
-                    })
-                    return False, reason
+                    return (*_reject(
+                        f"Update rejected: {error_msg}",
+                        round_id, client_id, "non_finite_values", error_msg,
+                    ), None)
         except (json.JSONDecodeError, KeyError, TypeError):
             # If parsing fails, we'll let it through to basic validation
             # The aggregator will handle it
-            pass
+            return True, None, None
         
-        return True, None
+        return True, None, payload
 
+    def _check_request(
+        self,
+        client_id: str,
+        round_id: int,
+        weight_delta: str,
+        api_key: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Checks that need no parsing: shape, size, auth, assignment, rate limit."""
+        # 1. Cheap shape checks first so malformed or oversized bodies are
+        # rejected before any auth, round lookup or parsing work
+        if not weight_delta or not isinstance(weight_delta, str):
+            return _reject(
+                "Update rejected: invalid weight_delta format",
+                round_id, client_id, "invalid_weight_delta_format",
+            )
+        
+        if _utf8_size_exceeds(weight_delta, self.max_delta_bytes):
+            return _reject(
+                f"Update rejected: weight_delta exceeds {self.max_delta_bytes} bytes",
+                round_id, client_id, "payload_too_large",
+            )
+        
+        # 2. Authentication check
+        if self.auth_manager:
+            if not self.auth_manager.validate_api_key(api_key, client_id):
+                return _reject(
+                    "Update rejected: authentication failed",
+                    round_id, client_id, "authentication_failed",
+                )
+        
+        # 3. Check if client is registered
+        if client_id not in self.round_manager.clients:
+            return _reject(
+                f"Update rejected: client {client_id} not registered",
+                round_id, client_id, "client_not_registered",
+            )
+        
+        # 4. Check if round exists and client is assigned to it
+        if not self.round_manager.validate_update(client_id, round_id):
+            return _reject(
+                "Update rejected: invalid round or assignment",
+                round_id, client_id, "invalid_round_or_assignment",
+            )
+        
+        # 5. Rate limiting check
+        if self.rate_limiter:
+            allowed, rate_reason = self.rate_limiter.check_update_rate(client_id, round_id)
+            if not allowed:
+                return _reject(
+                    "Update rejected: rate limit exceeded",
+                    round_id, client_id, "rate_limit_exceeded", rate_reason,
+                )
+        
+        return True, None
@@ -5,7 +5,14 @@ Centralizes model version logic for federated learning.
 """
 
 from typing import Optional
-import re
+
+
+def _version_number(version: str) -> Optional[int]:
+    """Return N for a "vN" string, else None (str checks are cheaper than a regex)."""
+    digits = version[1:]
+    if version.startswith("v") and digits.isdecimal():
+        return int(digits)
+    return None
 
 
 def initial_version() -> str:
@@ -31,21 +38,12 @@ def next_version(current_version: str) -> str:
     Raises:
         ValueError: If current_version is not in the expected format
     """
-    # Validate format: must be "v" followed by digits
-    pattern = r"^v(\d+)$"
-    match = re.match(pattern, current_version)
-    
-    if not match:
+    version_num = _version_number(current_version)
+    if version_num is None:
         raise ValueError(
             f"Invalid version format: {current_version}. Expected format: v1, v2, v3, ..."
         )
-    
-    # Extract version number
-    version_num = int(match.group(1))
-    
-    # Increment and return
-    next_version_num = version_num + 1
-    return f"v{next_version_num}"
+    return f"v{version_num + 1}"
 
 
 def parse_version_number(version: str) -> Optional[int]:
@@ -58,13 +56,7 @@ def parse_version_number(version: str) -> Optional[int]:
     Returns:
         Version number as integer, or None if invalid format
     """
-    pattern = r"^v(\d+)$"
-    match = re.match(pattern, version)
-    
-    if not match:
-        return None
-    
-    return int(match.group(1))
+    return _version_number(version)
 
 
 def is_valid_version(version: str) -> bool:
@@ -77,6 +69,5 @@ def is_valid_version(version: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r"^v\d+$"
-    return bool(re.match(pattern, version))
+    return _version_number(version) is not None
 
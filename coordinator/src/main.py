@@ -6,17 +6,36 @@ Main entry point for the coordinator API.
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+import anyio
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
-from core.round_manager import RoundManager
+from core.round_manager import AGGREGATION_STARTED_STATES, RoundManager
 from persistence.json_repos import get_round_repository
 from core.task_assigner import TaskAssigner
 from core.update_validator import UpdateValidator
 from core.aggregator import Aggregator
+from core.update_batcher import UpdateBatcher
+from core.response_cache import ResponseCache
+from core.auth_gate import UpdateAuthGateMiddleware
+from core.body_limit import BodySizeLimitMiddleware
+from core.quantization import (
+    get_quantize_bits,
+    quantize_decoded_payload,
+    quantize_update_payload,
+)
 from core.model_store import ModelStore
 from core.metrics import MetricsCollector
 from core.auth import (
@@ -25,9 +44,10 @@ from core.auth import (
     validate_operator_key,
     get_operator_api_key,
 )
-from core.rate_limiter import RateLimiter
+from core.rate_limiter import get_rate_limiter
 from core.privacy import PrivacyProtector
-from core.async_round_manager import AsyncRoundManager, AsyncRoundConfig
+from core.async_round_manager import AsyncRoundManager, AsyncRoundConfig, NullAsyncRoundManager
+from core.aggregation_worker import AggregationWorker
 from core.reputation import ReputationManager
 from core.incentives import IncentiveManager
 from core.state_store import StateStore
@@ -37,19 +57,48 @@ from core.geo_presence import get_geo_presence
 from model_registry.base_models import BaseModelRegistry
 from rounds import create_lora_round, get_lora_round, close_lora_round
 from rounds.create_round import get_lora_round_manager
-from aggregation import aggregate_lora_adapters, validate_adapter
+import aggregation
 from aggregation.adapter_manifest import build_adapter_manifest, register_adapter_manifest
 from evaluation import evaluate_adapter
 from core.versioning import next_version
 from utils.logger import setup_coordinator_logger
+import asyncio
+from contextlib import asynccontextmanager
+import logging
 import os
 import json
 import hashlib
 import time
 import threading
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class _ReadJSONResponse(JSONResponse):
+    """
+    JSON response for read endpoints that return trusted internal dicts.
+
+    Returned directly from the handler, so FastAPI skips response-model
+    validation and jsonable_encoder; orjson does the encoding when installed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
 # Set up logging
-logger = setup_coordinator_logger()
+logger = setup_coordinator_logger(log_level=os.getenv("LOG_LEVEL", "INFO"))
 logger.info("Coordinator starting", extra={
     "component": "coordinator",
     "event": "coordinator_started"
@@ -63,11 +112,26 @@ if os.getenv("REQUIRE_OPERATOR_KEY", "").strip().lower() in ("1", "true", "yes")
         )
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Validation, task assignment, aggregation and model reads run in AnyIO's
+    # worker threads; size that pool for the expected number of concurrent clients.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("THREADPOOL_SIZE", "40")
+    )
+    yield
+    # Stop the timeout monitor, then let already-queued aggregations finish.
+    await run_in_threadpool(async_round_manager.shutdown)
+    if aggregation_worker:
+        await run_in_threadpool(aggregation_worker.shutdown)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Federated Learning Coordinator",
     description="MVP Coordinator API for Federated Learning",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=_lifespan,
 )
 
 _cors_origins = [
@@ -78,6 +142,36 @@ _cors_origins = [
     ).split(",")
     if o.strip()
 ]
+# Refuse oversize update uploads before they are buffered and decoded. The body
+# wraps weight_delta in a JSON string (escaped quotes), hence the 2x headroom
+# over the validator's MAX_UPDATE_BYTES limit on the decoded string.
+_max_update_body_bytes = int(
+    os.getenv(
+        "MAX_UPDATE_BODY_BYTES",
+        str(2 * int(os.getenv("MAX_UPDATE_BYTES", "25000000"))),
+    )
+)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=_max_update_body_bytes,
+    paths=("/update", "/update/msgpack"),
+)
+# A batch is buffered whole before any of its updates is validated, so it gets
+# its own cap: a few full-size updates, not 256 of them.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=int(
+        os.getenv("MAX_UPDATE_BATCH_BODY_BYTES", str(4 * _max_update_body_bytes))
+    ),
+    paths=("/update/batch",),
+)
+# Unknown header API keys are refused before the update body is read. Batch
+# uploads are not gated: each update there may carry its own key.
+app.add_middleware(
+    UpdateAuthGateMiddleware,
+    key_owner=lambda api_key: auth_manager.get_client_id_from_key(api_key),
+    paths=("/update", "/update/msgpack"),
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
@@ -85,6 +179,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# JSON models and metrics compress well. Small bodies, the metrics SSE stream
+# and already-encoded responses (/model/{version}/file) are passed through;
+# large bodies are compressed in a worker thread.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MIN_BYTES", "1024")),
+    compresslevel=5,
+)
 
 # Durable state + core modules
 state_store = StateStore()
@@ -102,9 +204,11 @@ _ha_geo_repo = None
 _ha_rate_repo = None
 try:
     from persistence.shared_state import shared_state_enabled
-    from persistence.db import create_all_tables
 
     if shared_state_enabled():
+        # SQLAlchemy is only needed for shared state; JSON mode skips importing it.
+        from persistence.db import create_all_tables
+
         create_all_tables()
         from persistence.ha_repos import (
             SqlGeoPresenceRepository,
@@ -124,7 +228,7 @@ try:
 except Exception as _ha_exc:  # noqa: BLE001
     logger.warning("HA shared state init failed: %s", _ha_exc)
 
-rate_limiter = RateLimiter(repo=_ha_rate_repo)
+rate_limiter = get_rate_limiter(repo=_ha_rate_repo)
 privacy_protector = PrivacyProtector()
 update_validator = UpdateValidator(
     round_manager,
@@ -136,14 +240,13 @@ metrics_collector = MetricsCollector()
 
 # Async auto-aggregation (default ON for volunteer/edge)
 enable_async = os.getenv("ENABLE_ASYNC_ROUNDS", "true").lower() == "true"
-_aggregate_lock = threading.Lock()
 
 
 def _auto_aggregate_round(round_id: int) -> None:
     """Callback: aggregate a round when min updates or timeout is reached."""
-    with _aggregate_lock:
+    with round_manager.lock:
         round_obj = round_manager.rounds.get(round_id)
-        if not round_obj or round_obj.state.value in ("AGGREGATING", "CLOSED"):
+        if not round_obj or round_obj.state in AGGREGATION_STARTED_STATES:
             return
         logger.info(
             f"Auto-aggregating round {round_id}",
@@ -154,7 +257,7 @@ def _auto_aggregate_round(round_id: int) -> None:
             },
         )
         result = aggregator.aggregate(round_id)
-        if result and async_round_manager:
+        if result:
             async_round_manager.mark_round_closed(round_id)
 
 
@@ -163,16 +266,36 @@ async_config = AsyncRoundConfig(
     max_round_duration_seconds=float(os.getenv("ASYNC_MAX_DURATION", "300.0")),
     enable_async=enable_async
 )
+# Ready rounds aggregate on a background thread, not in the /update request.
+aggregation_worker = AggregationWorker(_auto_aggregate_round) if enable_async else None
 async_round_manager = (
     AsyncRoundManager(
         round_manager,
         async_config,
-        on_round_ready=_auto_aggregate_round,
+        on_round_ready=aggregation_worker.enqueue,
     )
     if enable_async
-    else None
+    else NullAsyncRoundManager()
 )
 
+# Polled read endpoints (/status, /reputation, /incentives) share encoded
+# snapshots for READ_CACHE_TTL_MS; cleared whenever updates or aggregation land.
+read_cache = ResponseCache(ttl_seconds=float(os.getenv("READ_CACHE_TTL_MS", "500")) / 1000.0)
+
+# Replies to /aggregate for rounds that are already closed never change, so
+# retries reuse the encoded body instead of reloading and re-encoding the model.
+# Few entries: each holds a full model.
+closed_aggregate_cache = ResponseCache(
+    ttl_seconds=float(os.getenv("AGGREGATE_REPLAY_CACHE_TTL_S", "300")),
+    max_entries=4,
+)
+
+
+def _on_round_aggregated(round_id: int) -> None:
+    read_cache.clear()
+    async_round_manager.mark_round_closed(round_id)
+
+
 aggregator = Aggregator(
     round_manager,
     model_store,
@@ -180,11 +303,70 @@ aggregator = Aggregator(
     metrics_collector,
     rate_limiter,
     state_store=state_store,
-    on_aggregated=(
-        (lambda rid: async_round_manager.mark_round_closed(rid))
-        if async_round_manager
-        else None
-    ),
+    on_aggregated=_on_round_aggregated,
+)
+
+# Optional int8/int16 storage of accepted deltas (UPDATE_QUANTIZE_BITS; off by default)
+update_quantize_bits = get_quantize_bits()
+
+
+def _record_accepted_updates(updates: List[Tuple[str, int]]) -> None:
+    """
+    All bookkeeping for one batch of accepted updates, before any submitter resumes.
+
+    Metrics and reputation are updated in bulk (one persist per client), each
+    update earns its incentive, and each round in the batch is checked for
+    readiness once rather than once per update.
+    """
+    metrics_collector.record_updates_accepted(round_id for _, round_id in updates)
+    reputation_manager.record_updates_accepted(updates)
+    elapsed = async_round_manager.elapsed_seconds
+    for client_id, round_id in updates:
+        incentive_manager.award_update_reward(
+            client_id, round_id, latency_seconds=elapsed(round_id)
+        )
+    read_cache.clear()
+    if async_round_manager.on_round_ready:
+        for round_id in dict.fromkeys(round_id for _, round_id in updates):
+            if async_round_manager.check_round_ready(round_id):
+                # Round is ready - queue it for background aggregation
+                async_round_manager.on_round_ready(round_id)
+
+
+async def _rate_limit_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a rate-limiter method, in the threadpool when it makes Redis/SQL round trips."""
+    if rate_limiter.blocking_io:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+def _check_request_rate(client_id: str) -> Tuple[bool, Optional[str]]:
+    """Check and record one request (one clock read for both)."""
+    now = time.time()
+    allowed, reason = rate_limiter.check_request_rate(client_id, now=now)
+    if allowed:
+        rate_limiter.record_request(client_id, now=now)
+    return allowed, reason
+
+
+def _check_update_rate(client_id: str, round_id: int) -> Tuple[bool, Optional[str]]:
+    allowed, reason = rate_limiter.check_update_rate(client_id, round_id)
+    if allowed:
+        rate_limiter.record_update(client_id, round_id)
+    return allowed, reason
+
+
+def _record_rejected_update(client_id: str, round_id: int) -> None:
+    metrics_collector.record_update_rejected(round_id)
+    reputation_manager.record_update_rejected(client_id, round_id)
+
+
+update_batcher = UpdateBatcher(
+    aggregator,
+    max_batch_size=int(os.getenv("UPDATE_BATCH_MAX_SIZE", "64")),
+    max_wait_ms=float(os.getenv("UPDATE_BATCH_MAX_WAIT_MS", "50")),
+    max_queued=int(os.getenv("UPDATE_BATCH_MAX_QUEUED", "10000")),
+    on_accepted=_record_accepted_updates,
 )
 
 # Finish rounds interrupted mid-aggregate (Milestone 3)
@@ -234,7 +416,8 @@ bind_dependencies(
     metrics_collector=metrics_collector,
     geo_presence=geo_presence,
     client_ip_fn=_client_ip,
-    register_legacy_fn=None,
+    # Defined below; shares /client/register's lock.
+    register_legacy_fn=lambda request: _register_client(request),
 )
 app.include_router(protocol_router)
 
@@ -377,18 +560,46 @@ class JobResultRequest(BaseModel):
 
 class UpdateRequest(BaseModel):
     """Request model for client update submission."""
+    # Hot path: reject unknown fields (catches client/protocol drift) and keep
+    # validated requests immutable while they are shared with the threadpool.
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     client_id: str
     round_id: int
     weight_delta: str
     api_key: Optional[str] = None  # API key for authentication
 
 
+if msgspec is not None:
+
+    class MsgpackUpdateRequest(msgspec.Struct):
+        """MessagePack body for /update/msgpack; weight_delta may be a JSON string or raw arrays."""
+
+        client_id: str
+        round_id: int
+        weight_delta: Any
+        api_key: Optional[str] = None
+
+    _msgpack_update_decoder = msgspec.msgpack.Decoder(MsgpackUpdateRequest)
+else:  # pragma: no cover
+    _msgpack_update_decoder = None
+
+
 class UpdateResponse(BaseModel):
     """Response model for update submission."""
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
 
 
+class UpdateBatchRequest(BaseModel):
+    """Request model for submitting several client updates in one call."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    updates: List[UpdateRequest] = Field(..., min_length=1, max_length=256)
+
+
 class AggregateResponse(BaseModel):
     """Response model for aggregation."""
     round_id: int
@@ -492,6 +703,41 @@ class AggregateRoundResponse(BaseModel):
     replayed: bool = False
 
 
+_registration_lock = threading.Lock()
+
+
+def _register_client(request: ClientRegisterRequest) -> Tuple[bool, str]:
+    """
+    Register (or resume) a client; one at a time. Returns (already, api_key).
+
+    Also serves /v2/node/register, whose request has the same three fields.
+    """
+    with _registration_lock:
+        already = auth_manager.is_registered(request.client_name)
+        try:
+            api_key = auth_manager.register_client(
+                request.client_name,
+                presented_key=request.api_key,
+            )
+        except ClientAlreadyRegisteredError as exc:
+            raise HTTPException(
+                status_code=409,
+                detail=str(exc),
+            ) from exc
+
+        if request.client_name not in round_manager.clients:
+            round_manager.register_client(request.client_name)
+
+        metrics_collector.record_client_seen(request.client_name)
+
+        if request.public_key:
+            try:
+                auth_manager.set_public_key(request.client_name, request.public_key)
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return already, api_key
+
+
 @app.post("/client/register", response_model=ClientRegisterResponse)
 async def register_client(
     request: ClientRegisterRequest,
@@ -505,47 +751,29 @@ async def register_client(
     existing key (HTTP 409 if the name is taken).
     """
     geo_presence.record(request.client_name, _client_ip(http_request))
-    logger.info(f"Registration request received for client {request.client_name}", extra={
-        "component": "coordinator",
-        "event": "registration_request",
-        "client_id": request.client_name
-    })
-
-    already = auth_manager.is_registered(request.client_name)
-    try:
-        api_key = auth_manager.register_client(
-            request.client_name,
-            presented_key=request.api_key,
-        )
-    except ClientAlreadyRegisteredError as exc:
-        raise HTTPException(
-            status_code=409,
-            detail=str(exc),
-        ) from exc
-
-    if request.client_name not in round_manager.clients:
-        round_manager.register_client(request.client_name)
-
-    metrics_collector.total_clients_seen.add(request.client_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Registration request received for client {request.client_name}", extra={
+            "component": "coordinator",
+            "event": "registration_request",
+            "client_id": request.client_name
+        })
 
-    if request.public_key:
-        try:
-            auth_manager.set_public_key(request.client_name, request.public_key)
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # Registration rewrites the durable state file; keep it off the event loop.
+    already, api_key = await run_in_threadpool(_register_client, request)
 
     message = (
         f"Client {request.client_name} resumed with existing API key."
         if already
         else f"Client {request.client_name} registered successfully. Save your API key!"
     )
-    logger.info(f"Client {request.client_name} registration ok", extra={
-        "component": "coordinator",
-        "event": "client_registered",
-        "client_id": request.client_name
-    })
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Client {request.client_name} registration ok", extra={
+            "component": "coordinator",
+            "event": "client_registered",
+            "client_id": request.client_name
+        })
 
-    return ClientRegisterResponse(
+    return ClientRegisterResponse.model_construct(
         success=True,
         message=message,
         client_id=request.client_name,
@@ -590,18 +818,17 @@ async def get_task(
             detail="Authentication failed. Valid API key required."
         )
     
-    # Rate limiting check
+    # Rate limiting check (one clock read per request)
     if rate_limiter:
-        allowed, reason = rate_limiter.check_request_rate(client_id)
+        allowed, reason = await _rate_limit_call(_check_request_rate, client_id)
         if not allowed:
             raise HTTPException(
                 status_code=429,
                 detail=f"Rate limit exceeded: {reason}"
             )
-        rate_limiter.record_request(client_id)
 
     geo_presence.record(client_id, _client_ip(http_request))
-    task = task_assigner.assign_task(client_id)
+    task = await run_in_threadpool(_assign_task, client_id)
     
     if task is None:
         raise HTTPException(
@@ -611,25 +838,59 @@ async def get_task(
     
     # Record client assignment in metrics
     round_id = task["round_id"]
-    if async_round_manager:
-        async_round_manager.start_round(round_id)
-    round_status = round_manager.get_round_status(round_id)
-    if round_status:
+    async_round_manager.start_round(round_id)
+    # The round was just assigned in the threadpool; a dict lookup is enough here
+    # (get_round_status would wait on the round lock from the event loop).
+    if round_id in round_manager.rounds:
         # Check if this is a new round (need to start metrics tracking)
         if round_id not in metrics_collector.round_metrics:
             metrics_collector.start_round(round_id, task["model_version"])
         metrics_collector.record_client_assigned(round_id, client_id)
     
-    return TaskResponse(
+    # Built from the assigner's own dict: skip re-validating it field by field.
+    return TaskResponse.model_construct(
         round_id=task["round_id"],
         model_version=task["model_version"],
         task=task["task"],
         description=task["description"],
         model_id=task.get("model_id", "simple_mlp"),
-        model_config=task.get("model_config") or {},
+        architecture_config=task.get("model_config") or {},
     )
 
 
+def _assign_task(client_id: str) -> Optional[Dict[str, Any]]:
+    """Assign a task off the event loop (scans/reads model files) under the round lock."""
+    with round_manager.lock:
+        return task_assigner.assign_task(client_id)
+
+
+def _validate_and_protect_update(
+    request: UpdateRequest, api_key: Optional[str]
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Blocking, payload-sized part of /update: validation (incl. size limit), clipping/noise."""
+    is_valid, reason, payload = update_validator.validate_and_decode(
+        request.client_id,
+        request.round_id,
+        request.weight_delta,
+        api_key=api_key,
+    )
+    if not is_valid:
+        return False, reason, None
+    # The validator parsed the payload once (after the size check on the raw
+    # string); privacy protections and quantization work on that parse
+    # instead of decoding the payload again.
+    if payload is None:
+        protected = request.weight_delta
+        if update_quantize_bits:
+            protected = quantize_update_payload(protected, update_quantize_bits)
+        return True, None, protected
+    protected = privacy_protector.protect_decoded_update(payload, request.weight_delta)
+    if update_quantize_bits:
+        # protect_decoded_update leaves payload as the dict it serialised
+        protected = quantize_decoded_payload(payload, protected, update_quantize_bits)
+    return True, None, protected
+
+
 @app.post("/update", response_model=UpdateResponse)
 async def submit_update(
     request: UpdateRequest,
@@ -652,116 +913,219 @@ async def submit_update(
         except ProtocolIncompatibleError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    resolved_key = extract_api_key(
-        x_api_key=x_api_key,
-        authorization=authorization,
-        body_api_key=request.api_key,
-    )
-
-    # Check if round is closed (straggler detection)
-    if async_round_manager and request.round_id in async_round_manager.closed_rounds:
-        # This is a straggler - update arrived after round closed
-        async_round_manager.record_straggler(request.client_id, request.round_id)
-        reputation_manager.record_round_dropout(request.client_id, request.round_id)
-        incentive_manager.record_dropout(request.client_id)
+    # Shed load before validation work while the aggregator is behind; the
+    # slot is held through validation so in-flight updates count as well.
+    if not update_batcher.try_reserve():
         raise HTTPException(
-            status_code=410,  # Gone - round already closed
-            detail=f"Round {request.round_id} is already closed. Update arrived too late."
+            status_code=503,
+            detail="Update queue is full; retry shortly",
+            headers={"Retry-After": "1"},
         )
-    
-    # Validate update (includes authentication, rate limiting, value checks)
-    is_valid, reason = update_validator.validate(
-        request.client_id,
-        request.round_id,
-        request.weight_delta,
-        api_key=resolved_key,
-    )
 
-    if is_valid:
-        try:
-            parsed_delta = json.loads(request.weight_delta)
-        except (json.JSONDecodeError, TypeError):
-            parsed_delta = request.weight_delta
-        _require_json_size(
-            parsed_delta,
-            env_name="MAX_UPDATE_BYTES",
-            default=25_000_000,
-            label="Update payload",
+    try:
+        resolved_key = extract_api_key(
+            x_api_key=x_api_key,
+            authorization=authorization,
+            body_api_key=request.api_key,
         )
+
+        # Check if round is closed (straggler detection)
+        if request.round_id in async_round_manager.closed_rounds:
+            # This is a straggler - update arrived after round closed
+            async_round_manager.record_straggler(request.client_id, request.round_id)
+            reputation_manager.record_round_dropout(request.client_id, request.round_id)
+            incentive_manager.record_dropout(request.client_id)
+            raise HTTPException(
+                status_code=410,  # Gone - round already closed
+                detail=f"Round {request.round_id} is already closed. Update arrived too late."
+            )
     
-    if not is_valid:
-        # Record rejected update in metrics and reputation
-        metrics_collector.record_update_rejected(request.round_id)
-        reputation_manager.record_update_rejected(request.client_id, request.round_id)
+        # Validate update (includes authentication, rate limiting, value checks)
+        # and apply privacy protections; payload parsing runs off the event loop.
+        is_valid, reason, protected_weight_delta = await run_in_threadpool(
+            _validate_and_protect_update, request, resolved_key
+        )
+    
+        if not is_valid:
+            _record_rejected_update(request.client_id, request.round_id)
         
-        # Provide specific error message
-        if reason == "authentication_failed":
-            status_code = 401
-            detail = "Authentication failed. Valid API key required."
-        elif reason == "rate_limit_exceeded":
-            status_code = 429
-            detail = f"Rate limit exceeded for client {request.client_id}"
-        else:
-            status_code = 400
-            detail = f"Invalid update from client {request.client_id} for round {request.round_id}: {reason}"
+            # Provide specific error message
+            if reason == "authentication_failed":
+                status_code = 401
+                detail = "Authentication failed. Valid API key required."
+            elif reason == "rate_limit_exceeded":
+                status_code = 429
+                detail = f"Rate limit exceeded for client {request.client_id}"
+            elif reason == "payload_too_large":
+                status_code = 413
+                detail = f"Update payload from client {request.client_id} is too large"
+            else:
+                status_code = 400
+                detail = f"Invalid update from client {request.client_id} for round {request.round_id}: {reason}"
         
-        raise HTTPException(status_code=status_code, detail=detail)
+            raise HTTPException(status_code=status_code, detail=detail)
     
-    # Apply privacy protections
-    protected_weight_delta = privacy_protector.protect_update(request.weight_delta)
+        # Record rate limit usage
+        if rate_limiter:
+            await _rate_limit_call(rate_limiter.record_update, request.client_id, request.round_id)
     
-    # Record rate limit usage
-    if rate_limiter:
-        rate_limiter.record_update(request.client_id, request.round_id)
+        # Submit update to aggregator
+        success = await update_batcher.submit(
+            request.client_id,
+            request.round_id,
+            protected_weight_delta,
+            reserved=True,
+        )
     
-    # Calculate latency for reputation and incentives
-    latency = None
-    if async_round_manager and request.round_id in async_round_manager.round_start_times:
-        latency = time.time() - async_round_manager.round_start_times[request.round_id]
+        if not success:
+            _record_rejected_update(request.client_id, request.round_id)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to submit update from client {request.client_id} for round {request.round_id}"
+            )
     
-    # Submit update to aggregator
-    success = aggregator.submit_update(
-        request.client_id,
-        request.round_id,
-        protected_weight_delta
+        # Metrics, reputation, incentives and the round-ready check for accepted
+        # updates ran once for the whole batch (see _record_accepted_updates).
+        return UpdateResponse.model_construct(
+            success=True,
+            message=f"Update from client {request.client_id} submitted successfully for round {request.round_id}"
+        )
+
+    finally:
+        update_batcher.release()
+
+# X-FL-Dtype values for /update/msgpack binary layers -> canonical name
+_BINARY_LAYER_DTYPES = {
+    "f32": "float32",
+    "float32": "float32",
+    "bf16": "bfloat16",
+    "bfloat16": "bfloat16",
+}
+
+
+def _bfloat16_to_float32(value: Any) -> np.ndarray:
+    """Widen little-endian bfloat16s (the high half of a float32) to float32 exactly."""
+    high_halves = np.frombuffer(value, dtype="<u2").astype(np.uint32)
+    return (high_halves << 16).view(np.float32)
+
+
+def _expand_binary_layers(value: Any, dtype: str = "float32") -> Any:
+    """Replace raw little-endian float32 (or bfloat16) layers with float lists, recursively."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        if dtype == "bfloat16":
+            if len(value) % 2:
+                raise ValueError("binary layers must be little-endian bfloat16 (length % 2 == 0)")
+            return _bfloat16_to_float32(value).tolist()
+        if len(value) % 4:
+            raise ValueError("binary layers must be little-endian float32 (length % 4 == 0)")
+        return np.frombuffer(value, dtype="<f4").tolist()
+    if isinstance(value, dict):
+        return {key: _expand_binary_layers(item, dtype) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_expand_binary_layers(item, dtype) for item in value]
+    return value
+
+
+def _decode_msgpack_update(raw: bytes, dtype: str = "float32") -> UpdateRequest:
+    """Decode a /update/msgpack body into the JSON-string form /update stores."""
+    body = _msgpack_update_decoder.decode(raw)
+    weight_delta = body.weight_delta
+    if not isinstance(weight_delta, str):
+        # Stored updates are JSON text; stdlib json keeps NaN/Inf visible to validation.
+        weight_delta = json.dumps(_expand_binary_layers(weight_delta, dtype))
+    return UpdateRequest(
+        client_id=body.client_id,
+        round_id=body.round_id,
+        weight_delta=weight_delta,
+        api_key=body.api_key,
     )
-    
-    if not success:
-        metrics_collector.record_update_rejected(request.round_id)
-        reputation_manager.record_update_rejected(request.client_id, request.round_id)
+
+
+@app.post("/update/msgpack", response_model=UpdateResponse)
+async def submit_update_msgpack(
+    http_request: Request,
+    x_api_key: Optional[str] = Header(None, alias="X-Api-Key"),
+    authorization: Optional[str] = Header(None),
+    x_protocol_version: Optional[str] = Header(None, alias="X-Protocol-Version"),
+    x_fl_dtype: Optional[str] = Header(None, alias="X-FL-Dtype"),
+) -> UpdateResponse:
+    """
+    Submit a client update encoded as MessagePack (application/msgpack).
+
+    Binary floats are far smaller on the wire than JSON text; a layer may also be
+    sent as one bin value of little-endian float32s, or of bfloat16s (half the
+    size) with ``X-FL-Dtype: bf16``. bfloat16 layers are widened to float32
+    exactly, and the decoded update goes through the same validation and
+    aggregation path as /update.
+    """
+    if _msgpack_update_decoder is None:
+        raise HTTPException(status_code=415, detail="MessagePack updates require msgspec")
+    dtype = _BINARY_LAYER_DTYPES.get((x_fl_dtype or "f32").strip().lower())
+    if dtype is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Failed to submit update from client {request.client_id} for round {request.round_id}"
+            detail=f"Unsupported X-FL-Dtype {x_fl_dtype!r}; use f32 or bf16",
         )
-    
-    # Record accepted update in metrics
-    metrics_collector.record_update_received(request.round_id)
-    metrics_collector.record_update_accepted(request.round_id)
-    
-    # Record in reputation system
-    reputation_manager.record_update_submitted(request.client_id, request.round_id)
-    reputation_manager.record_update_accepted(request.client_id, request.round_id)
-    
-    # Award incentives
-    tokens_earned = incentive_manager.award_update_reward(
-        request.client_id,
-        request.round_id,
-        latency_seconds=latency
-    )
-    
-    # Check if round is ready for aggregation (async mode)
-    if async_round_manager and async_round_manager.check_round_ready(request.round_id):
-        # Round is ready - trigger aggregation callback
-        if async_round_manager.on_round_ready:
-            async_round_manager.on_round_ready(request.round_id)
-    
-    return UpdateResponse(
-        success=True,
-        message=f"Update from client {request.client_id} submitted successfully for round {request.round_id}"
+    raw = await http_request.body()
+    try:
+        # Decoding and re-encoding scale with the payload; keep them off the loop.
+        update = await run_in_threadpool(_decode_msgpack_update, raw, dtype)
+    except (msgspec.DecodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid MessagePack update: {exc}") from exc
+    return await submit_update(
+        update,
+        x_api_key=x_api_key,
+        authorization=authorization,
+        x_protocol_version=x_protocol_version,
     )
 
 
+@app.post("/update/batch", response_model=List[UpdateResponse])
+async def submit_update_batch(
+    request: UpdateBatchRequest,
+    x_api_key: Optional[str] = Header(None, alias="X-Api-Key"),
+    authorization: Optional[str] = Header(None),
+    x_protocol_version: Optional[str] = Header(None, alias="X-Protocol-Version"),
+) -> List[UpdateResponse]:
+    """
+    Submit several client updates in one request (e.g. from an edge relay).
+
+    Each update is validated and recorded exactly as by /update and uses its own
+    api_key, falling back to the request credentials. Results are returned in
+    order; a rejected update reports success=False instead of failing the batch.
+    """
+    async def submit_one(update: UpdateRequest) -> UpdateResponse:
+        try:
+            return await submit_update(
+                update,
+                x_api_key=None if update.api_key else x_api_key,
+                authorization=None if update.api_key else authorization,
+                x_protocol_version=x_protocol_version,
+            )
+        except HTTPException as exc:
+            return UpdateResponse.model_construct(success=False, message=str(exc.detail))
+
+    # Submitted together so the update batcher checkpoints them as one batch.
+    return list(await asyncio.gather(*(submit_one(update) for update in request.updates)))
+
+
+# In-flight aggregate() calls by round, so concurrent /aggregate requests for
+# one round share a single run instead of queueing on the aggregator lock.
+_aggregations_in_flight: Dict[int, asyncio.Future] = {}
+
+
+async def _aggregate_single_flight(round_id: int) -> Optional[Dict[str, Any]]:
+    future = _aggregations_in_flight.get(round_id)
+    if future is None:
+        future = asyncio.ensure_future(run_in_threadpool(aggregator.aggregate, round_id))
+        _aggregations_in_flight[round_id] = future
+        future.add_done_callback(lambda _: _aggregations_in_flight.pop(round_id, None))
+    # Shielded: one caller disconnecting must not cancel the others' result.
+    return await asyncio.shield(future)
+
+
 @app.get("/aggregate/{round_id}", response_model=AggregateResponse)
+@app.post("/aggregate/{round_id}", response_model=AggregateResponse)
 async def aggregate_classic_round(
     round_id: int,
     operator_key: Optional[str] = Depends(operator_key_value),
@@ -769,10 +1133,19 @@ async def aggregate_classic_round(
     """
     Aggregate all updates for a classic FL round (FedAvg).
 
+    Safe to retry: a round is aggregated once, and later calls report it as
+    already_closed with the published model. POST is the same operation for
+    clients that keep mutations off GET.
+
     When OPERATOR_API_KEY is set, operator_key is required.
     """
     _require_operator(operator_key)
-    result = aggregator.aggregate(round_id)
+    cache_key = f"/aggregate/{round_id}"
+    body = closed_aggregate_cache.get(cache_key)
+    if body is not None:
+        return Response(body, media_type="application/json")
+
+    result = await _aggregate_single_flight(round_id)
 
     if result is None:
         raise HTTPException(
@@ -780,20 +1153,60 @@ async def aggregate_classic_round(
             detail=f"Round {round_id} not found"
         )
 
-    if async_round_manager and result.get("status") == "aggregated":
+    if result.get("status") == "aggregated":
         async_round_manager.mark_round_closed(round_id)
 
-    return AggregateResponse(
+    response = AggregateResponse.model_construct(
         round_id=result["round_id"],
         model_version=result.get("model_version") or "",
         status=result["status"],
         aggregated_model=result.get("aggregated_model"),
         num_updates=result.get("num_updates", 0),
     )
+    if result["status"] == "already_closed" and result.get("aggregated_model") is not None:
+        body = await run_in_threadpool(response.model_dump_json)
+        closed_aggregate_cache.put(cache_key, body.encode("utf-8"))
+        return Response(body, media_type="application/json")
+    return response
+
+
+def _cached_read(key: str, build: Callable[[], Any]) -> Response:
+    """Serve key from read_cache, building and caching the JSON body on a miss."""
+    body = read_cache.get(key)
+    if body is None:
+        body = _ReadJSONResponse(build()).body
+        read_cache.put(key, body)
+    return Response(body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header lists etag (weak comparison) or is *."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
 
 
-@app.get("/status/{round_id}", response_model=RoundStatusResponse)
-async def get_round_status(round_id: int) -> RoundStatusResponse:
+def _cached_metrics_read(
+    key: str, build: Callable[[], Any], if_none_match: Optional[str] = None
+) -> Response:
+    """
+    Like _cached_read, keyed on the metrics revision, with an ETag of the body.
+
+    Every metrics change bumps the revision, so a cached body is never stale and
+    dashboards polling an idle coordinator reuse one encoded snapshot; clients
+    that send back the ETag get 304 until the body changes.
+    """
+    response = _cached_read(f"{key}@{metrics_collector.revision}", build)
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+@app.get("/status/{round_id}", response_model=RoundStatusResponse, response_class=_ReadJSONResponse)
+async def get_round_status(round_id: int) -> Response:
     """
     Get the status of a round.
     
@@ -803,30 +1216,43 @@ async def get_round_status(round_id: int) -> RoundStatusResponse:
     Returns:
         Round status information
     """
-    status = round_manager.get_round_status(round_id)
-    
-    if status is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Round {round_id} not found"
-        )
-    
-    return RoundStatusResponse(
-        round_id=status["round_id"],
-        model_version=status["model_version"],
-        state=status["state"],
-        assigned_clients=status["assigned_clients"],
-        updates_received=status["updates_received"],
-        total_clients=status["total_clients"],
-        total_updates=status["total_updates"]
-    )
+    def build() -> Dict[str, Any]:
+        status = round_manager.get_round_status(round_id)
+        if status is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Round {round_id} not found"
+            )
+        return {
+            field: status[field]
+            for field in (
+                "round_id",
+                "model_version",
+                "state",
+                "assigned_clients",
+                "updates_received",
+                "total_clients",
+                "total_updates",
+            )
+        }
 
+    # get_round_status takes the round lock, which an aggregation may hold.
+    return await run_in_threadpool(_cached_read, f"/status/{round_id}", build)
 
-@app.get("/model/{version}", response_model=ModelResponse)
-async def get_model(version: str) -> ModelResponse:
+
+@app.get("/model/{version}", response_model=ModelResponse, response_class=_ReadJSONResponse)
+async def get_model(
+    version: str,
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """
     Get a specific model version.
     
+    The weights dict read from disk is encoded as-is (no ModelResponse
+    validation), and both the load and the encode run in the threadpool.
+    Responses carry the model file's ETag; a matching If-None-Match gets 304
+    without loading the model.
+    
     Args:
         version: Model version string (e.g., "v1", "v2")
         
@@ -837,11 +1263,15 @@ async def get_model(version: str) -> ModelResponse:
         HTTPException: 404 if model version does not exist
     """
     try:
-        model_data = model_store.load_model(version)
-        return ModelResponse(
-            version=version,
-            model_data=model_data
+        etag = model_store.model_etag(version)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        model_data = await run_in_threadpool(model_store.load_model, version)
+        response = await run_in_threadpool(
+            _ReadJSONResponse, {"version": version, "model_data": model_data}
         )
+        response.headers["ETag"] = etag
+        return response
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -854,33 +1284,120 @@ async def get_model(version: str) -> ModelResponse:
         )
 
 
-@app.get("/metrics", response_model=MetricsResponse)
-async def get_all_metrics() -> MetricsResponse:
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """True if an Accept-Encoding header allows gzip (and does not set q=0)."""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        params = params.replace(" ", "").lower()
+        if not params.startswith("q="):
+            return True
+        try:
+            return float(params[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+@app.get("/model/{version}/file", response_model=None)
+async def get_model_file(
+    version: str,
+    accept_encoding: Optional[str] = Header(default=None),
+) -> FileResponse:
+    """
+    Download the stored model file for a version.
+
+    Serves the bytes on disk directly (the model_data object of GET /model/{version},
+    without the envelope), so large weight files skip the parse/validate/re-encode
+    round trip and are sent with sendfile where the server supports it. Clients
+    that accept gzip get the store's precompressed copy with Content-Encoding: gzip.
+
+    Raises:
+        HTTPException: 404 if model version does not exist
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    try:
+        if _accepts_gzip(accept_encoding):
+            model_path = await run_in_threadpool(model_store.get_gzip_model_path, version)
+            headers["Content-Encoding"] = "gzip"
+        else:
+            model_path = model_store.get_model_path(version)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Model version {version} not found"
+        )
+    return FileResponse(model_path, media_type="application/json", headers=headers)
+
+
+@app.get("/metrics", response_model=MetricsResponse, response_class=_ReadJSONResponse)
+async def get_all_metrics(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Get all metrics (global and per-round).
     
     Returns:
         All metrics including global statistics and round-specific metrics
     """
-    return MetricsResponse(metrics=metrics_collector.get_all_metrics())
+    return _cached_metrics_read(
+        "/metrics", lambda: {"metrics": metrics_collector.get_all_metrics()}, if_none_match
+    )
 
 
-@app.get("/metrics/latest", response_model=Dict[str, Any])
-async def get_latest_metrics() -> Dict[str, Any]:
+@app.get("/metrics/latest", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_latest_metrics(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Get metrics for the most recent round.
     
     Returns:
         Latest round metrics, or empty dict if no rounds exist
     """
-    latest = metrics_collector.get_latest_round_metrics()
-    if latest is None:
-        return {}
-    return latest
+    return _cached_metrics_read(
+        "/metrics/latest",
+        lambda: metrics_collector.get_latest_round_metrics() or {},
+        if_none_match,
+    )
+
+
+_METRICS_STREAM_POLL_SECONDS = 0.5
+_METRICS_STREAM_KEEPALIVE_SECONDS = 15.0
+
 
+async def _latest_metrics_events(http_request: Request):
+    """Yield an SSE event with the latest round metrics whenever they change."""
+    last_revision = None
+    idle = 0.0
+    while not await http_request.is_disconnected():
+        revision = metrics_collector.revision
+        if revision != last_revision:
+            last_revision = revision
+            idle = 0.0
+            latest = metrics_collector.get_latest_round_metrics() or {}
+            yield b"data: " + _ReadJSONResponse(latest).body + b"\n\n"
+        elif idle >= _METRICS_STREAM_KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield b": keepalive\n\n"
+        await asyncio.sleep(_METRICS_STREAM_POLL_SECONDS)
+        idle += _METRICS_STREAM_POLL_SECONDS
 
-@app.get("/metrics/round/{round_id}", response_model=Dict[str, Any])
-async def get_round_metrics(round_id: int) -> Dict[str, Any]:
+
+@app.get("/metrics/stream", response_class=StreamingResponse)
+async def stream_latest_metrics(http_request: Request) -> StreamingResponse:
+    """
+    Server-Sent Events stream of the latest round metrics.
+
+    Sends the same object as GET /metrics/latest once on connect and again only
+    when the metrics change, so dashboards hold one connection instead of polling.
+    """
+    return StreamingResponse(
+        _latest_metrics_events(http_request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics/round/{round_id}", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_round_metrics(round_id: int) -> Response:
     """
     Get metrics for a specific round.
     
@@ -899,22 +1416,22 @@ async def get_round_metrics(round_id: int) -> Dict[str, Any]:
             status_code=404,
             detail=f"Metrics for round {round_id} not found"
         )
-    return metrics
+    return _ReadJSONResponse(metrics)
 
 
-@app.get("/reputation", response_model=Dict[str, Any])
-async def get_all_reputations() -> Dict[str, Any]:
+@app.get("/reputation", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_all_reputations() -> Response:
     """
     Get all client reputations.
     
     Returns:
         Dictionary mapping client_id to reputation data
     """
-    return reputation_manager.get_all_reputations()
+    return _cached_read("/reputation", reputation_manager.get_all_reputations)
 
 
-@app.get("/reputation/{client_id}", response_model=Dict[str, Any])
-async def get_client_reputation(client_id: str) -> Dict[str, Any]:
+@app.get("/reputation/{client_id}", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_client_reputation(client_id: str) -> Response:
     """
     Get reputation for a specific client.
     
@@ -933,22 +1450,22 @@ async def get_client_reputation(client_id: str) -> Dict[str, Any]:
             status_code=404,
             detail=f"Reputation for client {client_id} not found"
         )
-    return rep.to_dict()
+    return _ReadJSONResponse(rep.to_dict())
 
 
-@app.get("/incentives", response_model=Dict[str, Any])
-async def get_all_incentives() -> Dict[str, Any]:
+@app.get("/incentives", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_all_incentives() -> Response:
     """
     Get all client incentives.
     
     Returns:
         Dictionary mapping client_id to incentive data
     """
-    return incentive_manager.get_all_incentives()
+    return _cached_read("/incentives", incentive_manager.get_all_incentives)
 
 
-@app.get("/incentives/{client_id}", response_model=Dict[str, Any])
-async def get_client_incentives(client_id: str) -> Dict[str, Any]:
+@app.get("/incentives/{client_id}", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_client_incentives(client_id: str) -> Response:
     """
     Get incentives for a specific client.
     
@@ -967,11 +1484,11 @@ async def get_client_incentives(client_id: str) -> Dict[str, Any]:
             status_code=404,
             detail=f"Incentives for client {client_id} not found"
         )
-    return incentives.to_dict()
+    return _ReadJSONResponse(incentives.to_dict())
 
 
-@app.get("/async/round/{round_id}/stats", response_model=Dict[str, Any])
-async def get_async_round_stats(round_id: int) -> Dict[str, Any]:
+@app.get("/async/round/{round_id}/stats", response_model=Dict[str, Any], response_class=_ReadJSONResponse)
+async def get_async_round_stats(round_id: int) -> Response:
     """
     Get async round statistics.
     
@@ -984,7 +1501,7 @@ async def get_async_round_stats(round_id: int) -> Dict[str, Any]:
     Raises:
         HTTPException: 404 if async mode not enabled or round not found
     """
-    if not async_round_manager:
+    if not async_round_manager.enabled:
         raise HTTPException(
             status_code=404,
             detail="Async round management is not enabled"
@@ -996,7 +1513,7 @@ async def get_async_round_stats(round_id: int) -> Dict[str, Any]:
             status_code=404,
             detail=f"Round {round_id} not found"
         )
-    return stats
+    return _ReadJSONResponse(stats)
 
 
 # LoRA Fine-Tuning Endpoints
@@ -1017,6 +1534,21 @@ async def dashboard_activity() -> Dict[str, Any]:
     }
 
 
+def _dashboard_round_snapshot() -> Tuple[set, int, List[int]]:
+    """Refreshed client set, round count and round ids (newest first) for the overview."""
+    with round_manager.lock:
+        round_manager.refresh_all_rounds()
+        # Overview client set must be durable-only (rounds/nodes), not local
+        # state_store — otherwise replica A (where clients register) reports
+        # extras that B never sees and the UI flickers under the edge LB.
+        clients_view: set = set()
+        for round_obj in round_manager.rounds.values():
+            clients_view.update(round_obj.assigned_clients)
+            clients_view.update(round_obj.updates_received)
+        round_manager.clients.update(clients_view)
+        return clients_view, len(round_manager.rounds), sorted(round_manager.rounds, reverse=True)
+
+
 @app.get("/dashboard/overview")
 async def dashboard_overview(
     limit: int = Query(25, ge=1, le=100),
@@ -1035,17 +1567,11 @@ async def dashboard_overview(
         include_sensitive = validate_operator_key(operator_key)
 
     # Multi-replica: reload durable rounds/clients so edge LB does not flip
-    # between an empty in-memory replica and a busy one.
-    round_manager.refresh_all_rounds()
-    # Overview client set must be durable-only (rounds/nodes), not local
-    # state_store — otherwise replica A (where clients register) reports
-    # extras that B never sees and the UI flickers under the edge LB.
-    clients_view: set = set()
-    for round_obj in round_manager.rounds.values():
-        clients_view.update(round_obj.assigned_clients)
-        clients_view.update(round_obj.updates_received)
-        round_manager.clients.update(round_obj.assigned_clients)
-        round_manager.clients.update(round_obj.updates_received)
+    # between an empty in-memory replica and a busy one. Reads the round files
+    # and waits on the round lock, so it runs in the threadpool.
+    clients_view, durable_rounds, classic_ids = await run_in_threadpool(
+        _dashboard_round_snapshot
+    )
     try:
         from persistence.json_repos import get_node_repository
 
@@ -1060,7 +1586,6 @@ async def dashboard_overview(
     all_metrics = metrics_collector.get_all_metrics()
     global_metrics = dict(all_metrics.get("global", {}) or {})
     # Prefer durable counts (process-local metrics stay Approximate under HA).
-    durable_rounds = len(round_manager.rounds)
     durable_clients = len(clients_view)
     global_metrics["total_rounds"] = max(
         int(global_metrics.get("total_rounds") or 0),
@@ -1073,7 +1598,6 @@ async def dashboard_overview(
     round_metrics_map = all_metrics.get("rounds", {})
 
     # Prefer live RoundManager state; fall back to metrics keys
-    classic_ids = sorted(round_manager.rounds.keys(), reverse=True)
     if not classic_ids:
         classic_ids = sorted(
             (int(k) for k in round_metrics_map.keys()),
@@ -1081,9 +1605,11 @@ async def dashboard_overview(
         )
     classic_ids = classic_ids[:limit]
 
+    statuses = await run_in_threadpool(
+        lambda: [round_manager.get_round_status(round_id) for round_id in classic_ids]
+    )
     classic_rounds: List[Dict[str, Any]] = []
-    for round_id in classic_ids:
-        status = round_manager.get_round_status(round_id)
+    for round_id, status in zip(classic_ids, statuses):
         metrics = round_metrics_map.get(str(round_id)) or round_metrics_map.get(round_id) or {}
         if status is None:
             classic_rounds.append({
@@ -1289,13 +1815,12 @@ async def submit_adapter(
     
     # Rate limiting
     if rate_limiter:
-        allowed, reason = rate_limiter.check_update_rate(request.client_id, round_id)
+        allowed, reason = await _rate_limit_call(_check_update_rate, request.client_id, round_id)
         if not allowed:
             raise HTTPException(
                 status_code=429,
                 detail=f"Rate limit exceeded: {reason}"
             )
-        rate_limiter.record_update(request.client_id, round_id)
     
     # Validate round exists
     config = get_lora_round(round_id)
@@ -1312,7 +1837,7 @@ async def submit_adapter(
         )
     
     # Validate adapter
-    is_valid, error_msg = validate_adapter(request.adapter_state_dict)
+    is_valid, error_msg = aggregation.validate_adapter(request.adapter_state_dict)
     if not is_valid:
         raise HTTPException(
             status_code=400,
@@ -1365,6 +1890,10 @@ async def download_adapter(
     return adapter_store.load_model(version)
 
 
+# LoRA rounds with an aggregation in progress in this process.
+_lora_rounds_aggregating: set = set()
+
+
 @app.post("/rounds/{round_id}/aggregate", response_model=AggregateRoundResponse)
 async def aggregate_lora_round(
     round_id: int,
@@ -1375,6 +1904,23 @@ async def aggregate_lora_round(
     Aggregate LoRA adapters for a round (default ΔW+SVD FedAvg).
     """
     _require_operator(operator_key)
+    # The heavy steps await the threadpool, so a second call for the same round
+    # could otherwise start while the first is still aggregating.
+    if round_id in _lora_rounds_aggregating:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Round {round_id} is already being aggregated",
+        )
+    _lora_rounds_aggregating.add(round_id)
+    try:
+        return await _aggregate_lora_round(round_id, request)
+    finally:
+        _lora_rounds_aggregating.discard(round_id)
+
+
+async def _aggregate_lora_round(
+    round_id: int, request: AggregateRoundRequest
+) -> AggregateRoundResponse:
     config = get_lora_round(round_id)
     if config is None:
         raise HTTPException(
@@ -1416,7 +1962,10 @@ async def aggregate_lora_round(
     strategy = request.strategy or os.getenv("LORA_AGG_STRATEGY", "delta_svd")
     lora_round_manager.set_state(round_id, "AGGREGATING")
 
-    aggregated_adapter = aggregate_lora_adapters(
+    # Aggregation, holdout evaluation and the adapter write are torch/disk bound;
+    # run them off the event loop so other requests keep being served.
+    aggregated_adapter = await run_in_threadpool(
+        aggregation.aggregate_lora_adapters,
         submissions,
         weight_by_samples=request.weight_by_samples,
         strategy=strategy,
@@ -1447,7 +1996,8 @@ async def aggregate_lora_round(
 
     lora_round_manager.set_state(round_id, "EVALUATING")
     try:
-        eval_result = evaluate_adapter(
+        eval_result = await run_in_threadpool(
+            evaluate_adapter,
             round_id=round_id,
             adapter_version=adapter_version,
             aggregated_adapter=aggregated_adapter,
@@ -1521,7 +2071,7 @@ async def aggregate_lora_round(
     }
 
     try:
-        adapter_store.save_model(adapter_version, adapter_data)
+        await run_in_threadpool(adapter_store.save_model, adapter_version, adapter_data)
     except Exception as e:
         lora_round_manager.set_state(round_id, "COLLECTING")
         logger.error(f"Failed to save adapter {adapter_version}: {e}")
@@ -1983,51 +2533,58 @@ async def stop_all_launch(
     return {"success": True, "stopped": n, "launcher": local_launcher.status()}
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with API information."""
-    endpoints = {
-        "health": "GET /health",
-        "ready": "GET /ready",
-        "register_client": "POST /client/register",
-        "get_task": "GET /task/{client_id}",
-        "submit_update": "POST /update",
-        "aggregate_round": "GET /aggregate/{round_id}",
-        "get_round_status": "GET /status/{round_id}",
-        "get_model": "GET /model/{version}",
-        "list_models": "GET /models",
-        "set_active_model": "POST /models/active",
-        "create_job": "POST /jobs",
-        "list_jobs": "GET /jobs",
-        "claim_job": "GET /jobs/claim",
-        "submit_job_result": "POST /jobs/{job_id}/result",
-        "launch_status": "GET /launch",
-        "launch_start": "POST /launch",
-        "launch_demo": "POST /launch/demo",
-        "launch_stop": "POST /launch/{process_id}/stop",
-        "launch_stop_all": "POST /launch/stop-all",
-        "get_all_metrics": "GET /metrics",
-        "get_latest_metrics": "GET /metrics/latest",
-        "get_round_metrics": "GET /metrics/round/{round_id}",
-        "get_all_reputations": "GET /reputation",
-        "get_client_reputation": "GET /reputation/{client_id}",
-        "get_all_incentives": "GET /incentives",
-        "get_client_incentives": "GET /incentives/{client_id}",
-        "get_async_round_stats": "GET /async/round/{round_id}/stats",
-        "dashboard_overview": "GET /dashboard/overview",
-        "create_lora_round": "POST /rounds/create",
-        "get_lora_round": "GET /rounds/{round_id}",
-        "download_lora_adapter": "GET /adapters/{version}",
-        "submit_lora_adapter": "POST /rounds/{round_id}/submit",
-        "aggregate_lora_round": "POST /rounds/{round_id}/aggregate"
-    }
-    
-    return {
+# The root document never changes after start-up: encode it once.
+_ROOT_ENDPOINTS = {
+    "health": "GET /health",
+    "ready": "GET /ready",
+    "register_client": "POST /client/register",
+    "get_task": "GET /task/{client_id}",
+    "submit_update": "POST /update",
+    "aggregate_round": "GET /aggregate/{round_id}",
+    "get_round_status": "GET /status/{round_id}",
+    "get_model": "GET /model/{version}",
+    "get_model_file": "GET /model/{version}/file",
+    "list_models": "GET /models",
+    "set_active_model": "POST /models/active",
+    "create_job": "POST /jobs",
+    "list_jobs": "GET /jobs",
+    "claim_job": "GET /jobs/claim",
+    "submit_job_result": "POST /jobs/{job_id}/result",
+    "launch_status": "GET /launch",
+    "launch_start": "POST /launch",
+    "launch_demo": "POST /launch/demo",
+    "launch_stop": "POST /launch/{process_id}/stop",
+    "launch_stop_all": "POST /launch/stop-all",
+    "get_all_metrics": "GET /metrics",
+    "get_latest_metrics": "GET /metrics/latest",
+    "stream_latest_metrics": "GET /metrics/stream",
+    "get_round_metrics": "GET /metrics/round/{round_id}",
+    "get_all_reputations": "GET /reputation",
+    "get_client_reputation": "GET /reputation/{client_id}",
+    "get_all_incentives": "GET /incentives",
+    "get_client_incentives": "GET /incentives/{client_id}",
+    "get_async_round_stats": "GET /async/round/{round_id}/stats",
+    "dashboard_overview": "GET /dashboard/overview",
+    "create_lora_round": "POST /rounds/create",
+    "get_lora_round": "GET /rounds/{round_id}",
+    "download_lora_adapter": "GET /adapters/{version}",
+    "submit_lora_adapter": "POST /rounds/{round_id}/submit",
+    "aggregate_lora_round": "POST /rounds/{round_id}/aggregate",
+}
+_ROOT_BODY = _ReadJSONResponse(
+    {
         "message": "Federated Learning Coordinator API",
         "version": "1.1.0",
         "async_enabled": enable_async,
-        "endpoints": endpoints
+        "endpoints": _ROOT_ENDPOINTS,
     }
+).body
+
+
+@app.get("/")
+async def root() -> Response:
+    """Root endpoint with API information."""
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/dashboard")
@@ -2044,5 +2601,8 @@ if _ui_dist.is_dir():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] installs uvloop and httptools; "auto" picks them when
+    # present and falls back to asyncio/h11 otherwise. Request handlers already
+    # log their own structured events, so the per-request access log is left off.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto", access_log=False)
 
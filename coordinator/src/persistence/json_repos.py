@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import os
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -63,56 +66,73 @@ class JsonRoundRepository:
     def __init__(self, rounds_path: Optional[str] = None):
         default = Path(__file__).resolve().parents[2] / "data" / "classic_rounds.json"
         self.rounds_path = Path(rounds_path or os.getenv("CLASSIC_ROUNDS_PATH", str(default)))
+        # ((mtime_ns, size), parsed file): rounds are refreshed on every /task and
+        # /update, so only re-parse when the file actually changed.
+        self._cache: Optional[tuple] = None
+        # save_round is a read-modify-write of the whole file and runs on
+        # several worker threads; concurrent saves must not drop each other.
+        self._write_lock = threading.Lock()
 
-    def save_round(self, round_rec: RoundRecord) -> None:
-        data: Dict[str, Any] = {"rounds": {}}
-        if self.rounds_path.exists():
-            data = json.loads(self.rounds_path.read_text(encoding="utf-8"))
-        data.setdefault("rounds", {})[str(round_rec.round_id)] = {
-            "round_id": round_rec.round_id,
-            "state": round_rec.state,
-            "model_version": round_rec.model_version,
-            "assigned_clients": round_rec.assigned_clients,
-            "updates_received": round_rec.updates_received,
-            "metadata": round_rec.metadata,
-        }
-        self.rounds_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = self.rounds_path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
-        os.replace(tmp, self.rounds_path)
-
-    def get_round(self, round_id: int) -> Optional[RoundRecord]:
-        if not self.rounds_path.exists():
-            return None
-        data = json.loads(self.rounds_path.read_text(encoding="utf-8"))
-        raw = (data.get("rounds") or {}).get(str(round_id))
-        if not raw:
-            return None
+    def _load(self) -> Dict[str, Any]:
+        try:
+            stat = self.rounds_path.stat()
+        except FileNotFoundError:
+            self._cache = None
+            return {"rounds": {}}
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is None or self._cache[0] != key:
+            self._cache = (key, json.loads(self.rounds_path.read_text(encoding="utf-8")))
+        return self._cache[1]
+
+    @staticmethod
+    def _record(raw: Dict[str, Any]) -> RoundRecord:
         return RoundRecord(
             round_id=int(raw["round_id"]),
             state=raw["state"],
             model_version=raw.get("model_version"),
             assigned_clients=list(raw.get("assigned_clients") or []),
             updates_received=list(raw.get("updates_received") or []),
-            metadata=dict(raw.get("metadata") or {}),
+            metadata=copy.deepcopy(dict(raw.get("metadata") or {})),
         )
 
-    def list_rounds(self, limit: int = 50) -> List[RoundRecord]:
-        if not self.rounds_path.exists():
-            return []
-        data = json.loads(self.rounds_path.read_text(encoding="utf-8"))
-        rows = []
-        for raw in (data.get("rounds") or {}).values():
-            rows.append(
-                RoundRecord(
-                    round_id=int(raw["round_id"]),
-                    state=raw["state"],
-                    model_version=raw.get("model_version"),
-                    assigned_clients=list(raw.get("assigned_clients") or []),
-                    updates_received=list(raw.get("updates_received") or []),
-                    metadata=dict(raw.get("metadata") or {}),
-                )
+    def save_round(self, round_rec: RoundRecord) -> None:
+        with self._write_lock:
+            # Copy the cached mapping so a failed write leaves the cache matching disk.
+            data: Dict[str, Any] = dict(self._load())
+            data["rounds"] = dict(data.get("rounds") or {})
+            data["rounds"][str(round_rec.round_id)] = {
+                "round_id": round_rec.round_id,
+                "state": round_rec.state,
+                "model_version": round_rec.model_version,
+                "assigned_clients": round_rec.assigned_clients,
+                "updates_received": round_rec.updates_received,
+                "metadata": copy.deepcopy(round_rec.metadata),
+            }
+            self.rounds_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.rounds_path.parent, prefix=self.rounds_path.name, suffix=".tmp"
             )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(json.dumps(data, indent=2, sort_keys=True))
+                os.replace(tmp, self.rounds_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            stat = self.rounds_path.stat()
+            self._cache = ((stat.st_mtime_ns, stat.st_size), data)
+
+    def get_round(self, round_id: int) -> Optional[RoundRecord]:
+        raw = (self._load().get("rounds") or {}).get(str(round_id))
+        if not raw:
+            return None
+        return self._record(raw)
+
+    def list_rounds(self, limit: int = 50) -> List[RoundRecord]:
+        rows = [self._record(raw) for raw in (self._load().get("rounds") or {}).values()]
         rows.sort(key=lambda r: r.round_id, reverse=True)
         return rows[:limit]
 
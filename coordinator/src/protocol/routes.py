@@ -10,6 +10,7 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Header, HTTPException, Query, Request
 from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 from artifacts import get_artifact_store
 from persistence import ArtifactRecord
@@ -48,7 +49,12 @@ def bind_dependencies(
     client_ip_fn,
     register_legacy_fn,
 ) -> None:
-    """Attach coordinator singletons (called once from main)."""
+    """
+    Attach coordinator singletons (called once from main).
+
+    register_legacy_fn(request) -> (already, api_key) is main's locked
+    /client/register implementation; /v2/node/register reuses it as is.
+    """
     router.auth_manager = auth_manager  # type: ignore[attr-defined]
     router.round_manager = round_manager  # type: ignore[attr-defined]
     router.update_validator = update_validator  # type: ignore[attr-defined]
@@ -92,33 +98,15 @@ async def register_node_v2(
     x_protocol_version: Optional[str] = Header(None, alias="X-Protocol-Version"),
 ) -> NodeRegisterV2Response:
     negotiated = _require_protocol(request.protocol_version or x_protocol_version or PROTOCOL_VERSION)
-    # Reuse legacy registration (PoP + key issue) then attach public key.
-    from core.auth import ClientAlreadyRegisteredError
-
-    auth = router.auth_manager  # type: ignore[attr-defined]
     geo = router.geo_presence  # type: ignore[attr-defined]
     geo.record(request.client_name, router.client_ip_fn(http_request))  # type: ignore[attr-defined]
 
-    already = auth.is_registered(request.client_name)
-    try:
-        api_key = auth.register_client(
-            request.client_name,
-            presented_key=request.api_key,
-        )
-    except ClientAlreadyRegisteredError as exc:
-        raise HTTPException(status_code=409, detail=str(exc)) from exc
-
-    rm = router.round_manager  # type: ignore[attr-defined]
-    if request.client_name not in rm.clients:
-        rm.register_client(request.client_name)
-
-    public_registered = False
-    if request.public_key:
-        try:
-            auth.set_public_key(request.client_name, request.public_key)
-            public_registered = True
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # Reuse legacy registration (PoP + key issue + public key). It writes the
+    # durable state file, so it runs in the threadpool.
+    already, api_key = await run_in_threadpool(
+        router.register_legacy_fn, request  # type: ignore[attr-defined]
+    )
+    public_registered = bool(request.public_key)
 
     message = (
         f"Client {request.client_name} resumed."
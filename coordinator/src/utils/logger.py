@@ -5,21 +5,46 @@ Provides JSON-formatted logging for the federated learning coordinator.
 Logs are both human-readable and machine-parseable.
 """
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
-from datetime import datetime, timezone
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter that outputs logs as JSON.
     
-    Ensures all logs are structured and parseable.
+    Ensures all logs are structured and parseable. One instance is shared by
+    the console and file handlers; a record is encoded once and the string is
+    reused by the second handler.
     """
-    
+
+    def __init__(self):
+        super().__init__()
+        # (whole second, "YYYY-MM-DDTHH:MM:SS") for the most recent record
+        self._second = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC time of the record, formatting the date part once per second."""
+        second = int(created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format a log record as JSON.
@@ -30,8 +55,12 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
+        cached = record.__dict__.get("_json_formatted")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "component": getattr(record, "component", "unknown"),
             "module": record.module,
@@ -58,7 +87,47 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data, sort_keys=True)
+        formatted = None
+        if orjson is not None:
+            try:
+                formatted = orjson.dumps(log_data, option=orjson.OPT_SORT_KEYS).decode()
+            except TypeError:
+                formatted = None
+        if formatted is None:
+            formatted = json.dumps(log_data, sort_keys=True)
+        record._json_formatted = (self, formatted)
+        return formatted
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Enqueue records for the listener thread without formatting them here.
+
+    The stock QueueHandler formats on the caller's thread and drops exc_info;
+    only the message arguments are merged now (they may change later), so
+    JSON encoding and the exception field happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background thread that runs the real stdout/file handlers.
+_listener: Optional[QueueListener] = None
+
+
+def stop_coordinator_logging() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(stop_coordinator_logging)
 
 
 def setup_coordinator_logger(
@@ -89,19 +158,30 @@ def setup_coordinator_logger(
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
     # Remove existing handlers to avoid duplicates
+    stop_coordinator_logging()
     logger.handlers.clear()
     
+    formatter = JSONFormatter()
+
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(JSONFormatter())
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
     
     # File handler (JSON logs)
     file_handler = logging.FileHandler(log_path / "coordinator.json.log")
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(formatter)
+
+    # Request handlers only enqueue; encoding and stdout/disk writes run on the
+    # listener thread so logging never blocks the event loop.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    global _listener
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
     
     return logger
 
@@ -0,0 +1,1469 @@
+"""Milestone 10: coordinator hot-path performance (behaviour must not change)."""
+
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+COORD_SRC = ROOT / "coordinator" / "src"
+
+
+def _ensure_path() -> None:
+    if str(COORD_SRC) not in sys.path:
+        sys.path.insert(0, str(COORD_SRC))
+
+
+@pytest.fixture(scope="module")
+def coordinator(tmp_path_factory):
+    """The coordinator app module, imported once with all of its state under a tmp dir."""
+    pytest.importorskip("httpx")  # TestClient transport
+    state = tmp_path_factory.mktemp("coordinator")
+    env = pytest.MonkeyPatch()
+    # Ahead of client/src, which other test modules may have put on the path
+    # and which has its own top-level packages of the same names (e.g. jobs).
+    env.syspath_prepend(str(COORD_SRC))
+    for name, path in {
+        "STATE_PATH": "state.json",
+        "CLASSIC_ROUNDS_PATH": "rounds.json",
+        "IDEMPOTENCY_PATH": "idempotency.json",
+        "ARTIFACT_STORE_ROOT": "artifacts",
+        "ARTIFACT_INDEX_PATH": "artifacts_index.json",
+        "LORA_STATE_PATH": "lora_rounds.json",
+        "JOB_QUEUE_STATE_PATH": "jobs.json",
+        "GEO_STATE_PATH": "geo.json",
+    }.items():
+        env.setenv(name, str(state / path))
+    env.setenv("GEO_LOOKUP_DISABLED", "true")
+    # Rounds are aggregated explicitly by the tests, not by the timeout monitor.
+    env.setenv("ENABLE_ASYNC_ROUNDS", "false")
+    env.delenv("OPERATOR_API_KEY", raising=False)
+    env.delenv("UPDATE_QUANTIZE_BITS", raising=False)
+    # State, models and metrics default to the checkout; keep test rounds out of it.
+    from core.state_store import StateStore
+
+    default_init = StateStore.__init__
+    env.setattr(
+        StateStore,
+        "__init__",
+        lambda self, path=None: default_init(self, path or str(state / "state.json")),
+    )
+    import main
+
+    env.setattr(main.model_store, "models_dir", state / "models")
+    main.model_store.models_dir.mkdir()
+    env.setattr(main.metrics_collector, "metrics_dir", state / "metrics")
+    env.setattr(main.metrics_collector, "logs_dir", state / "logs")
+    main.metrics_collector.metrics_dir.mkdir()
+    main.metrics_collector.logs_dir.mkdir()
+    yield main
+    env.undo()
+
+
+def _enroll(coordinator, client):
+    """Register a fresh client and assign it a task; returns (client_id, headers, round_id)."""
+    import uuid
+
+    client_id = f"c{uuid.uuid4().hex[:10]}"
+    registered = client.post(
+        "/client/register", json={"client_id": client_id, "client_name": client_id}
+    )
+    assert registered.status_code == 200, registered.text
+    headers = {"X-Api-Key": registered.json()["api_key"]}
+    task = client.get(f"/task/{client_id}", headers=headers)
+    assert task.status_code == 200, task.text
+    return client_id, headers, task.json()["round_id"]
+
+
+def _stored_update(coordinator, client_id, round_id):
+    """The JSON payload the aggregator buffered for client_id in round_id."""
+    import json
+
+    for update in coordinator.aggregator.updates.get(round_id, []):
+        if update.client_id == client_id:
+            return json.loads(update.weight_delta)
+    raise AssertionError(f"no update buffered for {client_id} in round {round_id}")
+
+
+def test_rate_limiter_uses_caller_clock():
+    _ensure_path()
+    from core.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(max_requests_per_minute=2, max_requests_per_hour=10)
+    assert limiter.check_request_rate("c1", now=1000.0)[0]
+    assert limiter.check_request_rate("c1", now=1001.0)[0]
+    allowed, reason = limiter.check_request_rate("c1", now=1002.0)
+    assert not allowed and "per minute" in reason
+    # A minute later the window has slid past the first two requests.
+    assert limiter.check_request_rate("c1", now=1062.0)[0]
+
+    stats = limiter.get_client_stats("c1", now=1062.0)
+    assert stats["requests_last_minute"] == 1
+    assert stats["requests_last_hour"] == 3
+
+    # An hour on, stale entries are trimmed from the sorted window.
+    assert limiter.check_request_rate("c1", now=4700.0)[0]
+    assert limiter.request_timestamps["c1"] == [4700.0]
+
+
+def test_refresh_round_reuses_live_instance(tmp_path):
+    _ensure_path()
+    from core.round_manager import RoundManager
+    from persistence.json_repos import JsonRoundRepository
+
+    rm = RoundManager(round_repo=JsonRoundRepository(rounds_path=str(tmp_path / "r.json")))
+    rm.register_client("a")
+    rid = rm.assign_client_to_round("a", "v1")
+    live = rm.rounds[rid]
+    seen_by_reader = live.assigned_clients
+    refreshed = rm.refresh_round(rid)
+    assert refreshed is live
+    assert "a" in refreshed.assigned_clients
+    # Containers are swapped whole, never emptied under a concurrent reader.
+    assert seen_by_reader == {"a"}
+
+
+def test_client_reputation_is_slotted():
+    _ensure_path()
+    from core.reputation import ClientReputation
+
+    rep = ClientReputation(client_id="c1")
+    assert not hasattr(rep, "__dict__")
+    assert rep.to_dict()["client_id"] == "c1"
+
+
+def test_top_clients_partial_selection_matches_full_sort():
+    _ensure_path()
+    from core.reputation import ReputationManager
+
+    mgr = ReputationManager()
+    for i in range(20):
+        cid = f"c{i}"
+        mgr.record_round_participation(cid, 1)
+        for _ in range(i % 4):
+            mgr.record_round_completion(cid, 1)
+        if i % 3 == 0:
+            mgr.record_update_rejected(cid, 1)
+    expected = sorted(
+        ((cid, rep.reputation_score) for cid, rep in mgr.reputations.items()),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:5]
+    assert mgr.get_top_clients(5) == expected
+
+
+def test_assignment_index_pruned_on_update_and_close():
+    _ensure_path()
+    from core.round_manager import RoundManager, RoundState
+
+    rm = RoundManager()
+    rm.register_client("a")
+    rm.register_client("b")
+    rid = rm.assign_client_to_round("a", "v1")
+    assert rm.assign_client_to_round("b", "v1") == rid
+    # Outstanding assignment for the same version blocks a second join.
+    assert rm.assign_client_to_round("a", "v1") is None
+
+    rm.add_update("a", rid, "{}")
+    assert "a" not in rm.client_round_assignments
+    rm.set_round_state(rid, RoundState.CLOSED)
+    assert rm.client_round_assignments == {}
+    assert rm.assign_client_to_round("a", "v1") == rid + 1
+
+
+def test_reputation_to_dict_score_matches_property():
+    _ensure_path()
+    from core.reputation import ClientReputation
+
+    rep = ClientReputation(
+        client_id="c1",
+        rounds_participated=5,
+        rounds_completed=3,
+        rounds_dropped=1,
+        updates_submitted=4,
+        updates_accepted=3,
+        total_latency_seconds=90.0,
+        latency_samples=3,
+    )
+    data = rep.to_dict()
+    assert data["reputation_score"] == rep.reputation_score
+    assert data["completion_rate"] == rep.completion_rate
+
+
+def test_update_payload_decoder_handles_typed_and_non_finite_payloads():
+    _ensure_path()
+    from core.update_validator import _decode_update_payload
+
+    assert _decode_update_payload('{"weight_delta": [[1, 2.5]], "num_samples": 3}') == {
+        "weight_delta": [[1.0, 2.5]],
+        "num_samples": 3,
+    }
+    assert _decode_update_payload('{"model_id": "m"}') == {"model_id": "m"}
+    # NaN/Infinity literals are not strict JSON; they must still reach the finite check.
+    assert math.isnan(_decode_update_payload('{"weight_delta": [[NaN]]}')["weight_delta"][0][0])
+    assert _decode_update_payload('{"weight_delta": [[1e400]]}') == {"weight_delta": [[float("inf")]]}
+
+
+def test_version_helpers_without_regex():
+    _ensure_path()
+    import pytest
+
+    from core.versioning import is_valid_version, next_version, parse_version_number
+
+    assert next_version("v9") == "v10"
+    assert parse_version_number("v42") == 42
+    assert is_valid_version("v1")
+    for bad in ("", "v", "1", "v1a", "V1", "v-1", "v²"):
+        assert not is_valid_version(bad)
+        assert parse_version_number(bad) is None
+    with pytest.raises(ValueError):
+        next_version("v")
+
+
+def test_update_batcher_checkpoints_once_per_batch():
+    _ensure_path()
+    import asyncio
+
+    from core.aggregator import Aggregator
+    from core.round_manager import RoundManager
+    from core.update_batcher import UpdateBatcher
+
+    class CountingStore:
+        def __init__(self):
+            self.saves = 0
+
+        def get_pending_updates(self):
+            return {}
+
+        def set_pending_updates(self, updates):
+            self.saves += 1
+
+    rm = RoundManager()
+    for cid in ("a", "b", "c"):
+        rm.register_client(cid)
+    rid = rm.assign_client_to_round("a", "v1")
+    rm.assign_client_to_round("b", "v1")
+    store = CountingStore()
+    aggregator = Aggregator(rm, state_store=store)
+    store.saves = 0
+    batcher = UpdateBatcher(aggregator, max_batch_size=8, max_wait_ms=5)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.submit("a", rid, "{}"),
+            batcher.submit("b", rid, "{}"),
+            batcher.submit("c", rid, "{}"),  # not assigned
+        )
+
+    assert asyncio.run(run()) == [True, True, False]
+    assert store.saves == 1
+    assert {u.client_id for u in aggregator.updates[rid]} == {"a", "b"}
+
+
+def test_batch_submits_and_aggregation_share_the_round_lock():
+    _ensure_path()
+    import threading
+
+    from core.aggregator import Aggregator
+    from core.round_manager import RoundManager
+
+    rm = RoundManager()
+    rm.register_client("a")
+    rid = rm.assign_client_to_round("a", "v1")
+    aggregator = Aggregator(rm)
+    assert aggregator._lock is rm.lock
+
+    results = []
+    with rm.lock:
+        # e.g. an aggregation in progress on another thread
+        submitter = threading.Thread(
+            target=lambda: results.append(aggregator.submit_updates_bulk([("a", rid, "{}")]))
+        )
+        submitter.start()
+        submitter.join(timeout=0.2)
+        assert submitter.is_alive() and results == []
+    submitter.join(timeout=5)
+    assert results == [[True]]
+    assert rm.rounds[rid].updates_received == {"a"}
+
+
+def test_update_batcher_reports_full_while_updates_wait():
+    _ensure_path()
+    import asyncio
+
+    from core.update_batcher import UpdateBatcher
+
+    class SlowAggregator:
+        def submit_updates_bulk(self, updates):
+            return [True] * len(updates)
+
+    batcher = UpdateBatcher(SlowAggregator(), max_batch_size=8, max_wait_ms=20, max_queued=2)
+
+    async def run():
+        first = asyncio.ensure_future(batcher.submit("a", 1, "{}"))
+        await asyncio.sleep(0)
+        assert batcher.queued == 1 and not batcher.is_full
+        second = asyncio.ensure_future(batcher.submit("b", 1, "{}"))
+        await asyncio.sleep(0)
+        assert batcher.is_full
+        results = await asyncio.gather(first, second)
+        assert batcher.queued == 0 and not batcher.is_full
+        return results
+
+    assert asyncio.run(run()) == [True, True]
+
+
+def test_update_batcher_reserved_slots_count_towards_the_bound():
+    _ensure_path()
+    import asyncio
+
+    from core.update_batcher import UpdateBatcher
+
+    class Aggregator:
+        def submit_updates_bulk(self, updates):
+            return [True] * len(updates)
+
+    batcher = UpdateBatcher(Aggregator(), max_batch_size=8, max_wait_ms=0, max_queued=2)
+    # Two updates still being validated fill the queue before either submits.
+    assert batcher.try_reserve() and batcher.try_reserve()
+    assert batcher.is_full and not batcher.try_reserve()
+    batcher.release()  # a rejected update gives its slot back
+    assert batcher.queued == 1
+
+    async def run():
+        accepted = await batcher.submit("a", 1, "{}", reserved=True)
+        # A reserved submit leaves the slot to its holder until release().
+        assert batcher.queued == 1
+        return accepted
+
+    assert asyncio.run(run()) is True
+    batcher.release()
+    assert batcher.queued == 0 and not batcher.is_full
+
+
+def test_vectorized_finite_check_reports_first_bad_element():
+    _ensure_path()
+    from core.privacy import PrivacyProtector
+
+    protector = PrivacyProtector()
+    assert protector.validate_update_values([[1.0, 2.0], [1e300]]) == (True, None)
+    ok, msg = protector.validate_update_values([[1.0], [3.0, float("nan"), float("inf")]])
+    assert not ok
+    assert msg == "Non-finite value found in parameter 1, element 1: nan"
+
+
+def test_registered_clients_are_a_hash_set(tmp_path):
+    _ensure_path()
+    from core.round_manager import RoundManager
+    from core.state_store import StateStore
+
+    store = StateStore(path=str(tmp_path / "state.json"))
+    rm = RoundManager(state_store=store)
+    rm.register_client("a")
+    # The validator's per-update registration check relies on O(1) membership.
+    assert isinstance(rm.clients, set)
+    assert isinstance(RoundManager(state_store=store).clients, set)
+
+
+def test_validator_rejects_malformed_and_oversize_before_auth():
+    _ensure_path()
+    from core.round_manager import RoundManager
+    from core.update_validator import UpdateValidator
+
+    class ExplodingAuth:
+        def validate_api_key(self, api_key, client_id):
+            raise AssertionError("auth must not run for rejected payloads")
+
+    validator = UpdateValidator(RoundManager(), auth_manager=ExplodingAuth(), max_delta_bytes=16)
+    assert validator.validate("a", 1, "") == (False, "invalid_weight_delta_format")
+    assert validator.validate("a", 1, "x" * 17) == (False, "payload_too_large")
+    # The limit is in UTF-8 bytes: 8 characters, 16 bytes passes; 9 (18 bytes) does not.
+    with pytest.raises(AssertionError, match="auth must not run"):
+        validator.validate("a", 1, "é" * 8)
+    assert validator.validate("a", 1, "é" * 9) == (False, "payload_too_large")
+    assert validator.validate("a", 1, "\U0001F600" * 5) == (False, "payload_too_large")
+
+
+def test_validator_rejection_logging_respects_level(caplog):
+    _ensure_path()
+    import logging
+
+    from core.round_manager import RoundManager
+    from core.update_validator import UpdateValidator, logger
+
+    validator = UpdateValidator(RoundManager())
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        assert validator.validate("ghost", 1, "{}") == (False, "client_not_registered")
+    record = caplog.records[-1]
+    assert record.reason == "client_not_registered" and not hasattr(record, "details")
+
+    caplog.clear()
+    previous = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        assert validator.validate("ghost", 1, "{}") == (False, "client_not_registered")
+    finally:
+        logger.setLevel(previous)
+    assert not caplog.records
+
+
+def test_token_bucket_limits_burst_and_refills():
+    _ensure_path()
+    from core.rate_limiter import RateLimiter, TokenBucketRateLimiter, get_rate_limiter
+
+    limiter = TokenBucketRateLimiter(max_requests_per_minute=2, max_requests_per_hour=3)
+    assert limiter.check_request_rate("c1", now=1000.0)[0]
+    assert limiter.check_request_rate("c1", now=1000.0)[0]
+    allowed, reason = limiter.check_request_rate("c1", now=1001.0)
+    assert not allowed and "per minute" in reason
+    # 30 seconds refills one minute token; the hour bucket still has one left.
+    assert limiter.check_request_rate("c1", now=1030.0)[0]
+    allowed, reason = limiter.check_request_rate("c1", now=1100.0)
+    assert not allowed and "per hour" in reason
+    assert limiter.get_client_stats("c1", now=1100.0)["requests_last_minute"] == 0
+    assert limiter.get_client_stats("new", now=1100.0)["requests_last_hour"] == 0
+
+    assert isinstance(get_rate_limiter(), TokenBucketRateLimiter)
+    assert type(get_rate_limiter(repo=object())) is RateLimiter
+    assert not get_rate_limiter().blocking_io
+    assert get_rate_limiter(repo=object()).blocking_io
+
+
+def _fake_redis():
+    import pytest
+
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis runs the Lua scripts through lupa
+    return fakeredis.FakeRedis()
+
+
+def test_redis_sliding_window_limits_requests_across_replicas():
+    client = _fake_redis()
+    _ensure_path()
+    from core.redis_rate_limiter import RedisSlidingWindowRateLimiter
+
+    replica_a = RedisSlidingWindowRateLimiter(client, max_requests_per_minute=2, max_requests_per_hour=3)
+    replica_b = RedisSlidingWindowRateLimiter(client, max_requests_per_minute=2, max_requests_per_hour=3)
+    assert replica_a.blocking_io
+    assert replica_a.check_request_rate("c1", now=1000.0) == (True, None)
+    assert replica_b.check_request_rate("c1", now=1001.0) == (True, None)
+    allowed, reason = replica_a.check_request_rate("c1", now=1002.0)
+    assert not allowed and "per minute" in reason
+    # The minute window slides; the hour log still holds both requests.
+    assert replica_b.check_request_rate("c1", now=1062.0) == (True, None)
+    allowed, reason = replica_a.check_request_rate("c1", now=1200.0)
+    assert not allowed and "per hour" in reason
+    replica_a.record_request("c2", now=1200.0)  # recorded without a check
+    assert replica_b.get_client_stats("c1", now=1200.0)["requests_last_hour"] == 3
+    assert replica_b.get_client_stats("c2", now=1200.0)["requests_last_minute"] == 1
+
+
+def test_redis_update_limit_is_checked_and_taken_atomically():
+    client = _fake_redis()
+    _ensure_path()
+    from core.redis_rate_limiter import RedisSlidingWindowRateLimiter
+
+    replica_a = RedisSlidingWindowRateLimiter(client, max_updates_per_round=2)
+    replica_b = RedisSlidingWindowRateLimiter(client, max_updates_per_round=2)
+    # Each check takes a slot, so interleaved replicas stop at the shared limit.
+    assert replica_a.check_update_rate("c1", 7) == (True, None)
+    assert replica_b.check_update_rate("c1", 7) == (True, None)
+    allowed, reason = replica_a.check_update_rate("c1", 7)
+    assert not allowed and "per round" in reason
+    assert int(client.get("fl:ratelimit:upd:c1:7")) == 2
+    assert 0 < client.ttl("fl:ratelimit:upd:c1:7") <= 86400
+
+    # record_update does not count the update a second time in Redis.
+    replica_a.record_update("c1", 7)
+    assert int(client.get("fl:ratelimit:upd:c1:7")) == 2
+    assert replica_a.get_client_stats("c1", now=0.0)["total_rounds_with_updates"] == 1
+
+    replica_a.reset_round(7)
+    assert client.get("fl:ratelimit:upd:c1:7") is None
+    assert replica_a.check_update_rate("c1", 7) == (True, None)
+
+
+def test_redis_token_bucket_script_modes_and_refill():
+    client = _fake_redis()
+    _ensure_path()
+    import pytest
+
+    from core.redis_rate_limiter import RedisTokenBucketRateLimiter
+
+    limiter = RedisTokenBucketRateLimiter(client, max_requests_per_minute=2, max_requests_per_hour=3)
+    bucket = limiter._run_bucket
+
+    # peek reports full buckets for a new client and writes nothing.
+    assert bucket("c1", 1000.0, "peek") == (0, 2.0, 3.0)
+    assert not client.exists("fl:ratelimit:bucket:c1")
+
+    # check spends one token from each bucket while both have one.
+    assert bucket("c1", 1000.0, "check") == (0, 1.0, 2.0)
+    assert bucket("c1", 1000.0, "check") == (0, 0.0, 1.0)
+    status, minute, hour = bucket("c1", 1001.0, "check")  # minute bucket empty
+    assert status == 1
+    assert minute == pytest.approx(2 / 60) and hour == pytest.approx(1 + 3 / 3600)
+
+    # record spends unconditionally, never below zero.
+    status, minute, hour = bucket("c1", 1001.0, "record")
+    assert status == 0 and minute == 0.0 and hour == pytest.approx(3 / 3600)
+
+    # 30 s refill one minute token; the hour bucket is still short.
+    status, minute, hour = bucket("c1", 1031.0, "check")
+    assert status == 2
+    assert minute == pytest.approx(1.0) and hour == pytest.approx(93 / 3600)
+    assert bucket("c1", 1031.0, "peek") == (0, minute, hour)
+
+    # Refill is capped at the limits.
+    assert bucket("c1", 1031.0 + 7200, "peek") == (0, 2.0, 3.0)
+
+    # The public API maps the status codes to the in-process messages.
+    allowed, reason = limiter.check_request_rate("c2", now=0.0)
+    assert allowed and reason is None
+    limiter.check_request_rate("c2", now=0.0)
+    allowed, reason = limiter.check_request_rate("c2", now=0.0)
+    assert not allowed and "per minute" in reason
+    assert limiter.get_client_stats("c2", now=0.0)["requests_last_minute"] == 2
+
+
+def test_finite_check_reuses_thread_scratch_buffer():
+    _ensure_path()
+    from core.privacy import PrivacyProtector
+
+    protector = PrivacyProtector()
+    assert protector.validate_update_values([[1.0, 2.0]]) == (True, None)
+    scratch = protector._scratch.values
+    ok, msg = protector.validate_update_values([[0.5] * 10, [float("inf")]])
+    assert not ok and "parameter 1, element 0" in msg
+    assert protector._scratch.values is scratch
+    # Nested tensors bypass the flat scratch buffer but are still checked.
+    assert not protector.validate_update_values([[[1.0], [float("nan")]]])[0]
+
+
+def test_api_key_validation_sees_revocation_immediately():
+    _ensure_path()
+    from core.auth import AuthManager
+
+    auth = AuthManager()
+    key = auth.register_client("a")
+    assert auth.validate_api_key(key, "a")
+    assert auth.validate_api_key(key)
+    assert not auth.validate_api_key(key, "b")
+    assert not auth.validate_api_key("", "a")
+    auth.revoke_client("a")
+    assert not auth.validate_api_key(key, "a")
+
+
+def test_vectorized_clipping_matches_elementwise_scaling():
+    _ensure_path()
+    import random
+
+    import pytest
+
+    from core.privacy import PrivacyProtector
+
+    protector = PrivacyProtector(max_norm=1.0)
+    layer = [3.0, 4, -12.0]  # norm 13
+    clipped, untouched = protector.clip_gradients([layer, [0.1, 0.2]])
+    scale = 1.0 / math.sqrt(sum(x * x for x in layer))
+    assert clipped == [x * scale for x in layer]
+    assert untouched == [0.1, 0.2]
+    with pytest.raises(TypeError):
+        protector.clip_gradients([["a"]])
+
+    # np.dot sums in a different order than the old generator, so on longer
+    # layers the norm (and each clipped value) may differ in the last ULPs.
+    rng = random.Random(7)
+    long_layer = [rng.uniform(-1.0, 1.0) for _ in range(10_001)]
+    (clipped,) = protector.clip_gradients([long_layer])
+    scale = 1.0 / math.sqrt(sum(x * x for x in long_layer))
+    assert clipped == pytest.approx([x * scale for x in long_layer], rel=1e-12)
+    assert math.sqrt(math.fsum(x * x for x in clipped)) == pytest.approx(1.0, rel=1e-12)
+
+
+def test_nested_tensors_are_checked_flattened():
+    _ensure_path()
+    from core.privacy import PrivacyProtector
+
+    protector = PrivacyProtector()
+    # Nested layers used to raise TypeError (and be let through unchecked);
+    # they are now checked as one flattened tensor.
+    assert protector.validate_update_values([[[1.0, 2.0], [3.0, 4.0]]]) == (True, None)
+    ok, msg = protector.validate_update_values([[0.5], [[1.0, 2.0], [3.0, float("inf")]]])
+    assert not ok
+    # The element index points into the flattened (row-major) tensor.
+    assert msg == "Non-finite value found in parameter 1, element 3: inf"
+
+
+def test_json_round_repo_reparses_only_when_file_changes(tmp_path, monkeypatch):
+    _ensure_path()
+    import json
+    import os
+
+    from persistence import RoundRecord
+    from persistence.json_repos import JsonRoundRepository
+
+    path = tmp_path / "rounds.json"
+    repo = JsonRoundRepository(rounds_path=str(path))
+    repo.save_round(
+        RoundRecord(round_id=1, state="OPEN", model_version="v1",
+                    assigned_clients=["a"], updates_received=[], metadata={"k": [1]})
+    )
+
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr(json, "loads", lambda raw: loads.append(1) or real_loads(raw))
+    rec = repo.get_round(1)
+    assert rec.assigned_clients == ["a"] and loads == []
+    rec.metadata["k"].append(2)  # callers get independent copies
+    assert repo.get_round(1).metadata == {"k": [1]}
+
+    # Another writer replaced the file: the next read picks it up.
+    data = real_loads(path.read_text())
+    data["rounds"]["1"]["state"] = "CLOSED"
+    path.write_text(json.dumps(data) + "\n" * 8)
+    os.utime(path, ns=(1, 1))
+    assert repo.get_round(1).state == "CLOSED"
+    assert loads == [1]
+
+
+def test_json_round_repo_concurrent_saves_keep_every_round(tmp_path):
+    _ensure_path()
+    from concurrent.futures import ThreadPoolExecutor
+
+    from persistence import RoundRecord
+    from persistence.json_repos import JsonRoundRepository
+
+    repo = JsonRoundRepository(rounds_path=str(tmp_path / "rounds.json"))
+
+    def save(round_id):
+        repo.save_round(
+            RoundRecord(round_id=round_id, state="OPEN", model_version="v1",
+                        assigned_clients=[], updates_received=[], metadata={})
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(save, range(1, 41)))
+
+    reloaded = JsonRoundRepository(rounds_path=str(tmp_path / "rounds.json"))
+    assert sorted(r.round_id for r in reloaded.list_rounds(limit=100)) == list(range(1, 41))
+    assert [p.name for p in tmp_path.iterdir()] == ["rounds.json"]
+
+
+def test_aggregation_worker_runs_rounds_off_thread_once():
+    _ensure_path()
+    import threading
+
+    from core.aggregation_worker import AggregationWorker
+
+    gate = threading.Event()
+    seen = []
+
+    def aggregate(round_id):
+        seen.append((round_id, threading.current_thread().name))
+        if round_id == 1:
+            gate.wait(timeout=5)
+        if round_id == 3:
+            raise RuntimeError("boom")
+
+    worker = AggregationWorker(aggregate)
+    try:
+        assert worker.enqueue(1)
+        assert worker.enqueue(2)
+        assert not worker.enqueue(2)  # already waiting behind round 1
+        assert worker.enqueue(3)
+        assert worker.enqueue(4)  # a failing round does not stop the worker
+        gate.set()
+        worker.wait_idle()
+    finally:
+        worker.shutdown()
+    assert [rid for rid, _ in seen] == [1, 2, 3, 4]
+    assert {name for _, name in seen} == {"aggregation-worker"}
+
+
+def test_validate_returns_unpackable_verdict_for_accept_and_reject():
+    _ensure_path()
+    from core.round_manager import RoundManager
+    from core.update_validator import UpdateValidator
+
+    rm = RoundManager()
+    rm.register_client("a")
+    rid = rm.assign_client_to_round("a", "v1")
+    validator = UpdateValidator(rm)
+    # Callers unpack (ok, reason); a bare tuple would always be truthy.
+    ok, reason = validator.validate("a", rid, '{"weight_delta": [[0.5]]}')
+    assert ok is True and reason is None
+    ok, reason = validator.validate("a", rid, '{"weight_delta": [[Infinity]]}')
+    assert ok is False and reason == "non_finite_values"
+
+
+def test_validated_payload_is_protected_without_reparsing():
+    _ensure_path()
+    from core.privacy import PrivacyProtector
+    from core.round_manager import RoundManager
+    from core.update_validator import UpdateValidator
+
+    rm = RoundManager()
+    rm.register_client("a")
+    rid = rm.assign_client_to_round("a", "v1")
+    protector = PrivacyProtector(max_norm=1.0)
+    validator = UpdateValidator(rm, privacy_protector=protector)
+    for raw in ('{"weight_delta": [[3.0, 4.0], [0.1]], "num_samples": 2}', "[[3, 4]]", "not json"):
+        ok, reason, payload = validator.validate_and_decode("a", rid, raw)
+        assert ok is True and reason is None
+        if payload is None:
+            assert raw == "not json"
+            continue
+        assert protector.protect_decoded_update(payload, raw) == protector.protect_update(raw)
+    assert validator.validate_and_decode("a", rid, '{"weight_delta": [[NaN]]}') == (
+        False, "non_finite_values", None
+    )
+
+
+def test_model_store_orders_versions_numerically(tmp_path):
+    _ensure_path()
+    from core.model_store import ModelStore
+
+    store = ModelStore(models_dir=str(tmp_path))
+    for name in ("v2", "v10", "v1", "v²", "vx"):
+        (tmp_path / f"model_{name}.json").write_text("{}", encoding="utf-8")
+    assert store.list_models() == ["v1", "v2", "v10"]
+    assert store.latest_model_version() == "v10"
+
+
+def test_model_store_get_model_path_only_returns_existing_files(tmp_path):
+    _ensure_path()
+    import pytest
+    from core.model_store import ModelStore
+
+    store = ModelStore(models_dir=str(tmp_path))
+    store.save_model("v1", {"weights": [1.0]})
+    assert store.get_model_path("v1") == tmp_path / "model_v1.json"
+    for missing in ("v2", "../v1", "v1/x"):
+        with pytest.raises(FileNotFoundError):
+            store.get_model_path(missing)
+
+
+def test_model_store_etag_changes_when_the_model_is_replaced(tmp_path):
+    _ensure_path()
+    import os
+    import pytest
+    from core.model_store import ModelStore
+
+    store = ModelStore(models_dir=str(tmp_path))
+    store.save_model("v1", {"weights": [1.0]})
+    etag = store.model_etag("v1")
+    assert etag.startswith('"v1-') and etag == store.model_etag("v1")
+    store.save_model("v1", {"weights": [2.0, 3.0]})
+    os.utime(store.get_model_path("v1"), ns=(1, 1))
+    assert store.model_etag("v1") != etag
+    with pytest.raises(FileNotFoundError):
+        store.model_etag("v2")
+
+
+def test_model_store_gzip_copy_is_reused_until_the_model_changes(tmp_path):
+    _ensure_path()
+    import gzip
+    import json
+    import os
+    from core.model_store import ModelStore
+
+    store = ModelStore(models_dir=str(tmp_path))
+    store.save_model("v1", {"weights": [1.0]})
+    gz_path = store.get_gzip_model_path("v1")
+    assert gz_path == tmp_path / "model_v1.json.gz"
+    assert json.loads(gzip.decompress(gz_path.read_bytes())) == {"weights": [1.0]}
+    built_at = gz_path.stat().st_mtime_ns
+    assert store.get_gzip_model_path("v1").stat().st_mtime_ns == built_at
+    assert store.list_models() == ["v1"]
+
+    store.save_model("v1", {"weights": [2.0]})
+    model_path = store.get_model_path("v1")
+    os.utime(model_path, ns=(built_at + 1, built_at + 1))
+    assert json.loads(gzip.decompress(store.get_gzip_model_path("v1").read_bytes())) == {"weights": [2.0]}
+
+
+def test_reputation_bulk_accept_persists_each_client_once():
+    _ensure_path()
+    from core.reputation import ReputationManager
+
+    class CountingRepo:
+        def __init__(self):
+            self.saved = []
+
+        def list_all(self):
+            return []
+
+        def save(self, data, client_rounds=None):
+            self.saved.append(data["client_id"])
+
+    repo = CountingRepo()
+    manager = ReputationManager(repo=repo)
+    manager.record_updates_accepted([("a", 1), ("b", 1), ("a", 2)])
+    assert repo.saved == ["a", "b"]
+    rep = manager.get_reputation("a")
+    assert (rep.updates_submitted, rep.updates_accepted) == (2, 2)
+
+
+def test_update_batcher_reports_accepted_updates_once_per_batch():
+    _ensure_path()
+    import asyncio
+    from core.aggregator import Aggregator
+    from core.round_manager import RoundManager
+    from core.update_batcher import UpdateBatcher
+
+    rm = RoundManager()
+    for cid in ("a", "b", "c"):
+        rm.register_client(cid)
+    rid = rm.assign_client_to_round("a", "v1")
+    rm.assign_client_to_round("b", "v1")
+    batches = []
+    batcher = UpdateBatcher(
+        Aggregator(rm), max_batch_size=8, max_wait_ms=5, on_accepted=batches.append
+    )
+
+    async def run():
+        return await asyncio.gather(
+            batcher.submit("a", rid, "{}"),
+            batcher.submit("c", rid, "{}"),  # not assigned
+            batcher.submit("b", rid, "{}"),
+        )
+
+    assert asyncio.run(run()) == [True, False, True]
+    assert batches == [[("a", rid), ("b", rid)]]
+
+
+def test_quantized_update_round_trips_through_aggregator_parse():
+    _ensure_path()
+    import json
+    from core.aggregator import _parse_weight_delta
+    from core.quantization import QUANTIZED_KEY, SCALE_KEY, quantize_update_payload
+
+    raw = json.dumps({"weight_delta": [[0.5, -0.25, 0.0], [0.0, 0.0]], "base_weights": [[1.0, 1.0, 1.0], [2.0, 2.0]]})
+    stored = quantize_update_payload(raw, 8)
+    payload = json.loads(stored)
+    assert payload["weight_delta"] == [[127, -64, 0], [0, 0]]
+    assert payload["base_weights"] == [[1.0, 1.0, 1.0], [2.0, 2.0]]
+    assert len(payload[SCALE_KEY]) == 2 and payload[QUANTIZED_KEY] == 8
+    delta = _parse_weight_delta(stored)
+    assert all(math.isclose(a, b, abs_tol=0.5 / 127) for a, b in zip(delta[0], [0.5, -0.25, 0.0]))
+    assert delta[1] == [0.0, 0.0]
+    # Not a layered payload: left untouched.
+    assert quantize_update_payload('{"weight_delta": "x"}', 8) == '{"weight_delta": "x"}'
+
+
+def test_client_supplied_quantization_scales_are_rejected_and_never_applied():
+    _ensure_path()
+    import json
+
+    from core.aggregator import _parse_weight_delta
+    from core.privacy import PrivacyProtector
+    from core.quantization import QUANTIZED_KEY, SCALE_KEY
+    from core.round_manager import RoundManager
+    from core.update_validator import UpdateValidator
+
+    rm = RoundManager()
+    rm.register_client("a")
+    rid = rm.assign_client_to_round("a", "v1")
+    validator = UpdateValidator(rm, privacy_protector=PrivacyProtector(max_norm=1.0))
+    # Scales would be applied after clipping and the finite check.
+    for extra in ({SCALE_KEY: [1e6]}, {SCALE_KEY: [1e308], QUANTIZED_KEY: 8}, {QUANTIZED_KEY: 8}):
+        raw = json.dumps({"weight_delta": [[0.5, 0.5]], **extra})
+        assert validator.validate_and_decode("a", rid, raw) == (False, "reserved_field", None)
+    # Even if one reaches the buffer, scales the coordinator did not mark are not trusted.
+    assert _parse_weight_delta(json.dumps({"weight_delta": [[0.5, 0.5]], SCALE_KEY: [1e6]})) is None
+
+
+def test_quantizing_the_protected_payload_skips_a_second_parse(monkeypatch):
+    _ensure_path()
+    import json
+
+    import core.quantization as quantization
+    from core.privacy import PrivacyProtector
+
+    protector = PrivacyProtector(max_norm=1.0)
+    raw = json.dumps({"weight_delta": [[3.0, 4.0], [0.1, -0.2]], "num_samples": 5})
+    protected = protector.protect_update(raw)
+    expected = quantization.quantize_update_payload(protected, 8)
+
+    payload = json.loads(raw)
+    protected = protector.protect_decoded_update(payload, raw)
+
+    def no_parse(_raw):
+        raise AssertionError("payload parsed again")
+
+    monkeypatch.setattr(quantization.json, "loads", no_parse)
+    assert quantization.quantize_decoded_payload(payload, protected, 8) == expected
+    assert quantization.quantize_decoded_payload([[1.0]], "[[1.0]]", 8) == "[[1.0]]"
+
+
+def test_metrics_revision_changes_on_every_update(tmp_path):
+    _ensure_path()
+    from core.metrics import MetricsCollector
+
+    collector = MetricsCollector(metrics_dir=str(tmp_path / "m"), logs_dir=str(tmp_path / "l"))
+    seen = {collector.revision}
+    collector.start_round(1, "v1")
+    seen.add(collector.revision)
+    collector.record_updates_accepted([1, 1])
+    seen.add(collector.revision)
+    collector.record_update_rejected(1)
+    seen.add(collector.revision)
+    collector.record_client_seen("c1")
+    seen.add(collector.revision)
+    collector.record_client_seen("c1")  # already counted: no change, no bump
+    seen.add(collector.revision)
+    assert len(seen) == 5
+    assert collector.get_all_metrics()["global"]["total_clients_seen"] == 1
+    assert collector.get_latest_round_metrics()["updates_accepted"] == 2
+
+
+def test_metrics_revision_is_bumped_after_the_change(tmp_path):
+    _ensure_path()
+    from core.metrics import MetricsCollector
+
+    collector = MetricsCollector(metrics_dir=str(tmp_path / "m"), logs_dir=str(tmp_path / "l"))
+    collector.start_round(1, "v1")
+    metrics = collector.round_metrics[1]
+    revisions_during_write = []
+
+    class Watched(type(metrics)):
+        def __setattr__(self, name, value):
+            revisions_during_write.append(collector.revision)
+            super().__setattr__(name, value)
+
+    metrics.__class__ = Watched
+    before = collector.revision
+    collector.complete_aggregation(1)
+    # A /metrics read keyed on the new revision can only see the new state.
+    assert revisions_during_write == [before]
+    assert collector.revision == before + 1
+
+
+def test_round_metrics_snapshot_is_reused_until_a_counter_changes(tmp_path):
+    _ensure_path()
+    from dataclasses import asdict
+    from core.metrics import MetricsCollector
+
+    collector = MetricsCollector(metrics_dir=str(tmp_path / "m"), logs_dir=str(tmp_path / "l"))
+    collector.start_round(2, "v1")
+    collector.start_round(1, "v1")
+    first = collector.get_round_metrics(2)
+    assert collector.get_round_metrics(2) is first
+    assert collector.get_latest_round_metrics() is first
+
+    collector.record_update_received(2)
+    updated = collector.get_round_metrics(2)
+    assert updated is not first and updated["updates_received"] == 1
+    expected = asdict(collector.round_metrics[2])
+    del expected["_snapshot"], expected["_version"]
+    assert {k: updated[k] for k in expected} == expected
+
+
+def test_round_metrics_snapshot_built_during_an_update_is_not_reused():
+    _ensure_path()
+    from core.metrics import RoundMetrics
+
+    metrics = RoundMetrics(round_id=1, model_version="v1", round_start_time=0.0)
+    version = metrics._version
+    # A reader on another thread builds from the old counters while a writer
+    # increments; its snapshot is tagged with the version it started from.
+    stale = metrics.to_dict()
+    metrics.updates_received += 1
+    object.__setattr__(metrics, "_snapshot", (version, stale))
+    assert metrics.to_dict()["updates_received"] == 1
+
+
+def test_response_cache_expires_and_clears():
+    _ensure_path()
+    from core.response_cache import ResponseCache
+
+    now = [100.0]
+    cache = ResponseCache(ttl_seconds=0.5, max_entries=2, clock=lambda: now[0])
+    cache.put("/a", b"1")
+    assert cache.get("/a") == b"1"
+    now[0] += 0.5
+    assert cache.get("/a") is None
+    cache.put("/a", b"1")
+    cache.put("/b", b"2")
+    cache.put("/c", b"3")  # evicts the oldest
+    assert cache.get("/a") is None and cache.get("/c") == b"3"
+    cache.clear()
+    assert cache.get("/b") is None
+    disabled = ResponseCache(ttl_seconds=0)
+    disabled.put("/a", b"1")
+    assert disabled.get("/a") is None
+
+
+def test_body_size_limit_rejects_before_reading():
+    _ensure_path()
+    import asyncio
+    from starlette.exceptions import HTTPException
+    from core.body_limit import BodySizeLimitMiddleware
+
+    async def echo(scope, receive, send):
+        size = 0
+        while True:
+            message = await receive()
+            size += len(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": str(size).encode()})
+
+    middleware = BodySizeLimitMiddleware(echo, max_bytes=10, paths=("/update",))
+
+    def post(path, chunks, declared=None):
+        headers = [] if declared is None else [(b"content-length", str(declared).encode())]
+        scope = {"type": "http", "path": path, "headers": headers}
+        messages = [
+            {"type": "http.request", "body": c, "more_body": i < len(chunks) - 1}
+            for i, c in enumerate(chunks)
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(middleware(scope, receive, send))
+        return sent[0]["status"], sent[1]["body"]
+
+    assert post("/update", [b"x" * 10], declared=10) == (200, b"10")
+    assert post("/update", [b"x" * 11], declared=11)[0] == 413
+    try:
+        post("/update", [b"x" * 6, b"x" * 6])
+    except HTTPException as exc:
+        assert exc.status_code == 413
+    else:
+        raise AssertionError("streamed oversize body was not rejected")
+    assert post("/other", [b"x" * 11], declared=11) == (200, b"11")
+
+
+def test_update_auth_gate_rejects_unknown_header_key_before_body():
+    _ensure_path()
+    import asyncio
+    from core.auth_gate import UpdateAuthGateMiddleware
+
+    async def endpoint(scope, receive, send):
+        await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = UpdateAuthGateMiddleware(
+        endpoint, key_owner={"good": "c1"}.get, paths=("/update",)
+    )
+
+    def post(path, headers):
+        reads = []
+
+        async def receive():
+            reads.append(1)
+            return {"type": "http.request", "body": b"{}", "more_body": False}
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(middleware({"type": "http", "path": path, "headers": headers}, receive, send))
+        return sent[0]["status"], len(reads)
+
+    assert post("/update", [(b"x-api-key", b"bad")]) == (401, 0)
+    assert post("/update", [(b"authorization", b"Bearer bad")]) == (401, 0)
+    assert post("/update", [(b"authorization", b"Bearer bad"), (b"x-api-key", b"good")]) == (200, 1)
+    assert post("/update", [(b"x-api-key", b"good")]) == (200, 1)
+    # No header credentials: the body api_key is checked by the endpoint.
+    assert post("/update", []) == (200, 1)
+    assert post("/other", [(b"x-api-key", b"bad")]) == (200, 1)
+
+
+def test_async_round_clock_starts_once_and_is_monotonic():
+    _ensure_path()
+    from core.async_round_manager import AsyncRoundConfig, AsyncRoundManager
+    from core.round_manager import RoundManager
+
+    manager = AsyncRoundManager(RoundManager(), AsyncRoundConfig(enable_async=True))
+    try:
+        assert manager.elapsed_seconds(1) is None
+        manager.start_round(1)
+        first = manager.round_start_times[1]
+        manager.start_round(1)  # a later assignment must not restart the clock
+        assert manager.round_start_times[1] == first
+        assert 0.0 <= manager.elapsed_seconds(1) < 5.0
+    finally:
+        manager.shutdown()
+    assert not manager._timeout_thread.is_alive()
+
+
+def test_null_async_round_manager_matches_the_real_interface():
+    _ensure_path()
+    from core.async_round_manager import AsyncRoundManager, NullAsyncRoundManager
+
+    null = NullAsyncRoundManager()
+    public = {name for name in vars(AsyncRoundManager) if not name.startswith("_")}
+    missing = {name for name in public if not hasattr(null, name)}
+    assert missing <= {"get_stragglers_for_round"}, missing
+    assert not null.enabled and null.on_round_ready is None
+    null.start_round(1)
+    null.mark_round_closed(1)
+    assert 1 not in null.closed_rounds
+    assert null.elapsed_seconds(1) is None and not null.check_round_ready(1)
+    assert null.get_round_stats(1) == {}
+
+
+def test_classic_aggregation_import_does_not_load_torch():
+    import subprocess
+
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "import core.aggregator, aggregation\n"
+        "assert 'torch' not in sys.modules\n"
+        "assert callable(aggregation.get_strategy)\n"
+    ) % str(COORD_SRC)
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_msgpack_update_round_trips_json_and_float32_layers(coordinator):
+    msgspec = pytest.importorskip("msgspec")
+    import json
+
+    import numpy as np
+    from fastapi.testclient import TestClient
+
+    client = TestClient(coordinator.app)
+    headers = {"Content-Type": "application/msgpack"}
+
+    # chunk5-2: weight_delta as the same JSON string /update takes
+    client_id, auth, round_id = _enroll(coordinator, client)
+    payload = {"weight_delta": [[0.5, -0.25]], "num_samples": 3}
+    body = {"client_id": client_id, "round_id": round_id, "weight_delta": json.dumps(payload)}
+    r = client.post("/update/msgpack", content=msgspec.msgpack.encode(body), headers={**headers, **auth})
+    assert r.status_code == 200 and r.json()["success"], r.text
+    assert _stored_update(coordinator, client_id, round_id)["weight_delta"] == [[0.5, -0.25]]
+
+    # chunk6-8: raw little-endian float32 layers (f32 is also the default dtype)
+    layers = [np.array([0.1, -0.2, 0.3], dtype="<f4"), np.array([1.5], dtype="<f4")]
+    for dtype_header in ({}, {"X-FL-Dtype": "f32"}):
+        client_id, auth, round_id = _enroll(coordinator, client)
+        body = {
+            "client_id": client_id,
+            "round_id": round_id,
+            "weight_delta": {"weight_delta": [layer.tobytes() for layer in layers]},
+        }
+        r = client.post(
+            "/update/msgpack",
+            content=msgspec.msgpack.encode(body),
+            headers={**headers, **auth, **dtype_header},
+        )
+        assert r.status_code == 200 and r.json()["success"], r.text
+        stored = _stored_update(coordinator, client_id, round_id)["weight_delta"]
+        assert stored == [layer.tolist() for layer in layers]
+
+
+def test_msgpack_bfloat16_layers_widen_exactly_and_bad_input_is_rejected(coordinator):
+    msgspec = pytest.importorskip("msgspec")
+    import numpy as np
+    from fastapi.testclient import TestClient
+
+    client = TestClient(coordinator.app)
+    headers = {"Content-Type": "application/msgpack"}
+    # Every value is exactly representable in bfloat16 (8-bit mantissa).
+    values = np.array([1.5, -0.25, 3.0, 0.0078125, -2.0], dtype="<f4")
+    bf16 = (values.view("<u4") >> 16).astype("<u2").tobytes()
+
+    client_id, auth, round_id = _enroll(coordinator, client)
+
+    def post(layer, dtype):
+        body = {"client_id": client_id, "round_id": round_id, "weight_delta": {"weight_delta": [layer]}}
+        return client.post(
+            "/update/msgpack",
+            content=msgspec.msgpack.encode(body),
+            headers={**headers, **auth, "X-FL-Dtype": dtype},
+        )
+
+    assert post(bf16, "xf8").status_code == 400
+    assert "Unsupported X-FL-Dtype" in post(bf16, "xf8").json()["detail"]
+    r = post(bf16[:-1], "bf16")
+    assert r.status_code == 400 and "length % 2 == 0" in r.json()["detail"]
+    r = post(values.tobytes()[:-2], "f32")
+    assert r.status_code == 400 and "length % 4 == 0" in r.json()["detail"]
+
+    r = post(bf16, "BFloat16")
+    assert r.status_code == 200 and r.json()["success"], r.text
+    stored = _stored_update(coordinator, client_id, round_id)["weight_delta"]
+    assert stored == [values.tolist()]
+
+
+
+def test_concurrent_aggregate_calls_share_one_run(coordinator, monkeypatch):
+    import asyncio
+    import threading
+    import time
+
+    import httpx
+
+    round_id = 10_001
+    calls = []
+    release = threading.Event()
+
+    def slow_aggregate(rid):
+        calls.append(rid)
+        release.wait(5)
+        return {"round_id": rid, "model_version": "v2", "status": "aggregating", "num_updates": 3}
+
+    monkeypatch.setattr(coordinator.aggregator, "aggregate", slow_aggregate)
+
+    async def run():
+        transport = httpx.ASGITransport(app=coordinator.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://coordinator") as client:
+            requests = [
+                asyncio.ensure_future(client.request(method, f"/aggregate/{round_id}"))
+                for method in ("GET", "POST", "GET", "POST")
+            ]
+            deadline = time.monotonic() + 5
+            while not calls and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)  # the other callers join the run in flight
+            assert round_id in coordinator._aggregations_in_flight
+            release.set()
+            return await asyncio.gather(*requests)
+
+    responses = asyncio.run(run())
+    assert calls == [round_id]
+    assert {r.status_code for r in responses} == {200}
+    assert all(r.json() == responses[0].json() for r in responses)
+    assert responses[0].json()["num_updates"] == 3
+    assert round_id not in coordinator._aggregations_in_flight
+
+
+def test_closed_aggregate_replay_is_served_from_cache(coordinator, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    round_id = 10_002
+    calls = []
+
+    def aggregate(rid):
+        calls.append(rid)
+        return {
+            "round_id": rid,
+            "model_version": "v7",
+            "status": "already_closed",
+            "aggregated_model": {"weights": [[0.5, 0.25]]},
+            "num_updates": 2,
+        }
+
+    monkeypatch.setattr(coordinator.aggregator, "aggregate", aggregate)
+    client = TestClient(coordinator.app)
+    first = client.post(f"/aggregate/{round_id}")
+    assert first.status_code == 200 and first.json()["status"] == "already_closed"
+    assert coordinator.closed_aggregate_cache.get(f"/aggregate/{round_id}") is not None
+    replays = [client.get(f"/aggregate/{round_id}"), client.post(f"/aggregate/{round_id}")]
+    assert calls == [round_id]
+    assert all(r.content == first.content for r in replays)
+
+
+def test_update_batch_falls_back_to_request_key_and_reports_each_item(coordinator):
+    import json
+
+    from fastapi.testclient import TestClient
+
+    client = TestClient(coordinator.app)
+    relay_id, relay_auth, relay_round = _enroll(coordinator, client)
+    own_id, own_auth, own_round = _enroll(coordinator, client)
+    other_id, _, other_round = _enroll(coordinator, client)
+
+    def item(client_id, round_id, value, api_key=None):
+        update = {
+            "client_id": client_id,
+            "round_id": round_id,
+            "weight_delta": json.dumps({"weight_delta": [[value]]}),
+        }
+        if api_key is not None:
+            update["api_key"] = api_key
+        return update
+
+    updates = [
+        item(relay_id, relay_round, 0.1),  # no api_key: uses the request's X-Api-Key
+        item(other_id, other_round, 0.2, api_key="not-a-key"),
+        item(own_id, own_round, 0.3, api_key=own_auth["X-Api-Key"]),
+        item(other_id, other_round, 0.4),  # the relay's key does not own this client
+    ]
+    r = client.post("/update/batch", json={"updates": updates}, headers=relay_auth)
+    assert r.status_code == 200, r.text
+    results = r.json()
+    # One result per update, in request order; failures do not fail the batch.
+    assert [result["success"] for result in results] == [True, False, True, False]
+    assert relay_id in results[0]["message"] and own_id in results[2]["message"]
+    assert results[1]["message"] == results[3]["message"] == "Authentication failed. Valid API key required."
+    assert _stored_update(coordinator, relay_id, relay_round)["weight_delta"] == [[0.1]]
+    assert _stored_update(coordinator, own_id, own_round)["weight_delta"] == [[0.3]]
+    with pytest.raises(AssertionError):
+        _stored_update(coordinator, other_id, other_round)
+
+
+def test_vectorized_strategies_match_scalar_reference():
+    _ensure_path()
+    import random
+
+    from aggregation.strategies import (
+        AdaptiveFedAvgStrategy,
+        ClientContribution,
+        FedAvgStrategy,
+        RobustTrimmedMeanStrategy,
+    )
+
+    # The per-coordinate loops the strategies used before vectorization.
+    def scalar_fedavg(deltas):
+        return [
+            [sum(float(d[layer][i]) for d in deltas) / len(deltas) for i in range(len(deltas[0][layer]))]
+            for layer in range(len(deltas[0]))
+        ]
+
+    def scalar_adaptive(deltas, weights):
+        total = sum(weights)
+        averaged = []
+        for layer in range(len(deltas[0])):
+            avg = [0.0] * len(deltas[0][layer])
+            for d, w in zip(deltas, weights):
+                for i, v in enumerate(d[layer]):
+                    avg[i] += float(v) * (w / total)
+            averaged.append(avg)
+        return averaged
+
+    def scalar_robust(deltas, trim_ratio):
+        n = len(deltas)
+        averaged = []
+        for layer in range(len(deltas[0])):
+            avg = []
+            for i in range(len(deltas[0][layer])):
+                values = sorted(float(d[layer][i]) for d in deltas)
+                if n < 3:
+                    mid = n // 2
+                    avg.append(values[mid] if n % 2 else 0.5 * (values[mid - 1] + values[mid]))
+                else:
+                    k = int(n * trim_ratio)
+                    trimmed = values[k : n - k] if n - 2 * k > 0 else values
+                    avg.append(sum(trimmed) / len(trimmed))
+            averaged.append(avg)
+        return averaged
+
+    rng = random.Random(3)
+
+    def contributions(n):
+        return [
+            ClientContribution(
+                client_id=f"c{c}",
+                # Mixed ints and floats, as parsed from client JSON.
+                weight_delta=[
+                    [rng.uniform(-1.0, 1.0) for _ in range(17)],
+                    [rng.randint(-5, 5) for _ in range(4)],
+                ],
+                num_samples=rng.randint(1, 100),
+            )
+            for c in range(n)
+        ]
+
+    for n in (1, 2, 3, 4, 7, 10):
+        contribs = contributions(n)
+        deltas = [c.weight_delta for c in contribs]
+        # Summation runs client by client, as in the loops, so results are identical.
+        assert FedAvgStrategy().aggregate(contribs).averaged_delta == scalar_fedavg(deltas)
+        weights = [float(c.num_samples) for c in contribs]
+        assert AdaptiveFedAvgStrategy().aggregate(contribs).averaged_delta == scalar_adaptive(deltas, weights)
+        for trim_ratio in (0.0, 0.1, 0.25, 0.4):
+            robust = RobustTrimmedMeanStrategy(trim_ratio=trim_ratio).aggregate(contribs)
+            assert robust.averaged_delta == scalar_robust(deltas, trim_ratio)
+        # n == 2 takes the even-count median (mean of the two middle values).
+        assert robust.details["method"] == ("median" if n < 3 else "trimmed_mean")
+
+    # Trimming that would drop every value falls back to the mean of all of them.
+    contribs = contributions(4)
+    strategy = RobustTrimmedMeanStrategy()
+    strategy.trim_ratio = 0.5  # beyond the constructor's clamp; k == n / 2
+    deltas = [c.weight_delta for c in contribs]
+    fallback = strategy.aggregate(contribs).averaged_delta
+    assert fallback == scalar_robust(deltas, 0.5)
+    # Same mean as FedAvg, summed in sorted rather than client order.
+    for layer, expected in zip(fallback, scalar_fedavg(deltas)):
+        assert layer == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_queued_log_records_keep_exc_info_and_are_encoded_once():
+    _ensure_path()
+    import io
+    import json
+    import logging
+    import queue
+    import threading
+    from logging.handlers import QueueListener
+
+    from utils.logger import JSONFormatter, _RecordQueueHandler
+
+    formatter = JSONFormatter()
+    encodes = []
+    timestamp = formatter._timestamp
+    formatter._timestamp = lambda created: (encodes.append(created), timestamp(created))[1]
+
+    class Capture(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.lines = []
+            self.threads = set()
+
+        def emit(self, record):
+            self.threads.add(threading.current_thread())
+            self.lines.append(self.format(record))
+
+    stream = io.StringIO()
+    console, capture = logging.StreamHandler(stream), Capture()
+    for handler in (console, capture):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger("test_milestone10.queued_logging")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    listener = QueueListener(log_queue, console, capture, respect_handler_level=True)
+    listener.start()
+    try:
+        args = {"round": 1}
+        logger.info("state %s", args)
+        args["round"] = 2  # merged when enqueued, not when the listener formats
+        try:
+            raise ValueError("bad delta")
+        except ValueError:
+            logger.exception("aggregation failed")
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+
+    assert capture.threads and threading.current_thread() not in capture.threads
+    first, second = (json.loads(line) for line in capture.lines)
+    assert first["message"] == "state {'round': 1}"
+    assert second["message"] == "aggregation failed"
+    assert "ValueError: bad delta" in second["exception"]
+    # Each record is encoded once; the second handler reuses the string.
+    assert stream.getvalue().splitlines() == capture.lines
+    assert len(encodes) == 2
+
+
+def test_v2_node_register_uses_the_locked_legacy_registration(coordinator):
+    import uuid
+
+    from fastapi.testclient import TestClient
+
+    client = TestClient(coordinator.app)
+    name = f"n{uuid.uuid4().hex[:10]}"
+    r = client.post("/v2/node/register", json={"client_name": name})
+    assert r.status_code == 200, r.text
+    # Same bookkeeping as /client/register (the v2 route has no copy of its own).
+    assert name in coordinator.round_manager.clients
+    assert name in coordinator.metrics_collector.total_clients_seen
+    assert coordinator.auth_manager.validate_api_key(r.json()["api_key"], name)
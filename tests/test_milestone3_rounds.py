@@ -100,6 +100,32 @@ def test_idempotent_aggregate_returns_same_version(coord_path, tmp_path):
     assert second["aggregated_model"]["version"] == version
 
 
+def test_aggregate_rejects_updates_from_different_base_weights(coord_path, tmp_path):
+    from core.aggregator import Aggregator
+    from core.model_store import ModelStore
+    from core.round_manager import RoundManager, RoundState
+    from core.state_store import StateStore
+    from persistence.json_repos import JsonRoundRepository
+
+    store = StateStore(path=str(tmp_path / "state.json"))
+    rm = RoundManager(
+        state_store=store,
+        round_repo=JsonRoundRepository(rounds_path=str(tmp_path / "rounds.json")),
+    )
+    agg = Aggregator(rm, model_store=ModelStore(models_dir=str(tmp_path / "models")), state_store=store)
+
+    for cid in ("c1", "c2", "c3"):
+        rm.register_client(cid)
+        rid = rm.assign_client_to_round(cid, "v1")
+    base = [[1.0, 2.0], [3.0]]
+    assert agg.submit_update("c1", rid, _payload("c1", [[0.1, 0.1], [0.1]], base=base))
+    assert agg.submit_update("c2", rid, _payload("c2", [[0.2, 0.2], [0.2]], base=base))
+    assert agg.submit_update("c3", rid, _payload("c3", [[0.3, 0.3], [0.3]], base=[[9.0, 2.0], [3.0]]))
+
+    assert agg.aggregate(rid) is None
+    assert rm.rounds[rid].state == RoundState.COLLECTING
+
+
 def test_restart_mid_aggregate_reconciles(coord_path, tmp_path):
     from core.aggregator import Aggregator
     from core.model_store import ModelStore